@@ -3,27 +3,107 @@
 import asyncio
 import logging
 import json
+import os
+import threading
+import time
 
 from datetime import timedelta
 from . import options_flow
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import (
+    ConfigEntryNotReady,
+    HomeAssistantError,
+    ServiceValidationError,
+)
+from homeassistant.helpers import discovery
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from datetime import datetime
 
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, LOG_PREFIX, PLATFORMS, EXCLUDED_ARG_KEYS
-from uk_bin_collection.uk_bin_collection.collect_data import UKBinCollectionApp
-
-
+from .const import (
+    DOMAIN,
+    IMPORT_CONCURRENCY,
+    LOG_PREFIX,
+    MANUAL_REFRESH_CONCURRENCY,
+    PLATFORMS,
+    EVENT_SCHEDULE_CHANGED,
+    EXCLUDED_ARG_KEYS,
+    HOT_APPLY_OPTIONS,
+    HUB,
+    MAX_REFRESH_STRETCH,
+    OUTCOME_FAILED,
+    OUTCOME_PROJECTED,
+    OUTCOME_STALE,
+    PROFILE_DIR,
+    PROJECTION_HORIZON,
+    REFRESH_ON_READ_RETRY,
+    REMINDERS,
+    SEED_MAX_AGE,
+    SIGNAL_ICON_COLOR_MAPPING_UPDATED,
+)
+from .address_group import AddressGroup
+from .bulk_import import async_import_addresses, read_import_file
+from .feed import BinCollectionFeedView
+from .hub import RefreshHub, async_get_hub, scrape_host
+from .inference import ScheduleInference
+from .metrics import BinCollectionMetricsView, FetchStats
+from .profiling import RefreshProfile
+from .reminders import async_get_reminders, parse_reminders
+from .tracing import TraceBuffer, chrome_trace
+from .utils import (
+    address_configs,
+    data_hash,
+    diff_schedules,
+    entry_coordinators,
+    get_entry_config,
+    pop_seed,
+    store_seed,
+)
+from .websocket_api import async_register_commands
+from uk_bin_collection.uk_bin_collection.collect_data import (
+    UKBinCollectionApp,
+    import_council_module,
+)
+
+
+import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
 
 PLATFORM_SCHEMA = cv.platform_only_config_schema
 
+# The selector bounds in services.yaml only apply in the UI
+MAX_PARALLEL = vol.All(vol.Coerce(int), vol.Range(min=1, max=20))
+
+MANUAL_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id"): vol.Any(cv.string, [cv.string]),
+        vol.Optional("council"): vol.Any(cv.string, [cv.string]),
+        vol.Optional("max_parallel", default=MANUAL_REFRESH_CONCURRENCY): MAX_PARALLEL,
+    }
+)
+
+# Rows are checked one by one so that each is reported on
+IMPORT_ADDRESSES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("file"): cv.string,
+        vol.Optional("addresses"): cv.ensure_list,
+        vol.Optional("max_parallel", default=IMPORT_CONCURRENCY): MAX_PARALLEL,
+        vol.Optional("dry_run", default=False): cv.boolean,
+    }
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -36,48 +116,235 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             f"{LOG_PREFIX} hass.data[DOMAIN] initialised: {hass.data[DOMAIN]}"  
         )
 
-        async def handle_manual_refresh(call):
-            """Refresh all bin sensors for a given config entry."""
+        async def handle_manual_refresh(call: ServiceCall) -> dict:
+            """Refresh one, several or all config entries and report on each.
+
+            ``entry_id`` takes an id, a list of ids or "all"; ``council``
+            selects every entry of one or more councils. At most
+            ``max_parallel`` entries are refreshed at once, and an entry that
+            is already refreshing is waited for rather than refreshed again.
+            """
             _LOGGER.debug(
-                f"{LOG_PREFIX} manual_refresh service called with data: {call.data}"
+                "%s manual_refresh service called with data: %s", LOG_PREFIX, call.data
             )
-            entry_id = call.data.get("entry_id")
-
-            if not entry_id:
+            hub = async_get_hub(hass)
+            entry_ids = call.data.get("entry_id")
+            councils = call.data.get("council")
+
+            if entry_ids == "all":
+                entry_ids = hub.entry_ids
+            elif isinstance(entry_ids, str):
+                entry_ids = [entry_ids]
+            elif entry_ids is None and councils:
+                entry_ids = hub.entry_ids
+            if not entry_ids:
                 _LOGGER.error(
-                    "[UKBinCollection] No 'entry_id' was passed to uk_bin_collection.manual_refresh service."
+                    "%s No 'entry_id' or 'council' was passed to uk_bin_collection.manual_refresh service.",
+                    LOG_PREFIX,
                 )
-                return
+                return {"entries": {}}
+
+            entry_ids = list(dict.fromkeys(entry_ids))
+            if isinstance(councils, str):
+                councils = [councils]
+            if councils:
+                entry_ids = [
+                    entry_id
+                    for entry_id in entry_ids
+                    if getattr(hub.coordinator(entry_id), "council", None) in councils
+                ]
+
+            slots = asyncio.Semaphore(
+                call.data.get("max_parallel", MANUAL_REFRESH_CONCURRENCY)
+            )
 
-            if entry_id not in hass.data[DOMAIN]:
-                _LOGGER.error(
-                    "[UKBinCollection] No config entry found for entry_id: %s", entry_id
+            async def refresh(entry_id: str) -> dict:
+                coordinator = hub.coordinator(entry_id)
+                if coordinator is None:
+                    _LOGGER.error(
+                        "%s No config entry found for entry_id: %s", LOG_PREFIX, entry_id
+                    )
+                    return {"status": "not_found"}
+
+                async with slots:
+                    coalesced = coordinator.refresh_in_progress
+                    generation = coordinator.schedule_generation
+                    before = data_hash(coordinator.data)
+                    started = time.monotonic()
+                    await coordinator.async_refresh()
+                    return {
+                        "status": "success" if coordinator.last_update_success else "failed",
+                        "duration": round(time.monotonic() - started, 3),
+                        "coalesced": coalesced,
+                        "schedule_changed": (
+                            coordinator.schedule_generation != generation
+                            or data_hash(coordinator.data) != before
+                        ),
+                    }
+
+            results = await asyncio.gather(*(refresh(entry_id) for entry_id in entry_ids))
+            _LOGGER.debug("%s Manual refresh completed", LOG_PREFIX)
+            return {"entries": dict(zip(entry_ids, results))}
+
+        # Register a service named `uk_bin_collection.manual_refresh`
+        _LOGGER.debug("[UKBinCollection] Registering manual_refresh service")
+        hass.services.async_register(
+            DOMAIN,
+            "manual_refresh",
+            handle_manual_refresh,
+            schema=MANUAL_REFRESH_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        _LOGGER.debug(
+            "[UKBinCollection] manual_refresh service registered successfully"
+        )
+
+        async def handle_get_schedule(call: ServiceCall) -> dict:
+            """Return the full schedule held for a config entry."""
+            entry_id = call.data.get("entry_id")
+            coordinator = async_get_hub(hass).coordinator(entry_id) if entry_id else None
+            if coordinator is None:
+                raise ServiceValidationError(
+                    f"No UK Bin Collection entry found for entry_id: {entry_id}"
                 )
-                return
+            coordinator.async_note_read()
+            return coordinator.schedule_payload()
 
-            coordinator = hass.data[DOMAIN][entry_id].get("coordinator")
-            if not coordinator:
-                _LOGGER.error(
-                    "[UKBinCollection] Coordinator is missing for entry_id: %s",
-                    entry_id,
+        # The raw JSON sensor only carries a hash; the payload is fetched here
+        hass.services.async_register(
+            DOMAIN,
+            "get_schedule",
+            handle_get_schedule,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        async def handle_export_traces(call: ServiceCall) -> dict:
+            """Return recent refresh traces in Chrome trace format."""
+            hub = async_get_hub(hass)
+            entry_id = call.data.get("entry_id")
+            entry_ids = [entry_id] if entry_id else hub.entry_ids
+            sources = []
+            for eid in entry_ids:
+                coordinator = hub.coordinator(eid)
+                if coordinator is None:
+                    raise ServiceValidationError(
+                        f"No UK Bin Collection entry found for entry_id: {eid}"
+                    )
+                sources.append((eid, coordinator.name, coordinator.traces))
+            return chrome_trace(sources, event_loop_thread=threading.get_ident())
+
+        hass.services.async_register(
+            DOMAIN,
+            "export_traces",
+            handle_export_traces,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+        async def handle_profile_refresh(call: ServiceCall) -> dict:
+            """Run one refresh under the profiler and summarise it."""
+            entry_id = call.data.get("entry_id")
+            coordinator = async_get_hub(hass).coordinator(entry_id) if entry_id else None
+            if coordinator is None:
+                raise ServiceValidationError(
+                    f"No UK Bin Collection entry found for entry_id: {entry_id}"
+                )
+            if coordinator.profiling:
+                raise ServiceValidationError(
+                    f"A refresh of {coordinator.name} is already being profiled"
                 )
-                return
 
-            _LOGGER.debug(
-                "[UKBinCollection] About to request a manual refresh via coordinator"
+            started = dt_util.now()
+            profile = await coordinator.async_profile_refresh(
+                call.data.get("tracemalloc", False)
             )
-            await coordinator.async_request_refresh()
-            _LOGGER.debug("[UKBinCollection] Manual refresh completed")
+            if not profile.ran:
+                raise HomeAssistantError(
+                    f"The refresh of {coordinator.name} did not reach the scraper"
+                )
+
+            stats_file, collapsed_file = await hass.async_add_executor_job(
+                profile.write,
+                hass.config.path(PROFILE_DIR),
+                f"{entry_id}_{started.strftime('%Y%m%d_%H%M%S')}",
+            )
+            _LOGGER.info(
+                "%s Profile of %s written to %s", LOG_PREFIX, coordinator.name, stats_file
+            )
+            return {
+                "success": coordinator.last_update_success,
+                "duration": round((dt_util.now() - started).total_seconds(), 3),
+                "stats_file": stats_file,
+                "collapsed_file": collapsed_file,
+                **profile.summary(),
+            }
 
-        # Register a service named `uk_bin_collection.manual_refresh`
-        _LOGGER.debug("[UKBinCollection] Registering manual_refresh service")
         hass.services.async_register(
-            DOMAIN, "manual_refresh", handle_manual_refresh  # The service name
+            DOMAIN,
+            "profile_refresh",
+            handle_profile_refresh,
+            supports_response=SupportsResponse.ONLY,
         )
-        _LOGGER.debug(
-            "[UKBinCollection] manual_refresh service registered successfully"
+
+        async def handle_import_addresses(call: ServiceCall) -> dict:
+            """Add many addresses at once from a YAML or CSV file and inline rows.
+
+            ``file`` is relative to the configuration directory. Every row is
+            reported on; ``dry_run`` checks and scrapes without adding entries.
+            """
+            rows = list(call.data.get("addresses") or [])
+            path = call.data.get("file")
+            if path:
+                path = os.path.realpath(hass.config.path(path))
+                config_dir = os.path.realpath(hass.config.config_dir)
+                if os.path.commonpath([path, config_dir]) != config_dir and not (
+                    hass.config.is_allowed_path(path)
+                ):
+                    raise ServiceValidationError(f"{path} is not an allowed path")
+                try:
+                    rows.extend(await hass.async_add_executor_job(read_import_file, path))
+                except (OSError, ValueError) as err:
+                    raise ServiceValidationError(f"Could not read {path}: {err}") from err
+            if not rows:
+                raise ServiceValidationError("No addresses to import")
+
+            return {
+                "rows": await async_import_addresses(
+                    hass,
+                    rows,
+                    call.data.get("max_parallel", IMPORT_CONCURRENCY),
+                    call.data.get("dry_run", False),
+                )
+            }
+
+        hass.services.async_register(
+            DOMAIN,
+            "import_addresses",
+            handle_import_addresses,
+            schema=IMPORT_ADDRESSES_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+        # Serve every entry's collections as an iCalendar feed
+        hass.http.register_view(BinCollectionFeedView(hass))
+
+        # Expose refresh statistics to Prometheus
+        hass.http.register_view(BinCollectionMetricsView(hass))
+
+        # Bulk schedule reads and live schedule subscriptions for frontends
+        async_register_commands(hass)
+
+        # One sensor listing the next collections across every entry
+        hass.async_create_task(
+            discovery.async_load_platform(hass, "sensor", DOMAIN, {}, config)
         )
 
+        @callback
+        def handle_stop(event: Event) -> None:
+            """Stop scheduling refreshes and reminders once Home Assistant shuts down."""
+            async_shutdown_schedulers(hass)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, handle_stop)
+
         _LOGGER.info("[UKBinCollection] async_setup completed without errors.")
         return True
 
@@ -136,92 +403,132 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     )
 
     try:
-        name = config_entry.data.get("name")
+        config = get_entry_config(config_entry)
+        name = config.get("name")
         if not name:
             _LOGGER.error(f"{LOG_PREFIX} 'name' is missing in config entry.")
             raise ConfigEntryNotReady("Missing 'name' in configuration.")
 
-        timeout = config_entry.data.get("timeout", 60)
-        manual_refresh = config_entry.data.get("manual_refresh_only", False)
-        icon_color_mapping = config_entry.data.get("icon_color_mapping", "{}")
-        update_interval_hours = config_entry.data.get("update_interval", 12)
-
-        _LOGGER.debug(
-            f"{LOG_PREFIX} Retrieved configuration: "
-            f"name={name}, timeout={timeout}, "
-            f"manual_refresh_only={manual_refresh}, "
-            f"update_interval={update_interval_hours} hours, "
-            f"icon_color_mapping={icon_color_mapping}"
-        )
-
-        # Validate 'timeout'
-        try:
-            timeout = int(timeout)
-            if timeout < 10:
-                _LOGGER.warning(
-                    f"{LOG_PREFIX} Timeout value {timeout} is less than 10. Setting to 10 seconds."
-                )
-                timeout = 10
-        except (ValueError, TypeError):
-            _LOGGER.warning(
-                f"{LOG_PREFIX} Invalid timeout value: {timeout}. Using default 60 seconds."
+        timeout = config_timeout(config)
+        update_interval = config_update_interval(config)
+
+        # All entries share the integration-wide refresh hub
+        hub = async_get_hub(hass)
+
+        # A multi-address entry scrapes all of its addresses in one hub job
+        addresses = address_configs(config_entry.entry_id, config)
+        group = None
+        if config.get("addresses"):
+            group = AddressGroup(
+                hass,
+                hub,
+                config_entry.entry_id,
+                name,
+                scrape_host(next(iter(addresses.values()))),
+                timeout,
             )
-            timeout = 60
 
-        # Decide update interval based on manual_refresh
-        if manual_refresh:
-            try:
-                update_interval_hours = int(update_interval_hours)
-                if update_interval_hours < 1:
-                    update_interval_hours = 12
-            except (ValueError, TypeError):
-                update_interval_hours = 12
-            update_interval = timedelta(hours=update_interval_hours)
-            _LOGGER.info(
-                "%s Automatic refresh every %s hour(s).",
-                LOG_PREFIX,
-                update_interval_hours,
-            )
-        else:
-            update_interval = None
-            _LOGGER.info(
-                "%s Manual refresh only: no automatic updates scheduled.", LOG_PREFIX
+        coordinators = {}
+        address_args = {}
+        for address_id, address in addresses.items():
+            # Prepare arguments for UKBinCollectionApp
+            args = build_ukbcd_args(address)
+            _LOGGER.debug(f"{LOG_PREFIX} UKBinCollectionApp args: {args}")
+
+            # Initialise the UK Bin Collection Data application
+            ukbcd = UKBinCollectionApp()
+            ukbcd.set_args(args)
+
+            # Initialise the data coordinator
+            coordinators[address_id] = HouseholdBinCoordinator(
+                hass,
+                ukbcd,
+                address["name"],
+                timeout=timeout,
+                update_interval=update_interval,
+                hub=hub,
+                host=scrape_host(address),
+                entry_id=address_id,
+                council=args[0],
+                seed=pop_seed(hass, args, max_age=update_interval or SEED_MAX_AGE),
+                stale_after=config_refresh_on_read(config),
+                group=group,
             )
-
-        # Prepare arguments for UKBinCollectionApp
-        args = build_ukbcd_args(config_entry.data)
-        _LOGGER.debug(f"{LOG_PREFIX} UKBinCollectionApp args: {args}")
-
-        # Initialise the UK Bin Collection Data application
-        ukbcd = UKBinCollectionApp()
-        ukbcd.set_args(args)
-        _LOGGER.debug(f"{LOG_PREFIX} UKBinCollectionApp initialised and arguments set.") 
-
-        # Initialise the data coordinator
-        coordinator = HouseholdBinCoordinator(
-            hass,
-            ukbcd,
-            name,
-            timeout=timeout,
-            update_interval=update_interval,
-        )
+            address_args[address_id] = args
 
         _LOGGER.debug(
-            f"{LOG_PREFIX} HouseholdBinCoordinator initialised with update_interval={update_interval}."  
+            f"{LOG_PREFIX} {len(coordinators)} HouseholdBinCoordinator(s) initialised with update_interval={update_interval}."
         )
 
-        # Perform first refresh
-        await coordinator.async_config_entry_first_refresh()
+        # Perform first refresh; the platforms reuse its data rather than
+        # refreshing again, and a seed from the config flow or from before a
+        # reload with the same scrape arguments stands in for the scrape.
+        if group is None:
+            await coordinators[config_entry.entry_id].async_config_entry_first_refresh()
+        else:
+            group.members = list(coordinators.values())
+            await group.async_refresh()
+            failed = [
+                coordinator.name
+                for coordinator in group.members
+                if not coordinator.last_update_success
+            ]
+            if failed:
+                raise UpdateFailed(f"No data for {', '.join(failed)}")
         _LOGGER.info(
             f"{LOG_PREFIX} Initial data fetched successfully for entry_id={config_entry.entry_id}"
         )
 
-        # Store the coordinator in Home Assistant's data
-        hass.data[DOMAIN][config_entry.entry_id] = {"coordinator": coordinator}
+        # Store the coordinators in Home Assistant's data
+        entry_data = {
+            "coordinators": coordinators,
+            "address_args": address_args,
+            "config": config,
+        }
+        if group is None:
+            entry_data["coordinator"] = coordinators[config_entry.entry_id]
+        else:
+            entry_data["group"] = group
+        hass.data[DOMAIN][config_entry.entry_id] = entry_data
         _LOGGER.debug(
             f"{LOG_PREFIX} Coordinator stored in hass.data under entry_id={config_entry.entry_id}"
         )
 
+        # Hand scheduling of further refreshes to the hub; the addresses of
+        # a multi-address entry are refreshed when the hub runs their group
+        reminders = config_reminders(config)
+        for address_id, coordinator in coordinators.items():
+            due = None
+            if group is None and coordinator.seeded and update_interval is not None:
+                due = coordinator.last_fetch + update_interval
+            hub.async_register(
+                address_id,
+                coordinator,
+                coordinator.host,
+                None if group is not None else update_interval,
+                due=due,
+            )
+            async_get_reminders(hass).async_track(address_id, coordinator, reminders)
+        if group is not None:
+            due = None
+            if update_interval is not None and all(
+                coordinator.seeded for coordinator in group.members
+            ):
+                due = group.last_fetch + update_interval
+            hub.async_register(
+                config_entry.entry_id,
+                group,
+                group.host,
+                update_interval,
+                due=due,
+                listed=False,
+            )
+
+        # Apply option changes in place where possible
+        config_entry.async_on_unload(
+            config_entry.add_update_listener(async_update_options)
+        )
+
         # Forward the setup to all platforms (sensor and calendar)
         _LOGGER.debug(f"{LOG_PREFIX} Forwarding setup to platforms: {PLATFORMS}")
         await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
@@ -242,6 +549,142 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         raise ConfigEntryNotReady from exc
 
 
+def config_timeout(config: dict) -> int:
+    """Return the scrape timeout in seconds configured for an entry."""
+    timeout = config.get("timeout", 60)
+    try:
+        timeout = int(timeout)
+        if timeout < 10:
+            _LOGGER.warning(
+                f"{LOG_PREFIX} Timeout value {timeout} is less than 10. Setting to 10 seconds."
+            )
+            timeout = 10
+    except (ValueError, TypeError):
+        _LOGGER.warning(
+            f"{LOG_PREFIX} Invalid timeout value: {timeout}. Using default 60 seconds."
+        )
+        timeout = 60
+    return timeout
+
+
+def config_update_interval(config: dict):
+    """Return the automatic refresh interval of an entry, or None if manual only."""
+    # 'manual_refresh_only' holds the "automatically refresh" checkbox
+    if not config.get("manual_refresh_only", False):
+        _LOGGER.info(
+            "%s Manual refresh only: no automatic updates scheduled.", LOG_PREFIX
+        )
+        return None
+
+    update_interval_hours = config.get("update_interval", 12)
+    try:
+        update_interval_hours = int(update_interval_hours)
+        if update_interval_hours < 1:
+            update_interval_hours = 12
+    except (ValueError, TypeError):
+        update_interval_hours = 12
+    _LOGGER.info(
+        "%s Automatic refresh every %s hour(s).",
+        LOG_PREFIX,
+        update_interval_hours,
+    )
+    return timedelta(hours=update_interval_hours)
+
+
+def config_refresh_on_read(config: dict):
+    """Return the age after which a read refreshes an entry, or None if off."""
+    try:
+        hours = int(config.get("refresh_on_read", 0))
+    except (ValueError, TypeError):
+        hours = 0
+    return timedelta(hours=hours) if hours > 0 else None
+
+
+def config_reminders(config: dict) -> list:
+    """Return the entry's collection reminders, ignoring an invalid option."""
+    try:
+        return parse_reminders(config.get("reminders", ""))
+    except ValueError as exc:
+        _LOGGER.warning("%s %s; no reminders scheduled.", LOG_PREFIX, exc)
+        return []
+
+
+async def async_update_options(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Apply changed options, reloading only when the scrape itself changes.
+
+    The icon and colour mapping, reminders, refresh interval and timeout and
+    the refresh-on-read age are applied to
+    the running entry. Any other change reloads it; a reload that leaves the
+    scrape arguments unchanged reuses the entry's data rather than scraping.
+    """
+    entry_data = hass.data[DOMAIN].get(config_entry.entry_id)
+    if entry_data is None:
+        return
+
+    old = entry_data["config"]
+    new = get_entry_config(config_entry)
+    changed = {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+    if not changed:
+        return
+
+    if changed - HOT_APPLY_OPTIONS:
+        _LOGGER.info(
+            "%s Reloading entry_id=%s for changed options: %s",
+            LOG_PREFIX,
+            config_entry.entry_id,
+            ", ".join(sorted(changed)),
+        )
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+
+    entry_data["config"] = new
+    coordinators = entry_coordinators(hass, config_entry.entry_id)
+    group = entry_data.get("group")
+
+    if "timeout" in changed:
+        for coordinator in coordinators.values():
+            coordinator.timeout = config_timeout(new)
+        if group is not None:
+            group.timeout = config_timeout(new)
+
+    if changed & {"manual_refresh_only", "update_interval"}:
+        interval = config_update_interval(new)
+        for coordinator in coordinators.values():
+            coordinator.refresh_interval = interval
+        # The hub schedules a multi-address entry as its group
+        scheduled = group if group is not None else coordinators[config_entry.entry_id]
+        delay = None
+        if interval is not None and scheduled.last_fetch is not None:
+            # Keep the next refresh relative to the data actually held
+            delay = max(
+                scheduled.last_fetch + interval - dt_util.utcnow(), timedelta(0)
+            )
+        async_get_hub(hass).async_reschedule(config_entry.entry_id, interval, delay)
+
+    for address_id, coordinator in coordinators.items():
+        if "refresh_on_read" in changed:
+            coordinator.stale_after = config_refresh_on_read(new)
+
+        if "reminders" in changed:
+            async_get_reminders(hass).async_track(
+                address_id, coordinator, config_reminders(new)
+            )
+
+    if "icon_color_mapping" in changed:
+        async_dispatcher_send(
+            hass,
+            SIGNAL_ICON_COLOR_MAPPING_UPDATED.format(config_entry.entry_id),
+            new.get("icon_color_mapping", "{}"),
+        )
+
+    _LOGGER.debug(
+        "%s Applied options to entry_id=%s without reloading: %s",
+        LOG_PREFIX,
+        config_entry.entry_id,
+        ", ".join(sorted(changed)),
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info(f"{LOG_PREFIX} Unloading config entry {config_entry.entry_id}")
@@ -263,7 +706,23 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
                 )
 
         if unload_ok:
-            hass.data[DOMAIN].pop(config_entry.entry_id, None)
+            hub = async_get_hub(hass)
+            hub.async_unregister(config_entry.entry_id)
+            entry_data = hass.data[DOMAIN].pop(config_entry.entry_id, None) or {}
+            coordinators = entry_data.get("coordinators") or {
+                config_entry.entry_id: entry_data.get("coordinator")
+            }
+            address_args = entry_data.get("address_args", {})
+            for address_id, coordinator in coordinators.items():
+                hub.async_unregister(address_id)
+                async_get_reminders(hass).async_untrack(address_id)
+
+                # Let a reload with unchanged scrape arguments reuse the data
+                args = address_args.get(address_id)
+                if args and coordinator.last_raw is not None:
+                    store_seed(hass, args, coordinator.last_raw, coordinator.last_fetch)
+            if not hub.entry_ids:
+                async_shutdown_schedulers(hass)
             _LOGGER.debug(
                 f"{LOG_PREFIX} Removed coordinator for entry_id={config_entry.entry_id}"
             )
@@ -281,6 +740,25 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Drop the data kept at unload for a reload of a removed entry."""
+    config = get_entry_config(config_entry)
+    for address in address_configs(config_entry.entry_id, config).values():
+        try:
+            pop_seed(hass, build_ukbcd_args(address))
+        except ConfigEntryNotReady:
+            pass
+
+
+@callback
+def async_shutdown_schedulers(hass: HomeAssistant) -> None:
+    """Cancel the timers of the integration-wide schedulers that exist."""
+    domain_data = hass.data.get(DOMAIN, {})
+    for key in (HUB, REMINDERS):
+        if key in domain_data:
+            domain_data[key].async_shutdown()
+
+
 def build_ukbcd_args(config_data: dict) -> list:
     """Build the argument list for UKBinCollectionApp from config data."""
     # Extract required values
@@ -328,87 +806,426 @@ class HouseholdBinCoordinator(DataUpdateCoordinator):
         name: str,
         timeout: int = 60,
         update_interval: timedelta = timedelta(hours=12),
+        hub: RefreshHub = None,
+        host: str = "",
+        entry_id: str = None,
+        council: str = "",
+        seed: tuple = None,
+        stale_after: timedelta = None,
+        group: AddressGroup = None,
     ) -> None:
-        """Initialise the data coordinator.""" 
+        """Initialise the data coordinator.
+
+        When a hub is given it owns the refresh timer, so the coordinator
+        does not schedule its own updates. ``seed`` is a ``(raw, fetched_at)``
+        scrape made for the same arguments by the config flow or before a
+        reload; the first refresh uses it instead of scraping again. With
+        ``stale_after``, reading data older than that starts a refresh. The
+        addresses of a multi-address entry share a ``group`` that scrapes
+        them all in one hub job.
+        """
         super().__init__(
             hass,
             _LOGGER,
             name="UK Bin Collection Data",
-            update_interval=update_interval,
+            update_interval=None if hub is not None else update_interval,
         )
         self.ukbcd = ukbcd
         self.name = name
         self.timeout = timeout
+        self.hub = hub
+        self.host = host
+        self.entry_id = entry_id
+        self.council = council
+        self.refresh_interval = update_interval
+        self.stale_after = stale_after
+        self.group = group
 
         self._last_good_data = {}
 
+        # Every upcoming scraped date per bin type, the projected dates that
+        # extend them, and the bin types whose next date is projected.
+        # schedule_generation changes whenever either set of dates does.
+        self.schedule = {}
+        self.projected_dates = {}
+        self.projected = set()
+        self.schedule_generation = 0
+        self.inference = ScheduleInference()
+        self.refresh_stretch = 1
+        self.last_fetch = None
+        self.stats = FetchStats()
+        self.traces = TraceBuffer()
+        self._trace = None
+        self._profile = None
+        self._refreshing = None
+        self._read_refresh = None
+        self._read_refresh_at = None
+        self._seed = seed
+        self.seeded = False
+        self.last_raw = None
+
         _LOGGER.debug(
             f"{LOG_PREFIX} HouseholdBinCoordinator __init__: name={name}, timeout={timeout}, update_interval={update_interval}"
         )
 
     async def _async_update_data(self) -> dict:
         """Fetch and process the latest bin collection data."""
-        _LOGGER.debug(f"{LOG_PREFIX} _async_update_data called.")
         _LOGGER.info(
-            f"{LOG_PREFIX} Fetching latest bin collection data with timeout={self.timeout}"
+            "%s Fetching latest bin collection data with timeout=%s",
+            LOG_PREFIX,
+            self.timeout,
         )
 
+        trace = self._trace = self.traces.start()
+        with trace.span("update data"):
+            return await self._async_update_traced(trace)
+
+    async def _async_update_traced(self, trace) -> dict:
+        """Run one refresh, recording each phase as a span of ``trace``."""
         try:
-            data = await asyncio.wait_for(
-                self.hass.async_add_executor_job(self.ukbcd.run),
-                timeout=self.timeout,
-            )
-            _LOGGER.debug(f"{LOG_PREFIX} Raw data fetched from ukbcd.run(): {data}")
+            seed, self._seed = self._seed, None
+            if seed is not None:
+                data, fetched_at = seed
+                self.seeded = True
+                seeded_at = time.perf_counter()
+                trace.add("seed", seeded_at, seeded_at)
+            else:
+                data = await self._async_scrape(trace)
+                fetched_at = None
 
-            parsed_data = json.loads(data)
-            _LOGGER.debug(f"{LOG_PREFIX} JSON parsed data: {parsed_data}")
+            with trace.span("json parse", size=len(data)):
+                parsed_data = json.loads(data)
 
-            processed_data = self.process_bin_data(parsed_data)
+            with trace.span("process bin data") as span:
+                schedule = self.process_bin_schedule(parsed_data)
+                processed_data = self.next_collections(schedule)
+                span["bin_types"] = len(schedule)
 
             if not processed_data:
                 _LOGGER.warning(
-                    f"{LOG_PREFIX} No bin data found. Using last known good data."
+                    "%s No bin data found. Using last known good data.", LOG_PREFIX
                 )
                 if self._last_good_data:
+                    self.stats.record_cache_hit(OUTCOME_STALE)
                     return self._last_good_data
                 else:
-                    _LOGGER.warning(f"{LOG_PREFIX} No previous data to fall back to.")
+                    _LOGGER.warning("%s No previous data to fall back to.", LOG_PREFIX)
                     return {}
 
+            with trace.span("learn schedule"):
+                self._learn_schedule(schedule)
             self._last_good_data = processed_data
-            _LOGGER.debug(f"{LOG_PREFIX} Processed data: {processed_data}")
+            self.last_raw = data
+            if fetched_at is not None:
+                # Not a fetch: keep it out of the success rate
+                self.last_fetch = fetched_at
+                self.stats.record_seed(fetched_at)
+            else:
+                self.last_fetch = dt_util.utcnow()
+                self.stats.record_success(self.last_fetch)
+            _LOGGER.debug("%s Processed data: %s", LOG_PREFIX, processed_data)
 
-            _LOGGER.info(f"{LOG_PREFIX} Bin collection data updated successfully.")
+            _LOGGER.info("%s Bin collection data updated successfully.", LOG_PREFIX)
             return processed_data
 
         except asyncio.TimeoutError as exc:
-            _LOGGER.error(f"{LOG_PREFIX} Timeout while updating data: {exc}")
-            raise UpdateFailed(f"Timeout while updating data: {exc}") from exc
+            _LOGGER.error("%s Timeout while updating data: %s", LOG_PREFIX, exc)
+            return self._project_or_raise(f"Timeout while updating data: {exc}", exc)
         except json.JSONDecodeError as exc:
-            _LOGGER.error(f"{LOG_PREFIX} JSON decode error: {exc}")
-            raise UpdateFailed(f"JSON decode error: {exc}") from exc
+            _LOGGER.error("%s JSON decode error: %s", LOG_PREFIX, exc)
+            return self._project_or_raise(f"JSON decode error: {exc}", exc)
         except Exception as exc:
-            _LOGGER.exception(f"{LOG_PREFIX} Unexpected error: {exc}")
-            raise UpdateFailed(f"Unexpected error: {exc}") from exc
+            _LOGGER.exception("%s Unexpected error: %s", LOG_PREFIX, exc)
+            return self._project_or_raise(f"Unexpected error: {exc}", exc)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities of new data, counting the state writes it causes."""
+        self.stats.entity_writes += len(self._listeners)
+        trace, self._trace = self._trace, None
+        if trace is None:
+            super().async_update_listeners()
+            return
+        with trace.span("entity writes", listeners=len(self._listeners)):
+            super().async_update_listeners()
+
+    @property
+    def refresh_in_progress(self) -> bool:
+        """Return True while a refresh is running."""
+        return self._refreshing is not None
+
+    @property
+    def has_seed(self) -> bool:
+        """Return True until the next refresh uses the seed instead of a scrape."""
+        return self._seed is not None
+
+    async def async_refresh(self) -> None:
+        """Refresh data, or wait for the refresh that is already running.
+
+        Manual, scheduled and debounced refreshes all come through here, so
+        overlapping requests share a single scrape.
+        """
+        refreshing = self._refreshing
+        if refreshing is not None:
+            await refreshing.wait()
+            return
+
+        refreshing = self._refreshing = asyncio.Event()
+        try:
+            await super().async_refresh()
+        finally:
+            self._refreshing = None
+            refreshing.set()
+
+    @callback
+    def async_note_read(self) -> None:
+        """Refresh in the background when the data read is older than stale_after.
+
+        Reads are calendar queries, schedule reads over the websocket API and
+        get_schedule, and the iCalendar feed. At most one such refresh runs at
+        a time; after one, reads wait REFRESH_ON_READ_RETRY before trying
+        again, and none start while the council's host is backing off.
+        """
+        if self.stale_after is None or self._read_refresh is not None:
+            return
+        now = dt_util.utcnow()
+        if self.last_fetch is not None and now - self.last_fetch < self.stale_after:
+            return
+        if (
+            self._read_refresh_at is not None
+            and now - self._read_refresh_at < REFRESH_ON_READ_RETRY
+        ):
+            return
+        if self.hub is not None:
+            backoff_until = self.hub.host_backoff_until(self.host)
+            if backoff_until is not None and backoff_until > now:
+                return
 
-    @staticmethod
-    def process_bin_data(data: dict) -> dict:
-        """Process raw data to determine the next collection dates."""
-        _LOGGER.debug(f"{LOG_PREFIX} process_bin_data called with data={data}")
+        _LOGGER.debug("%s Data of %s read while stale; refreshing", LOG_PREFIX, self.name)
+        self._read_refresh_at = now
+        self._read_refresh = self.hass.async_create_background_task(
+            self._async_refresh_on_read(), f"{DOMAIN}_refresh_on_read_{self.entry_id}"
+        )
 
-        current_date = dt_util.now().date()
-        next_collection_dates = {}
+    async def _async_refresh_on_read(self) -> None:
+        """Run the refresh started by a read of stale data."""
+        try:
+            await self.async_refresh()
+        finally:
+            self._read_refresh = None
+
+    @property
+    def profiling(self) -> bool:
+        """Return True while a profiled refresh is pending."""
+        return self._profile is not None
+
+    async def async_profile_refresh(self, trace_memory: bool = False) -> RefreshProfile:
+        """Refresh now with the scrape running under the profiler.
+
+        The profile is claimed by the next scrape to start, so refreshes
+        that are not profiled keep running exactly as before.
+        """
+        profile = self._profile = RefreshProfile(trace_memory)
+        try:
+            await self.async_refresh()
+        finally:
+            self._profile = None
+        return profile
+
+    def claim_scrape_job(self):
+        """Return the blocking scrape, under the profiler if a profile is pending."""
+        profile, self._profile = self._profile, None
+        if profile is not None:
+            return lambda: profile.runcall(self.ukbcd.run)
+        return self.ukbcd.run
+
+    async def _async_scrape(self, trace) -> str:
+        """Run the scraper in the executor and time it.
+
+        The time between asking for the scrape and the worker starting it
+        (waiting for a hub slot or an executor thread) is recorded as the
+        queue wait, separately from the scrape itself. On the worker the
+        council parser import is timed apart from the scrape, which covers
+        both the HTTP requests and any Selenium session. An address of a
+        multi-address entry is scraped by its group instead.
+        """
+        if self.group is not None:
+            return await self.group.async_scrape(self, trace)
+
+        started = {}
+        profile, self._profile = self._profile, None
+        args = getattr(self.ukbcd, "parsed_args", None)
+        module = getattr(args, "module", None)
+        scrape = "selenium scrape" if getattr(args, "web_driver", None) else "scrape"
+
+        def run() -> str:
+            started["at"] = time.monotonic()
+            trace.add("queue", requested_at, time.perf_counter())
+            if isinstance(module, str):
+                with trace.span("parser import", module=module):
+                    import_council_module(module)
+            with trace.span(scrape):
+                if profile is not None:
+                    return profile.runcall(self.ukbcd.run)
+                return self.ukbcd.run()
+
+        requested = time.monotonic()
+        requested_at = time.perf_counter()
+        try:
+            if self.hub is not None:
+                return await self.hub.async_run_job(self.host, run, self.timeout)
+            return await asyncio.wait_for(
+                self.hass.async_add_executor_job(run), timeout=self.timeout
+            )
+        finally:
+            finished = time.monotonic()
+            began = started.get("at", requested)
+            if "at" not in started:
+                trace.add("queue", requested_at, time.perf_counter(), timed_out=True)
+            self.stats.record_fetch(finished - began, began - requested)
+
+    def schedule_payload(self) -> dict:
+        """Return everything known about the schedule as JSON-ready data."""
+        return {
+            "name": self.name,
+            "hash": data_hash(self.data),
+            "last_fetch": self.last_fetch.isoformat() if self.last_fetch else None,
+            "next_collections": {
+                bin_type: day.isoformat() if day else None
+                for bin_type, day in (self.data or {}).items()
+            },
+            "schedule": {
+                bin_type: [day.isoformat() for day in dates]
+                for bin_type, dates in self.schedule.items()
+            },
+            "projected_dates": {
+                bin_type: [day.isoformat() for day in dates]
+                for bin_type, dates in self.projected_dates.items()
+            },
+            "projected": sorted(self.projected),
+        }
+
+    def _learn_schedule(self, schedule: dict) -> None:
+        """Feed a scraped schedule to the inference engine.
+
+        While each scrape keeps confirming the predicted dates the refresh
+        interval is stretched, up to MAX_REFRESH_STRETCH times the configured
+        interval; any surprise resets it.
+        """
+        today = dt_util.now().date()
+        if self.inference.matches(schedule, today):
+            self._set_refresh_stretch(min(self.refresh_stretch * 2, MAX_REFRESH_STRETCH))
+        else:
+            self._set_refresh_stretch(1)
+        self.inference.observe(schedule)
+
+        self.projected = set()
+        previous = self.schedule
+        self._publish_schedule(schedule, schedule.keys(), today)
+
+        # The first scrape of a setup has nothing to compare against
+        if self.last_fetch is None:
+            return
+        changes = diff_schedules(previous, self.schedule, today)
+        if changes:
+            _LOGGER.info(
+                "%s Collection schedule of %s changed: %s",
+                LOG_PREFIX,
+                self.name,
+                ", ".join(changes),
+            )
+            self.hass.bus.async_fire(
+                EVENT_SCHEDULE_CHANGED,
+                {
+                    "entry_id": self.entry_id,
+                    "name": self.name,
+                    "council": self.council,
+                    "changes": changes,
+                },
+            )
+
+    def _publish_schedule(self, known: dict, bin_types, today) -> None:
+        """Store upcoming known dates and extend each bin with projections."""
+        horizon = today + PROJECTION_HORIZON
+        upcoming = {}
+        projected_dates = {}
+        for bin_type in bin_types:
+            dates = [day for day in known.get(bin_type, []) if day >= today]
+            if dates:
+                upcoming[bin_type] = dates
+            start = dates[-1] + timedelta(days=1) if dates else today
+            extra = self.inference.project(bin_type, start, horizon)
+            if extra:
+                projected_dates[bin_type] = extra
+
+        if upcoming != self.schedule or projected_dates != self.projected_dates:
+            self.schedule_generation += 1
+        self.schedule = upcoming
+        self.projected_dates = projected_dates
+
+    def _project_or_raise(self, message: str, exc: Exception) -> dict:
+        """Serve known and projected dates after a failed scrape.
+
+        Raises UpdateFailed when there is nothing upcoming to serve.
+        """
+        self.stats.record_failure()
+        self._set_refresh_stretch(1)
+
+        today = dt_util.now().date()
+        bin_types = set(self.schedule) | set(self.inference.bin_types)
+        self._publish_schedule(self.schedule, bin_types, today)
+
+        data = {}
+        for bin_type in bin_types:
+            known = self.schedule.get(bin_type)
+            projected = self.projected_dates.get(bin_type)
+            if known:
+                data[bin_type] = known[0]
+            elif projected:
+                data[bin_type] = projected[0]
+
+        if not data:
+            self.stats.record_outcome(OUTCOME_FAILED)
+            raise UpdateFailed(message) from exc
+
+        self.stats.record_cache_hit(OUTCOME_PROJECTED)
+        self.projected = {
+            bin_type for bin_type in data if bin_type not in self.schedule
+        }
+        _LOGGER.warning(
+            "%s Scrape failed for %s; serving stored and projected dates (projected: %s)",
+            LOG_PREFIX,
+            self.name,
+            ", ".join(sorted(self.projected)) or "none",
+        )
+        return data
+
+    def _set_refresh_stretch(self, stretch: int) -> None:
+        """Record the refresh stretch and pass it on to the hub."""
+        if stretch == self.refresh_stretch:
+            return
+        self.refresh_stretch = stretch
+        _LOGGER.debug(
+            "%s Refresh interval for %s stretched x%s", LOG_PREFIX, self.name, stretch
+        )
+        if self.hub is not None and self.entry_id is not None:
+            self.hub.async_set_stretch(self.entry_id, stretch)
+
+    @staticmethod
+    def process_bin_schedule(data: dict) -> dict:
+        """Parse raw data into every collection date per bin type, sorted."""
+        schedule = {}
 
         bins = data.get("bins", [])
-        _LOGGER.debug(f"{LOG_PREFIX} Bins found: {bins}")
         for bin_data in bins:
             bin_type = bin_data.get("type")
             collection_date_str = bin_data.get("collectionDate")
-            _LOGGER.debug(f"{LOG_PREFIX} Processing bin_data={bin_data}")
 
             if not bin_type or not collection_date_str:
                 _LOGGER.warning(
-                    f"{LOG_PREFIX} Missing 'type' or 'collectionDate' in bin data: {bin_data}"
+                    "%s Missing 'type' or 'collectionDate' in bin data: %s",
+                    LOG_PREFIX,
+                    bin_data,
                 )
                 continue
 
@@ -418,20 +1235,34 @@ class HouseholdBinCoordinator(DataUpdateCoordinator):
                 ).date()
             except (ValueError, TypeError) as exc:
                 _LOGGER.warning(
-                    f"{LOG_PREFIX} Invalid date format '{collection_date_str}' for bin type '{bin_type}'. Error: {exc}"
+                    "%s Invalid date format '%s' for bin type '%s'. Error: %s",
+                    LOG_PREFIX,
+                    collection_date_str,
+                    bin_type,
+                    exc,
                 )
                 continue
 
-            existing_date = next_collection_dates.get(bin_type)
-            if collection_date >= current_date and (
-                not existing_date or collection_date < existing_date
-            ):
-                next_collection_dates[bin_type] = collection_date
-                _LOGGER.debug(
-                    f"{LOG_PREFIX} Updated next collection for '{bin_type}' to {collection_date}"
-                )
+            schedule.setdefault(bin_type, set()).add(collection_date)
+
+        return {bin_type: sorted(dates) for bin_type, dates in schedule.items()}
+
+    @staticmethod
+    def next_collections(schedule: dict) -> dict:
+        """Return the next collection date on or after today for each bin type."""
+        current_date = dt_util.now().date()
+        next_collection_dates = {}
+
+        for bin_type, dates in schedule.items():
+            upcoming = [day for day in dates if day >= current_date]
+            if upcoming:
+                next_collection_dates[bin_type] = upcoming[0]
 
-        _LOGGER.debug(
-            f"{LOG_PREFIX} Final next_collection_dates={next_collection_dates}"
-        )
         return next_collection_dates
+
+    @staticmethod
+    def process_bin_data(data: dict) -> dict:
+        """Process raw data to determine the next collection dates."""
+        return HouseholdBinCoordinator.next_collections(
+            HouseholdBinCoordinator.process_bin_schedule(data)
+        )
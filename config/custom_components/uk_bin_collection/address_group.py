@@ -0,0 +1,184 @@
+"""Multi-address entries for UK Bin Collection Data.
+
+An entry with an ``addresses`` list covers several addresses on one council.
+Each address keeps its own ``HouseholdBinCoordinator`` and entities, but
+their scrapes are made together by the entry's ``AddressGroup``: every
+address's ``ukbcd.run()`` runs one after another in a single
+``RefreshHub.async_run_job`` job, and each address gets its own result. N
+addresses therefore take one hub slot and one host slot per refresh instead
+of N scheduled jobs, and the website still sees one request at a time.
+
+Each run builds its own council parser, which opens its own HTTP requests
+or web driver and takes none from the caller, so the addresses do not share
+a session and each costs a full scrape.
+
+The hub schedules the group. A refresh of any one address, such as a manual
+refresh or a read of stale data, scrapes all of them too; the addresses that
+did not ask pick their result up in a refresh of their own. An address that
+still holds a seed is left out of the batch and refreshes from the seed.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN, LOG_PREFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+# Raw data or the error of one address, and when its scrape started and ended
+ScrapeResult = Tuple[Optional[str], Optional[Exception], float, float]
+
+
+def _run_timed(job: Callable[[], str]) -> ScrapeResult:
+    """Run one address's scrape and time it."""
+    started = time.perf_counter()
+    try:
+        return job(), None, started, time.perf_counter()
+    except Exception as err:
+        return None, err, started, time.perf_counter()
+
+
+class AddressGroup:
+    """Scrape every address of a multi-address entry in one hub job."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hub,
+        entry_id: str,
+        name: str,
+        host: str,
+        timeout: int,
+    ) -> None:
+        """Initialise the group; ``members`` are added once they exist."""
+        self.hass = hass
+        self.hub = hub
+        self.entry_id = entry_id
+        self.name = name
+        self.host = host
+        self.timeout = timeout
+        self.members: List[Any] = []
+        self._results: Dict[str, ScrapeResult] = {}
+        self._batch: Optional[asyncio.Task] = None
+        # Addresses refreshed from a seed during the current group refresh
+        self._seeded: Set[str] = set()
+
+    @property
+    def last_update_success(self) -> bool:
+        """Return True if any address refreshed successfully."""
+        return any(member.last_update_success for member in self.members)
+
+    @property
+    def last_fetch(self) -> Optional[datetime]:
+        """Return when the oldest address data was fetched, if all have data."""
+        fetched = [member.last_fetch for member in self.members]
+        if not fetched or None in fetched:
+            return None
+        return min(fetched)
+
+    async def async_refresh(self) -> None:
+        """Refresh every address, sharing one batch scrape.
+
+        Addresses holding a seed refresh from it first, and the batch the
+        others start leaves them out.
+        """
+        seeded = [member for member in self.members if member.has_seed]
+        others = [member for member in self.members if not member.has_seed]
+        try:
+            await asyncio.gather(*(member.async_refresh() for member in seeded))
+            self._seeded = {member.entry_id for member in seeded}
+            await asyncio.gather(*(member.async_refresh() for member in others))
+        finally:
+            self._seeded = set()
+        # Only as stretched as the least predictable address allows
+        if self.members:
+            self.hub.async_set_stretch(
+                self.entry_id, min(member.refresh_stretch for member in self.members)
+            )
+
+    async def async_scrape(self, member, trace) -> str:
+        """Return the raw data of ``member``, scraping every address if needed.
+
+        A result left by a batch that another address started is used as
+        is; otherwise this address starts a batch, or joins the running one.
+        """
+        requested_at = time.perf_counter()
+        result = self._results.pop(member.entry_id, None)
+        waited = result is None
+        if waited:
+            if self._batch is None:
+                self._batch = self.hass.async_create_background_task(
+                    self._async_run_batch(), f"{DOMAIN}_address_batch_{self.entry_id}"
+                )
+            await asyncio.shield(self._batch)
+            result = self._results.pop(member.entry_id, None)
+            if result is None:
+                raise HomeAssistantError(f"{member.name} was not scraped")
+
+        raw, error, started, finished = result
+        queue_wait = max(started - requested_at, 0) if waited else 0
+        if waited:
+            trace.add("queue", requested_at, max(started, requested_at))
+        trace.add("batch scrape", started, finished, addresses=len(self.members))
+        member.stats.record_fetch(finished - started, queue_wait)
+        if error is not None:
+            raise error
+        return raw
+
+    async def _async_run_batch(self) -> None:
+        """Scrape every address in one hub job and keep each result.
+
+        Addresses whose seed from setup or import is still unused are left
+        out, so the seed is not thrown away by a scrape.
+        """
+        try:
+            jobs = {
+                member.entry_id: member.claim_scrape_job()
+                for member in self.members
+                if not member.has_seed and member.entry_id not in self._seeded
+            }
+            results: Dict[str, ScrapeResult] = {}
+
+            def run_batch() -> None:
+                for address_id, job in jobs.items():
+                    results[address_id] = _run_timed(job)
+                # Only a batch in which every address failed counts against the host
+                errors = [result[1] for result in results.values()]
+                if errors and all(error is not None for error in errors):
+                    raise errors[0]
+
+            try:
+                await self.hub.async_run_job(
+                    self.host, run_batch, self.timeout * max(len(jobs), 1)
+                )
+            except Exception as err:
+                # The batch timed out or every address failed
+                now = time.perf_counter()
+                batch = dict(results)
+                for address_id in jobs:
+                    batch.setdefault(address_id, (None, err, now, now))
+            else:
+                batch = results
+            self._results.update(batch)
+            _LOGGER.debug(
+                "%s Scraped %d addresses of %s in one job, %d failed",
+                LOG_PREFIX,
+                len(batch),
+                self.name,
+                sum(result[1] is not None for result in batch.values()),
+            )
+        finally:
+            self._batch = None
+
+        # Addresses that did not ask pick their result up in a refresh of their own
+        for member in self.members:
+            if member.entry_id in self._results and not member.refresh_in_progress:
+                self.hass.async_create_background_task(
+                    member.async_refresh(), f"{DOMAIN}_address_refresh_{member.entry_id}"
+                )
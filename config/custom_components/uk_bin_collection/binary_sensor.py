@@ -0,0 +1,220 @@
+"""Binary sensor platform for UK Bin Collection Data.
+
+"Collection today" and "collection tomorrow" sensors per bin and per entry.
+Their state only depends on the coordinator's schedule and the local date,
+so they are recomputed after a refresh, at local midnight, from a single
+tick shared by every entity of the integration, and when the reminder
+scheduler fires one of their address's reminders. They only write state
+when their value actually changes.
+"""
+
+import logging
+from abc import abstractmethod
+from datetime import date, timedelta
+from typing import List, Tuple
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+from homeassistant.util import dt as dt_util
+
+from .calendar import collection_dates
+from .const import DOMAIN, LOG_PREFIX, SIGNAL_REMINDER_FIRED
+from .lifecycle import BinEntityTracker
+from .utils import (
+    async_track_day_change,
+    entry_coordinators,
+    entry_device_info,
+    get_entry_config,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Name suffix and days from today of each kind of binary sensor
+WHEN = (("Today", 0), ("Tomorrow", 1))
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the UK Bin Collection binary sensor platform."""
+    _LOGGER.info(f"{LOG_PREFIX} Setting up UK Bin Collection binary sensor platform.")
+
+    compact = get_entry_config(config_entry).get("compact_entities", False)
+
+    # One coordinator per address; a multi-address entry has several
+    entities = []
+    for entry_id, coordinator in entry_coordinators(
+        hass, config_entry.entry_id
+    ).items():
+        entities.extend(
+            UKBinCollectionEntryBinarySensor(coordinator, entry_id, label, offset)
+            for label, offset in WHEN
+        )
+
+        # Compact mode keeps only the sensors covering the whole entry
+        if not compact:
+
+            def bin_binary_sensors(
+                bin_type: str, coordinator=coordinator, entry_id=entry_id
+            ) -> list:
+                return [
+                    UKBinCollectionBinBinarySensor(
+                        coordinator, entry_id, bin_type, label, offset
+                    )
+                    for label, offset in WHEN
+                ]
+
+            tracker = BinEntityTracker(
+                hass, coordinator, entry_id, async_add_entities, bin_binary_sensors
+            )
+            entities.extend(tracker.create(coordinator.data))
+            config_entry.async_on_unload(tracker.async_start())
+
+    async_add_entities(entities)
+
+
+class _CollectionBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Base for sensors that are on when a collection falls on a given day."""
+
+    _attr_icon = "mdi:delete-clock"
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry_id: str,
+        label: str,
+        offset: int,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+        self._label = label
+        self._offset = offset
+        self._value: Tuple[bool, List[str]] = self._compute()
+
+    @abstractmethod
+    def _bin_types(self) -> List[str]:
+        """Return the bin types this sensor covers."""
+
+    def _compute(self) -> Tuple[bool, List[str]]:
+        """Return whether any covered bin is collected on the day, and which."""
+        day: date = dt_util.now().date() + timedelta(days=self._offset)
+        collected = [
+            bin_type
+            for bin_type in self._bin_types()
+            if any(
+                collection == day
+                for collection, _ in collection_dates(self.coordinator, bin_type)
+            )
+        ]
+        return bool(collected), collected
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if a collection falls on the day."""
+        return self._value[0]
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the bins collected on the day."""
+        return {"bin_types": self._value[1]}
+
+    async def async_added_to_hass(self) -> None:
+        """Also recompute at local midnight and at the address's reminder times."""
+        await super().async_added_to_hass()
+        self.async_on_remove(async_track_day_change(self.hass, self._async_recompute))
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_REMINDER_FIRED.format(self._entry_id),
+                self._async_recompute,
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute after a refresh."""
+        self._async_recompute()
+
+    @callback
+    def _async_recompute(self) -> None:
+        """Write state only if the value changed."""
+        value = self._compute()
+        if value == self._value:
+            return
+        self._value = value
+        self.async_write_ha_state()
+
+
+class UKBinCollectionBinBinarySensor(_CollectionBinarySensor):
+    """On when one bin is collected today, or tomorrow."""
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry_id: str,
+        bin_type: str,
+        label: str,
+        offset: int,
+    ) -> None:
+        """Initialize the per-bin binary sensor."""
+        self._bin_type = bin_type
+        self._device_id = f"{entry_id}_{bin_type}"
+        super().__init__(coordinator, entry_id, label, offset)
+        self._attr_unique_id = f"{self._device_id}_collection_{label.lower()}"
+
+    def _bin_types(self) -> List[str]:
+        return [self._bin_type] if self._bin_type in (self.coordinator.data or {}) else []
+
+    @property
+    def name(self) -> str:
+        """Return the name of the binary sensor."""
+        return f"{self.coordinator.name} {self._bin_type} Collection {self._label}"
+
+    @property
+    def device_info(self) -> dict:
+        """Share the device of the bin's sensors."""
+        return {
+            "identifiers": {(DOMAIN, self._device_id)},
+            "name": f"{self.coordinator.name} {self._bin_type}",
+            "manufacturer": "UK Bin Collection",
+            "model": "Bin Sensor",
+            "sw_version": "1.0",
+        }
+
+
+class UKBinCollectionEntryBinarySensor(_CollectionBinarySensor):
+    """On when any bin of the entry is collected today, or tomorrow."""
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry_id: str,
+        label: str,
+        offset: int,
+    ) -> None:
+        """Initialize the per-entry binary sensor."""
+        super().__init__(coordinator, entry_id, label, offset)
+        self._attr_unique_id = f"{entry_id}_collection_{label.lower()}"
+
+    def _bin_types(self) -> List[str]:
+        return sorted(self.coordinator.data or {})
+
+    @property
+    def name(self) -> str:
+        """Return the name of the binary sensor."""
+        return f"{self.coordinator.name} Collection {self._label}"
+
+    @property
+    def device_info(self) -> dict:
+        """Group with the entry's other entity-wide sensors."""
+        return entry_device_info(self.coordinator, self._entry_id)
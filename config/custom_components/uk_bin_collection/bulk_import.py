@@ -0,0 +1,345 @@
+"""Bulk import of addresses for UK Bin Collection Data.
+
+``uk_bin_collection.import_addresses`` takes rows of ``name, council,
+postcode, uprn, number, usrn, url, driver`` (plus the advanced options)
+from a YAML or CSV file, or inline. Every row is checked against the cached
+council list and the existing entries first; the rows that pass are then
+scraped with at most ``max_parallel`` scrapes at once, through the refresh
+hub so that its per-website limit and backoff apply, and each address the
+council website answers for becomes an entry whose first refresh reuses
+that scrape, so importing N addresses costs N scrapes rather than 2N.
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import voluptuous as vol
+import yaml
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN, IMPORT_CONCURRENCY, LOG_PREFIX
+from .hub import scrape_host
+from .reminders import is_valid_reminders
+from .utils import (
+    async_get_council_list,
+    async_validate_address,
+    is_valid_json,
+    prepare_config_data,
+    address_configs,
+    get_entry_config,
+    store_seed,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Row status reported by the import
+STATUS_CREATED = "created"
+STATUS_VALID = "valid"
+STATUS_INVALID = "invalid"
+STATUS_DUPLICATE = "duplicate"
+STATUS_FAILED = "failed"
+
+# Council fields a row must fill in when the council asks for them
+COUNCIL_FIELDS = {
+    "postcode": "postcode",
+    "uprn": "uprn",
+    "house_number": "number",
+    "usrn": "usrn",
+}
+
+# Entry data that together identify one address
+ADDRESS_FIELDS = ("council", "url", "postcode", "uprn", "number", "usrn")
+
+# Entry data each address of a multi-address entry has of its own
+GROUP_ADDRESS_FIELDS = ("name", "url", "postcode", "uprn", "number", "usrn")
+
+ROW_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): cv.string,
+        vol.Required("council"): cv.string,
+        vol.Optional("postcode"): cv.string,
+        vol.Optional("uprn"): cv.string,
+        vol.Optional("number"): cv.string,
+        vol.Optional("usrn"): cv.string,
+        vol.Optional("url"): cv.string,
+        vol.Optional("driver"): cv.string,
+        vol.Optional("group"): cv.string,
+        vol.Optional("headless", default=True): cv.boolean,
+        vol.Optional("local_browser", default=False): cv.boolean,
+        vol.Optional("automatically_refresh", default=True): cv.boolean,
+        vol.Optional("update_interval", default=12): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional("timeout", default=60): vol.All(
+            vol.Coerce(int), vol.Range(min=10)
+        ),
+        vol.Optional("icon_color_mapping", default=""): cv.string,
+        vol.Optional("reminders", default=""): cv.string,
+        vol.Optional("refresh_on_read", default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+    }
+)
+
+
+def read_import_file(path: str) -> List[dict]:
+    """Read the rows of a ``.csv``, ``.yaml`` or ``.yml`` import file.
+
+    A YAML file holds a list of rows, or a mapping with an ``addresses``
+    list. Empty CSV cells are left out so that defaults apply.
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix not in (".csv", ".yaml", ".yml"):
+        raise ValueError(f"Unsupported import file {path}; use .csv, .yaml or .yml")
+    with open(path, encoding="utf-8", newline="") as handle:
+        if suffix == ".csv":
+            return [
+                {
+                    key.strip(): value.strip()
+                    for key, value in row.items()
+                    if key and value and value.strip()
+                }
+                for row in csv.DictReader(handle)
+            ]
+        try:
+            rows = yaml.safe_load(handle) or []
+        except yaml.YAMLError as err:
+            raise ValueError(f"{path} is not valid YAML: {err}") from err
+    if isinstance(rows, dict):
+        rows = rows.get("addresses", [])
+    if not isinstance(rows, list):
+        raise ValueError(f"{path} does not hold a list of addresses")
+    return rows
+
+
+def _council_index(councils: Dict[str, dict]) -> Dict[str, str]:
+    """Map lower-cased council keys and wiki names to council keys."""
+    index = {}
+    for key, council in councils.items():
+        index[key.lower()] = key
+        index.setdefault(str(council.get("wiki_name", key)).lower(), key)
+    return index
+
+
+def check_row(
+    row: Any, councils: Dict[str, dict], index: Dict[str, str]
+) -> Tuple[Optional[dict], Optional[str]]:
+    """Return the entry data of one row, or why the row cannot be imported."""
+    if not isinstance(row, dict):
+        return None, "Row is not a mapping"
+    try:
+        row = ROW_SCHEMA(row)
+    except vol.Invalid as err:
+        return None, str(err)
+
+    council_key = index.get(row["council"].lower())
+    if council_key is None:
+        return None, f"Unknown council {row['council']}"
+    council = councils[council_key]
+
+    data = {
+        "name": row["name"],
+        "selected_council": council_key,
+        "council_list": councils,
+        "headless_mode": row["headless"],
+        "local_browser": row["local_browser"],
+        "automatically_refresh": row["automatically_refresh"],
+        "update_interval": row["update_interval"],
+        "timeout": row["timeout"],
+        "icon_color_mapping": row["icon_color_mapping"],
+        "reminders": row["reminders"],
+        "refresh_on_read": row["refresh_on_read"],
+    }
+    for council_field, row_field in COUNCIL_FIELDS.items():
+        if council_field not in council:
+            continue
+        if not row.get(row_field):
+            return None, f"{council_key} needs a {row_field}"
+        data[council_field] = row[row_field]
+
+    # Councils with a URL template need the address's own URL
+    override = council.get("wiki_command_url_override")
+    if override and override != council.get("url") and row.get("url", override) == override:
+        return None, f"{council_key} needs the address's own url"
+    if row.get("url"):
+        data["url"] = row["url"]
+
+    if council.get("web_driver"):
+        if not row.get("driver") and not row["local_browser"]:
+            return None, f"{council_key} needs a driver or local_browser"
+        if row.get("driver"):
+            data["web_driver"] = row["driver"]
+    if "original_parser" in council:
+        data["original_parser"] = council["original_parser"]
+
+    if row["icon_color_mapping"] and not is_valid_json(row["icon_color_mapping"]):
+        return None, "icon_color_mapping is not valid JSON"
+    if not is_valid_reminders(row["reminders"]):
+        return None, "reminders are not valid"
+
+    return prepare_config_data(data), None
+
+
+def duplicate_of(config: dict, entries: List[dict]) -> Optional[str]:
+    """Return the name of the entry with the same name or address, if any.
+
+    Every address of a multi-address entry, on either side, is compared.
+    """
+    names = {config.get("name")}
+    addresses = set()
+    for address in address_configs("", config).values():
+        names.add(address.get("name"))
+        addresses.add(tuple(address.get(field) for field in ADDRESS_FIELDS))
+    for data in entries:
+        if data.get("name") in names:
+            return data.get("name")
+        for address in address_configs("", data).values():
+            if address.get("name") in names or (
+                tuple(address.get(field) for field in ADDRESS_FIELDS) in addresses
+            ):
+                return data.get("name")
+    return None
+
+
+def group_entry(name: str, configs: List[dict]) -> dict:
+    """Return the data of a multi-address entry holding the ``configs``.
+
+    The first address's settings are shared by all of them.
+    """
+    shared = {
+        key: value
+        for key, value in configs[0].items()
+        if key not in GROUP_ADDRESS_FIELDS
+    }
+    return {
+        **shared,
+        "name": name,
+        "addresses": [
+            {field: config[field] for field in GROUP_ADDRESS_FIELDS if field in config}
+            for config in configs
+        ],
+    }
+
+
+async def async_import_addresses(
+    hass: HomeAssistant,
+    rows: List[Any],
+    max_parallel: int = IMPORT_CONCURRENCY,
+    dry_run: bool = False,
+) -> List[dict]:
+    """Check, scrape and add each row; return one report per row, in order."""
+    # Imported here: the coordinator lives in the package's __init__
+    from . import HouseholdBinCoordinator, build_ukbcd_args
+
+    councils = await async_get_council_list(hass)
+    index = _council_index(councils)
+    known = [
+        get_entry_config(entry) for entry in hass.config_entries.async_entries(DOMAIN)
+    ]
+
+    reports: List[dict] = []
+    pending: List[Tuple[dict, dict]] = []
+    groups: Dict[str, List[Tuple[dict, dict]]] = {}
+    for number, row in enumerate(rows, start=1):
+        report = {"row": number, "name": row.get("name") if isinstance(row, dict) else None}
+        reports.append(report)
+        if not councils:
+            report.update(status=STATUS_FAILED, error="The council list could not be fetched")
+            continue
+        config, error = check_row(row, councils, index)
+        if error is not None:
+            report.update(status=STATUS_INVALID, error=error)
+            continue
+        group = str(row.get("group") or "")
+        if group:
+            members = groups.get(group)
+            if members and members[0][1]["council"] != config["council"]:
+                report.update(
+                    status=STATUS_INVALID, error=f"Group {group} mixes councils"
+                )
+                continue
+            duplicate = None if members else duplicate_of({"name": group}, known)
+            if duplicate is not None:
+                report.update(status=STATUS_DUPLICATE, error=f"Duplicate of {duplicate}")
+                continue
+        duplicate = duplicate_of(config, known)
+        if duplicate is not None:
+            report.update(status=STATUS_DUPLICATE, error=f"Duplicate of {duplicate}")
+            continue
+        known.append(config)
+        pending.append((report, config))
+        if group:
+            if group not in groups:
+                known.append({"name": group})
+            report["group"] = group
+            groups.setdefault(group, []).append((report, config))
+
+    slots = asyncio.Semaphore(max_parallel)
+    scraped: Dict[int, str] = {}
+
+    async def add(config: dict, added: List[dict]) -> None:
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_IMPORT}, data=config
+        )
+        for report in added:
+            if result.get("type") == "create_entry":
+                report.update(status=STATUS_CREATED, entry_id=result["result"].entry_id)
+            else:
+                report.update(status=STATUS_DUPLICATE, error=result.get("reason"))
+
+    async def scrape(report: dict, config: dict) -> None:
+        args = build_ukbcd_args(config)
+        async with slots:
+            try:
+                raw = await async_validate_address(
+                    hass, args, config["timeout"], scrape_host(config)
+                )
+                collections = HouseholdBinCoordinator.process_bin_data(json.loads(raw))
+            except Exception as err:
+                _LOGGER.warning(
+                    "%s Import of %s failed: %s", LOG_PREFIX, config["name"], err
+                )
+                report.update(status=STATUS_FAILED, error=str(err) or type(err).__name__)
+                return
+        if not collections:
+            report.update(status=STATUS_FAILED, error="No collections found")
+            return
+        report["collections"] = len(collections)
+        if dry_run:
+            report["status"] = STATUS_VALID
+            return
+        if "group" in report:
+            # Added with the rest of its group once every row is scraped
+            scraped[report["row"]] = raw
+            return
+
+        store_seed(hass, args, raw)
+        await add(config, [report])
+
+    await asyncio.gather(*(scrape(report, config) for report, config in pending))
+
+    # Each group's scraped addresses become one multi-address entry
+    for group, members in groups.items():
+        members = [
+            (report, config) for report, config in members if report["row"] in scraped
+        ]
+        if not members:
+            continue
+        data = group_entry(group, [config for _, config in members])
+        for (report, _), address in zip(members, address_configs("", data).values()):
+            store_seed(hass, build_ukbcd_args(address), scraped[report["row"]])
+        await add(data, [report for report, _ in members])
+
+    _LOGGER.info(
+        "%s Imported %d of %d addresses",
+        LOG_PREFIX,
+        sum(report["status"] == STATUS_CREATED for report in reports),
+        len(reports),
+    )
+    return reports
@@ -1,24 +1,62 @@
 """Calendar platform support for UK Bin Collection Data."""
 
+import heapq
 import logging
 import uuid
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
 )
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, LOG_PREFIX
+from .const import (
+    DOMAIN,
+    LOG_PREFIX,
+    PROJECTED_EVENT_DESCRIPTION,
+    SIGNAL_COORDINATOR_REGISTERED,
+    SIGNAL_COORDINATOR_UNREGISTERED,
+)
+from .hub import async_get_hub
+from .lifecycle import BinEntityTracker
+from .utils import address_configs, entry_coordinators, get_entry_config
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def last_day(end_date: datetime) -> date:
+    """Return the last day of a range ending at the exclusive ``end_date``.
+
+    A range ending at midnight does not cover the day that starts then.
+    """
+    if end_date.time() == time.min:
+        return end_date.date() - timedelta(days=1)
+    return end_date.date()
+
+
+def collection_dates(
+    coordinator: DataUpdateCoordinator, bin_type: str
+) -> List[Tuple[date, bool]]:
+    """Return a bin's known and projected dates, sorted, flagged if projected."""
+    next_date = coordinator.data.get(bin_type)
+    projected = set(coordinator.projected_dates.get(bin_type, []))
+    known = set(coordinator.schedule.get(bin_type, []))
+    if next_date and next_date not in projected:
+        known.add(next_date)
+    projected -= known
+    return sorted(
+        [(day, False) for day in known] + [(day, True) for day in projected]
+    )
+
+
 class UKBinCollectionCalendar(CoordinatorEntity, CalendarEntity):
     """Calendar entity for UK Bin Collection Data."""
 
@@ -36,6 +74,12 @@ class UKBinCollectionCalendar(CoordinatorEntity, CalendarEntity):
         self._name = name
         self._attr_unique_id = unique_id
 
+        # Sorted collection dates and their events, rebuilt only when the
+        # coordinator publishes a new schedule generation.
+        self._index_key: Optional[Tuple[int, Optional[date]]] = None
+        self._index_dates: List[date] = []
+        self._index_events: List[CalendarEvent] = []
+
         # Optionally, set device_info if you have device grouping
         self._attr_device_info = {
             "identifiers": {(DOMAIN, unique_id)},
@@ -60,31 +104,47 @@ class UKBinCollectionCalendar(CoordinatorEntity, CalendarEntity):
             )
             return None
 
-        return self._create_calendar_event(collection_date)
+        dates, events = self._event_index()
+        position = bisect_left(dates, collection_date)
+        return events[position]
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> List[CalendarEvent]:
-        """Return all events within a specific time frame."""
-        events: List[CalendarEvent] = []
-        collection_date = self.coordinator.data.get(self._bin_type)
+        """Return all known and projected events within a specific time frame."""
+        self.coordinator.async_note_read()
+        dates, events = self._event_index()
 
-        if not collection_date:
-            return events
+        start = bisect_left(dates, start_date.date())
+        end = bisect_right(dates, last_day(end_date))
+        return events[start:end]
 
-        # The test expects comparison between date parts.
-        if start_date.date() <= collection_date <= end_date.date():
-            events.append(self._create_calendar_event(collection_date))
+    def _event_index(self) -> Tuple[List[date], List[CalendarEvent]]:
+        """Return the sorted dates and events, rebuilding them if stale."""
+        next_date = self.coordinator.data.get(self._bin_type)
+        key = (self.coordinator.schedule_generation, next_date)
+        if key == self._index_key:
+            return self._index_dates, self._index_events
 
-        return events
+        dates = collection_dates(self.coordinator, self._bin_type)
+        self._index_dates = [day for day, _ in dates]
+        self._index_events = [
+            self._create_calendar_event(day, projected=projected)
+            for day, projected in dates
+        ]
+        self._index_key = key
+        return self._index_dates, self._index_events
 
-    def _create_calendar_event(self, collection_date: datetime.date) -> CalendarEvent:
+    def _create_calendar_event(
+        self, collection_date: datetime.date, projected: bool = False
+    ) -> CalendarEvent:
         """Create a CalendarEvent for a given collection date."""
         return CalendarEvent(
             summary=f"{self._bin_type} Collection",
             start=collection_date,
             end=collection_date + timedelta(days=1),
             uid=f"{self.unique_id}_{collection_date.isoformat()}",
+            description=PROJECTED_EVENT_DESCRIPTION if projected else None,
         )
 
     @property
@@ -114,6 +174,254 @@ class UKBinCollectionCalendar(CoordinatorEntity, CalendarEntity):
         self.async_write_ha_state()
 
 
+class HouseholdEventIndex:
+    """Collection days of several coordinators merged into one sorted index.
+
+    Each source (a config entry) contributes ``{date: [(label, projected)]}``.
+    Updating a source only touches the days whose contribution changed, and
+    the combined event for a day is rebuilt lazily the next time it is read.
+    """
+
+    def __init__(self, unique_id: str) -> None:
+        """Initialise an empty index."""
+        self._unique_id = unique_id
+        self._sources: Dict[str, Dict[date, List[Tuple[str, bool]]]] = {}
+        self._order: List[str] = []
+        self._dates: List[date] = []
+        self._day_sources: Dict[date, int] = {}
+        self._events: Dict[date, CalendarEvent] = {}
+
+    @property
+    def source_ids(self) -> List[str]:
+        """Return the sources currently contributing to the index."""
+        return list(self._order)
+
+    def update_source(
+        self, source_id: str, bins: Dict[str, List[Tuple[date, bool]]], prefix: str = ""
+    ) -> bool:
+        """Replace one source's collections; return True if any day changed.
+
+        ``bins`` maps each bin type to its sorted ``(date, projected)`` list.
+        """
+        merged = heapq.merge(
+            *(
+                [(day, f"{prefix}{bin_type}", projected) for day, projected in dates]
+                for bin_type, dates in bins.items()
+            )
+        )
+        contribution: Dict[date, List[Tuple[str, bool]]] = {}
+        for day, label, projected in merged:
+            contribution.setdefault(day, []).append((label, projected))
+
+        previous = self._sources.get(source_id, {})
+        if source_id not in self._sources:
+            self._order.append(source_id)
+        self._sources[source_id] = contribution
+
+        changed = False
+        for day in previous.keys() - contribution.keys():
+            self._release_day(day)
+            changed = True
+        for day, labels in contribution.items():
+            old = previous.get(day)
+            if old is None:
+                self._claim_day(day)
+            elif old == labels:
+                continue
+            self._events.pop(day, None)
+            changed = True
+        return changed
+
+    def remove_source(self, source_id: str) -> bool:
+        """Drop one source's collections; return True if it had any."""
+        contribution = self._sources.pop(source_id, None)
+        if contribution is None:
+            return False
+        self._order.remove(source_id)
+        for day in contribution:
+            self._release_day(day)
+        return bool(contribution)
+
+    def _claim_day(self, day: date) -> None:
+        """Count one more source collecting on ``day``."""
+        count = self._day_sources.get(day, 0)
+        if not count:
+            insort(self._dates, day)
+        self._day_sources[day] = count + 1
+
+    def _release_day(self, day: date) -> None:
+        """Count one less source collecting on ``day``."""
+        self._events.pop(day, None)
+        count = self._day_sources[day] - 1
+        if count:
+            self._day_sources[day] = count
+            return
+        del self._day_sources[day]
+        del self._dates[bisect_left(self._dates, day)]
+
+    def _event(self, day: date) -> CalendarEvent:
+        """Return the combined event for ``day``, building it if needed."""
+        event = self._events.get(day)
+        if event is None:
+            labels = []
+            projected = []
+            for source_id in self._order:
+                for label, is_projected in self._sources[source_id].get(day, []):
+                    labels.append(label)
+                    if is_projected:
+                        projected.append(label)
+            description = None
+            if projected:
+                description = (
+                    f"{PROJECTED_EVENT_DESCRIPTION} ({', '.join(projected)})"
+                )
+            event = CalendarEvent(
+                summary=f"{', '.join(labels)} Collection",
+                start=day,
+                end=day + timedelta(days=1),
+                uid=f"{self._unique_id}_{day.isoformat()}",
+                description=description,
+            )
+            self._events[day] = event
+        return event
+
+    def events(self, start: date, end: date) -> List[CalendarEvent]:
+        """Return the combined events from ``start`` to ``end`` inclusive."""
+        first = bisect_left(self._dates, start)
+        last = bisect_right(self._dates, end)
+        return [self._event(day) for day in self._dates[first:last]]
+
+    def next_event(self, today: date) -> Optional[CalendarEvent]:
+        """Return the first combined event on or after ``today``."""
+        position = bisect_left(self._dates, today)
+        if position == len(self._dates):
+            return None
+        return self._event(self._dates[position])
+
+
+class UKBinCollectionHouseholdCalendar(CalendarEntity):
+    """One calendar combining every bin of one or more entries.
+
+    Same-day collections are shown as a single event, so a household
+    dashboard needs one calendar query instead of one per bin type.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        source_ids: List[str],
+        name: str,
+    ) -> None:
+        """Initialize the household calendar."""
+        self.hass = hass
+        self._entry_id = entry_id
+        self._source_ids = source_ids
+        self._name = name
+        self._attr_unique_id = calc_unique_household_calendar_id(entry_id)
+        self._index = HouseholdEventIndex(self._attr_unique_id)
+        self._coordinators: Dict[str, DataUpdateCoordinator] = {}
+        self._listeners: Dict[str, CALLBACK_TYPE] = {}
+
+    @property
+    def name(self) -> str:
+        """Return the name of the calendar."""
+        return self._name
+
+    @property
+    def event(self) -> Optional[CalendarEvent]:
+        """Return the next combined collection event."""
+        return self._index.next_event(dt_util.now().date())
+
+    @property
+    def available(self) -> bool:
+        """Return True while at least one source has collections."""
+        return bool(self._index.source_ids)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> List[CalendarEvent]:
+        """Return the combined events within a specific time frame."""
+        for coordinator in self._coordinators.values():
+            coordinator.async_note_read()
+        return self._index.events(start_date.date(), last_day(end_date))
+
+    async def async_added_to_hass(self) -> None:
+        """Attach to every source coordinator and follow entries coming and going."""
+        for source_id in self._source_ids:
+            self._attach(source_id)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_COORDINATOR_REGISTERED, self._async_source_registered
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_COORDINATOR_UNREGISTERED,
+                self._async_source_unregistered,
+            )
+        )
+        self.async_on_remove(self._detach_all)
+
+    def _attach(self, source_id: str) -> None:
+        """Start following the coordinator of ``source_id`` if it is loaded."""
+        coordinator = async_get_hub(self.hass).coordinator(source_id)
+        if coordinator is None or self._coordinators.get(source_id) is coordinator:
+            return
+        self._detach(source_id)
+        self._coordinators[source_id] = coordinator
+        self._listeners[source_id] = coordinator.async_add_listener(
+            lambda: self._async_source_updated(source_id)
+        )
+        self._index_source(source_id)
+
+    def _detach(self, source_id: str) -> None:
+        """Stop following ``source_id`` and drop its collections."""
+        unsubscribe = self._listeners.pop(source_id, None)
+        if unsubscribe is not None:
+            unsubscribe()
+        self._coordinators.pop(source_id, None)
+        self._index.remove_source(source_id)
+
+    @callback
+    def _detach_all(self) -> None:
+        """Stop following every source."""
+        for source_id in list(self._listeners):
+            self._detach(source_id)
+
+    def _index_source(self, source_id: str) -> bool:
+        """Re-index one source from its coordinator; return True if changed."""
+        coordinator = self._coordinators[source_id]
+        bins = {
+            bin_type: collection_dates(coordinator, bin_type)
+            for bin_type in coordinator.data or {}
+        }
+        # Label bins of other addresses so same-named bins stay distinguishable
+        prefix = "" if source_id == self._entry_id else f"{coordinator.name} "
+        return self._index.update_source(source_id, bins, prefix)
+
+    @callback
+    def _async_source_updated(self, source_id: str) -> None:
+        """Re-index a source after its coordinator refreshed."""
+        if source_id in self._coordinators and self._index_source(source_id):
+            self.async_write_ha_state()
+
+    @callback
+    def _async_source_registered(self, source_id: str) -> None:
+        """Pick up a source entry that was (re)loaded."""
+        if source_id in self._source_ids:
+            self._attach(source_id)
+            self.async_write_ha_state()
+
+    @callback
+    def _async_source_unregistered(self, source_id: str) -> None:
+        """Drop a source entry that was unloaded."""
+        if source_id in self._coordinators:
+            self._detach(source_id)
+            self.async_write_ha_state()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -122,27 +430,63 @@ async def async_setup_entry(
     """Set up UK Bin Collection Calendar from a config entry."""
     _LOGGER.info(f"{LOG_PREFIX} Setting up UK Bin Collection Calendar platform.")
 
-    # Retrieve the coordinator from hass.data
-    coordinator: DataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id][
-        "coordinator"
-    ]
+    # __init__ has already run the entry's one refresh for this setup
+    config = get_entry_config(config_entry)
+    compact = config.get("compact_entities", False)
 
-    # Wait for the first refresh. This will raise if the update fails.
-    await coordinator.async_config_entry_first_refresh()
+    # One coordinator per address; a multi-address entry has several
+    coordinators = entry_coordinators(hass, config_entry.entry_id)
 
-    # Create calendar entities only for bin types that have a valid date
+    # Bin types appearing or disappearing later are handled by the tracker
     entities = []
-    for bin_type, collection_date in coordinator.data.items():
-        if collection_date is None:
-            continue
-        unique_id = calc_unique_calendar_id(config_entry.entry_id, bin_type)
-        name = f"{coordinator.name} {bin_type} Calendar"
+    if not compact:
+        for address_id, coordinator in coordinators.items():
+
+            def bin_calendars(
+                bin_type: str, coordinator=coordinator, address_id=address_id
+            ) -> List[UKBinCollectionCalendar]:
+                # Only bin types that have a valid date get a calendar
+                if coordinator.data.get(bin_type) is None:
+                    return []
+                return [
+                    UKBinCollectionCalendar(
+                        coordinator=coordinator,
+                        bin_type=bin_type,
+                        unique_id=calc_unique_calendar_id(address_id, bin_type),
+                        name=f"{coordinator.name} {bin_type} Calendar",
+                    )
+                ]
+
+            tracker = BinEntityTracker(
+                hass, coordinator, address_id, async_add_entities, bin_calendars
+            )
+            entities.extend(tracker.create(coordinator.data))
+            config_entry.async_on_unload(tracker.async_start())
+
+    # Compact mode replaces the per-bin calendars with one for the entry
+    household = config.get("household_calendar", False)
+    if compact or household:
+        source_ids = list(coordinators)
+        if household:
+            for entry_id in config.get("household_entries", []):
+                if entry_id == config_entry.entry_id:
+                    continue
+                entry = hass.config_entries.async_get_entry(entry_id)
+                # Every address of another multi-address entry is a source
+                source_ids += (
+                    list(address_configs(entry_id, get_entry_config(entry)))
+                    if entry is not None
+                    else [entry_id]
+                )
+        # A multi-address entry's calendar is named after the entry
+        coordinator = coordinators.get(config_entry.entry_id)
+        name = coordinator.name if coordinator is not None else config.get("name")
         entities.append(
-            UKBinCollectionCalendar(
-                coordinator=coordinator,
-                bin_type=bin_type,
-                unique_id=unique_id,
-                name=name,
+            UKBinCollectionHouseholdCalendar(
+                hass,
+                config_entry.entry_id,
+                source_ids,
+                f"{name} Household Calendar" if household else f"{name} Calendar",
             )
         )
 
@@ -166,3 +510,8 @@ async def async_unload_entry(
 def calc_unique_calendar_id(entry_id: str, bin_type: str) -> str:
     """Calculate a unique ID for the calendar."""
     return f"{entry_id}_{bin_type}_calendar"
+
+
+def calc_unique_household_calendar_id(entry_id: str) -> str:
+    """Calculate a unique ID for the household calendar."""
+    return f"{entry_id}_household_calendar"
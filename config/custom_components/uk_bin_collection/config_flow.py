@@ -1,7 +1,15 @@
+import asyncio
+import json
+
 from homeassistant import config_entries
 from homeassistant.core import callback
+from . import HouseholdBinCoordinator, build_ukbcd_args
+from .bulk_import import duplicate_of
+from .const import DOMAIN
+from .hub import scrape_host
 from .initialisation import initialisation_data
 from .options_flow import UkBinCollectionOptionsFlowHandler
+from .reminders import is_valid_reminders
 
 import logging
 from .utils import (
@@ -10,8 +18,10 @@ from .utils import (
     build_selenium_schema,
     build_advanced_schema,
     async_entry_exists,
+    async_validate_address,
     is_valid_json,
     prepare_config_data,
+    store_seed,
     validate_selenium_config
 )
 
@@ -26,6 +36,9 @@ class BinCollectionConfigFlow(config_entries.ConfigFlow, domain="uk_bin_collecti
         """Initialise the config flow.""" 
         self.data = {}
         self._initialised = False 
+        self._validation = None
+        self._validation_args = None
+        self._validation_warned = False
 
     async def async_step_user(self, user_input=None):
         """Step 1: Select Council."""
@@ -134,6 +147,7 @@ class BinCollectionConfigFlow(config_entries.ConfigFlow, domain="uk_bin_collecti
 
                 # If this council does not require Selenium, skip to advanced
                 if not council_data.get("web_driver"):
+                    self._async_start_validation()
                     return await self.async_step_advanced()
                 return await self.async_step_selenium()
 
@@ -181,6 +195,7 @@ class BinCollectionConfigFlow(config_entries.ConfigFlow, domain="uk_bin_collecti
             can_proceed, error_code = await validate_selenium_config(user_input, self.data)
             
             if can_proceed:
+                self._async_start_validation()
                 return await self.async_step_advanced()
             elif error_code:
                 errors["base"] = error_code
@@ -203,10 +218,20 @@ class BinCollectionConfigFlow(config_entries.ConfigFlow, domain="uk_bin_collecti
             "automatically_refresh": self.data.get("automatically_refresh", True), 
             "update_interval": self.data.get("update_interval", 12),
             "timeout": self.data.get("timeout", 60),
-            "icon_color_mapping": self.data.get("icon_color_mapping", "")
+            "icon_color_mapping": self.data.get("icon_color_mapping", ""),
+            "household_calendar": self.data.get("household_calendar", False),
+            "household_entries": self.data.get("household_entries", []),
+            "compact_entities": self.data.get("compact_entities", False),
+            "diagnostic_sensors": self.data.get("diagnostic_sensors", False),
+            "reminders": self.data.get("reminders", ""),
+            "refresh_on_read": self.data.get("refresh_on_read", 0),
         }
 
-        schema = build_advanced_schema(defaults=advanced_defaults)
+        entry_choices = {
+            entry.entry_id: entry.title
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+        }
+        schema = build_advanced_schema(defaults=advanced_defaults, entry_choices=entry_choices)
 
         if user_input is not None:
             # Check if icon_color_mapping is valid JSON if provided
@@ -214,6 +239,18 @@ class BinCollectionConfigFlow(config_entries.ConfigFlow, domain="uk_bin_collecti
                 if not is_valid_json(user_input["icon_color_mapping"]):
                     errors["icon_color_mapping"] = "invalid_json"
                     _LOGGER.warning("Invalid JSON in icon_color_mapping field")
+            if not is_valid_reminders(user_input.get("reminders", "")):
+                errors["reminders"] = "invalid_reminders"
+
+            # A failed address check is reported once; submitting again
+            # adds the entry anyway, e.g. while the council site is down.
+            if not errors and self._validation is not None:
+                raw, error = await self._async_validation_result()
+                if error and not self._validation_warned:
+                    errors["base"] = error
+                    self._validation_warned = True
+                elif raw is not None:
+                    store_seed(self.hass, self._validation_args, raw)
             
             if not errors:
                 self.data.update(user_input)
@@ -233,8 +270,86 @@ class BinCollectionConfigFlow(config_entries.ConfigFlow, domain="uk_bin_collecti
         return self.async_show_form(
             step_id="advanced",
             data_schema=schema,
-            errors=errors
+            errors=errors,
+            description_placeholders={"validation_preview": self._validation_preview()},
+        )
+
+    async def async_step_import(self, import_data):
+        """Add an address checked and scraped by the import_addresses service."""
+        duplicate = duplicate_of(
+            import_data, [entry.data for entry in self._async_current_entries()]
+        )
+        if duplicate is not None:
+            _LOGGER.warning("Duplicate entry found: %s", duplicate)
+            return self.async_abort(reason="duplicate_entry")
+        return self.async_create_entry(title=import_data["name"], data=import_data)
+
+    @callback
+    def _async_start_validation(self):
+        """Start scraping the entered address while the remaining steps are filled in."""
+        if self._validation is not None:
+            self._validation.cancel()
+        self._validation = None
+        self._validation_warned = False
+        try:
+            config = prepare_config_data(self.data)
+            self._validation_args = build_ukbcd_args(config)
+        except Exception as e:
+            _LOGGER.debug(f"Address validation skipped: {e}")
+            return
+        # Through the hub, so the check waits for any scrape of the same
+        # council website and a failure counts towards its backoff
+        self._validation = self.hass.async_create_background_task(
+            async_validate_address(
+                self.hass,
+                self._validation_args,
+                self.data.get("timeout", 60),
+                scrape_host(config),
+            ),
+            f"{DOMAIN}_validate_address",
         )
+
+    async def _async_validation_result(self):
+        """Wait for the address check; return the raw data and any error code."""
+        try:
+            raw = await self._validation
+            if HouseholdBinCoordinator.process_bin_data(json.loads(raw)):
+                return raw, None
+            return None, "no_collections_found"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOGGER.warning("Address validation failed: %s", e)
+            return None, "address_validation_failed"
+
+    def _validation_preview(self):
+        """Describe the state of the address check for the advanced step."""
+        task = self._validation
+        if task is None:
+            return ""
+        if not task.done():
+            return "Checking the address with the council website..."
+        if task.cancelled() or task.exception() is not None:
+            return "The council website could not be checked for this address."
+        try:
+            collections = HouseholdBinCoordinator.process_bin_data(
+                json.loads(task.result())
+            )
+        except (TypeError, ValueError):
+            collections = {}
+        if not collections:
+            return "The council website returned no upcoming collections for this address."
+        found = ", ".join(
+            f"{bin_type} ({day.strftime('%d/%m/%Y')})"
+            for bin_type, day in sorted(collections.items(), key=lambda item: item[1])
+        )
+        return f"Next collections found: {found}."
+
+    @callback
+    def async_remove(self):
+        """Stop a running address check when the flow is closed."""
+        if self._validation is not None:
+            self._validation.cancel()
     
     @staticmethod
     @callback
@@ -15,7 +15,126 @@ STATE_ATTR_DAYS = "days"
 
 DEVICE_CLASS = "bin_collection_schedule"
 
-PLATFORMS = ["sensor", "calendar"]
+PLATFORMS = ["sensor", "calendar", "binary_sensor"]
+
+# Key of the integration-wide refresh hub in hass.data[DOMAIN]
+HUB = "hub"
+
+# Key in hass.data[DOMAIN] of data scraped by the config flow for new entries
+SEED = "seed"
+
+# How long a config flow validation scrape may stand in for the first refresh
+SEED_MAX_AGE = timedelta(minutes=30)
+
+# Key in hass.data[DOMAIN] of the integration-wide reminder scheduler
+REMINDERS = "reminders"
+
+# Key in hass.data[DOMAIN] of the shared local-midnight tick
+DAY_TICK = "day_tick"
+
+# Sent at local midnight by the shared tick
+SIGNAL_DAY_CHANGED = f"{DOMAIN}_day_changed"
+
+# Fired when a collection reminder falls due
+EVENT_REMINDER = f"{DOMAIN}_reminder"
+
+# Sent after an entry's reminders fired; format with the entry_id
+SIGNAL_REMINDER_FIRED = f"{DOMAIN}_reminder_fired_{{}}"
+
+# Authenticated iCalendar feeds; append /<entry_id> for a single entry
+FEED_URL = f"/api/{DOMAIN}/ics"
+
+# Number of recent fetch durations kept for latency percentiles
+STATS_WINDOW = 50
+
+# Upper bounds, in seconds, of the fetch latency histogram buckets
+LATENCY_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Prometheus text exposition of integration metrics
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+
+# Number of recent refresh traces kept per entry for export_traces
+TRACE_BUFFER_SIZE = 20
+
+# profile_refresh output directory under /config and summary sizes
+PROFILE_DIR = f"{DOMAIN}_profiles"
+PROFILE_TOP_FUNCTIONS = 15
+PROFILE_TOP_ALLOCATIONS = 10
+
+# Refresh outcomes counted per entry
+OUTCOME_SUCCESS = "success"
+OUTCOME_SEEDED = "seeded"
+OUTCOME_STALE = "stale"
+OUTCOME_PROJECTED = "projected"
+OUTCOME_FAILED = "failed"
+
+# Dispatcher signals sent by the hub with the entry_id as argument
+SIGNAL_COORDINATOR_REGISTERED = f"{DOMAIN}_coordinator_registered"
+SIGNAL_COORDINATOR_UNREGISTERED = f"{DOMAIN}_coordinator_unregistered"
+
+# Sent with the new icon_color_mapping; format with the entry_id
+SIGNAL_ICON_COLOR_MAPPING_UPDATED = f"{DOMAIN}_icon_color_mapping_updated_{{}}"
+
+# Fired on the event bus when a scrape changes an entry's collection dates
+EVENT_SCHEDULE_CHANGED = f"{DOMAIN}_schedule_changed"
+# A removed and an added date of one bin this close together are a move
+SCHEDULE_MOVE_WINDOW = timedelta(days=6)
+
+# Options applied to a running entry without reloading it
+HOT_APPLY_OPTIONS = {
+    "icon_color_mapping",
+    "manual_refresh_only",
+    "refresh_on_read",
+    "reminders",
+    "timeout",
+    "update_interval",
+}
+
+# How soon a read of stale data may start another refresh after one that failed
+REFRESH_ON_READ_RETRY = timedelta(minutes=15)
+
+# Default number of entries manual_refresh refreshes at once
+MANUAL_REFRESH_CONCURRENCY = 4
+
+# Default number of addresses import_addresses checks at once
+IMPORT_CONCURRENCY = 4
+
+# Key in hass.data[DOMAIN] of the cached council list, and how long it is reused
+COUNCILS = "councils"
+COUNCIL_LIST_MAX_AGE = timedelta(hours=12)
+
+# Scrape concurrency and backoff enforced by the refresh hub
+MAX_CONCURRENT_SCRAPES = 4
+MAX_CONCURRENT_SCRAPES_PER_HOST = 1
+HOST_BACKOFF_BASE = timedelta(minutes=5)
+HOST_BACKOFF_MAX = timedelta(hours=6)
+# Entries on one council website due this close together are refreshed as a
+# batch; kept to seconds so that no refresh runs noticeably before its time
+HOST_BATCH_WINDOW = timedelta(seconds=5)
+
+# Schedule inference
+INFERENCE_HISTORY_LIMIT = 26
+INFERENCE_MIN_CONFIDENCE = 0.6
+INFERENCE_SNAP_DAYS = 2
+PROJECTION_HORIZON = timedelta(days=56)
+MAX_REFRESH_STRETCH = 4
+
+# How often the Data Age diagnostic sensor moves on between refreshes
+DATA_AGE_UPDATE_INTERVAL = timedelta(minutes=5)
+
+# Collections listed by the integration-wide next collections sensor
+NEXT_COLLECTIONS_COUNT = 10
+STATE_ATTR_COLLECTIONS = "collections"
+
+STATE_ATTR_PROJECTED = "projected"
+STATE_ATTR_BIN_TYPE = "bin_type"
+STATE_ATTR_NEXT_COLLECTION_DATE = "next_collection_date"
+STATE_ATTR_RAW_DATA = "raw_data"
+STATE_ATTR_LAST_FETCH = "last_fetch"
+PROJECTED_EVENT_DESCRIPTION = (
+    "Projected from the usual collection pattern; "
+    "the council website could not be reached."
+)
 
 SELENIUM_SERVER_URLS = [
     "http://localhost:4444/",
@@ -39,4 +158,11 @@ EXCLUDED_ARG_KEYS = {
     "update_interval",
     "manual_refresh_only",
     "original_parser",
+    "household_calendar",
+    "household_entries",
+    "compact_entities",
+    "diagnostic_sensors",
+    "reminders",
+    "refresh_on_read",
+    "addresses",
 }
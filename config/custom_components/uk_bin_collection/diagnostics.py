@@ -0,0 +1,69 @@
+"""Diagnostics support for UK Bin Collection Data."""
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .hub import async_get_hub
+from .const import DOMAIN
+from .utils import entry_coordinators, get_entry_config
+
+# Anything that locates the address
+TO_REDACT = {"postcode", "number", "paon", "uprn", "usrn", "url", "web_driver"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    diagnostics = {"config": async_redact_data(get_entry_config(config_entry), TO_REDACT)}
+
+    # A multi-address entry is reported per address
+    if hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {}).get("group"):
+        diagnostics["addresses"] = {
+            address_id: coordinator_diagnostics(coordinator)
+            for address_id, coordinator in entry_coordinators(
+                hass, config_entry.entry_id
+            ).items()
+        }
+        return diagnostics
+
+    coordinator = async_get_hub(hass).coordinator(config_entry.entry_id)
+    if coordinator is None:
+        return diagnostics
+    diagnostics.update(coordinator_diagnostics(coordinator))
+    return diagnostics
+
+
+def coordinator_diagnostics(coordinator) -> Dict[str, Any]:
+    """Return the refresh state and statistics of one coordinator."""
+    stats = coordinator.stats
+    diagnostics: Dict[str, Any] = {}
+    diagnostics["coordinator"] = {
+        # Network fetches since this setup; a seeded setup starts at zero
+        "fetches": stats.fetches,
+        "seeded": coordinator.seeded,
+        "last_update_success": coordinator.last_update_success,
+        "last_fetch": coordinator.last_fetch.isoformat()
+        if coordinator.last_fetch
+        else None,
+        "refresh_stretch": coordinator.refresh_stretch,
+        "schedule_generation": coordinator.schedule_generation,
+        "projected": sorted(coordinator.projected),
+        "bin_types": sorted(coordinator.data or {}),
+        "traces": len(coordinator.traces),
+    }
+    diagnostics["stats"] = {
+        "failures": stats.failures,
+        "consecutive_failures": stats.consecutive_failures,
+        "cache_hits": stats.cache_hits,
+        "outcomes": dict(stats.outcomes),
+        "entity_writes": stats.entity_writes,
+        "last_duration": stats.last_duration,
+        "last_queue_wait": stats.last_queue_wait,
+        "p50": stats.percentile(50),
+        "p95": stats.percentile(95),
+    }
+    return diagnostics
@@ -0,0 +1,220 @@
+"""iCalendar feed of bin collections for UK Bin Collection Data.
+
+``BinCollectionFeedView`` serves an ICS feed per config entry and one for
+all entries. Each entry's events are rendered once per schedule generation
+and cached together with an ``ETag`` and ``Last-Modified`` time, so polling
+clients that already hold the current feed get a ``304`` without any
+rendering. The all-entries feed is streamed entry by entry.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .calendar import calc_unique_calendar_id, collection_dates
+from .const import DOMAIN, FEED_URL, LOG_PREFIX, PROJECTED_EVENT_DESCRIPTION
+from .hub import async_get_hub
+
+_LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE_ICS = "text/calendar"
+ICS_LINE_LIMIT = 75
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value as RFC 5545 requires."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """Fold a content line to at most 75 octets per physical line."""
+    encoded = line.encode()
+    if len(encoded) <= ICS_LINE_LIMIT:
+        return line + "\r\n"
+
+    parts = []
+    current = ""
+    limit = ICS_LINE_LIMIT
+    for char in line:
+        if len((current + char).encode()) > limit:
+            parts.append(current)
+            current = ""
+            # Continuation lines start with a space
+            limit = ICS_LINE_LIMIT - 1
+        current += char
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def calendar_header(name: str) -> bytes:
+    """Return the opening lines of a VCALENDAR named ``name``."""
+    return "".join(
+        fold_line(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//UK Bin Collection//Home Assistant//EN",
+            "CALSCALE:GREGORIAN",
+            f"X-WR-CALNAME:{escape_text(name)}",
+        )
+    ).encode()
+
+
+CALENDAR_FOOTER = b"END:VCALENDAR\r\n"
+
+
+class FeedChunk(NamedTuple):
+    """The rendered events of one entry and their cache validators."""
+
+    key: tuple
+    digest: str
+    events: bytes
+    last_modified: datetime
+
+
+def render_events(
+    entry_id: str,
+    collections: Iterable[tuple],
+    stamp: datetime,
+) -> bytes:
+    """Render ``(date, bin_type, projected)`` collections as VEVENT blocks."""
+    dtstamp = stamp.strftime("%Y%m%dT%H%M%SZ")
+    lines: List[str] = []
+    for day, bin_type, projected in collections:
+        lines.extend(
+            (
+                "BEGIN:VEVENT",
+                f"UID:{calc_unique_calendar_id(entry_id, bin_type)}_{day.isoformat()}",
+                f"DTSTAMP:{dtstamp}",
+                f"DTSTART;VALUE=DATE:{day.strftime('%Y%m%d')}",
+                f"DTEND;VALUE=DATE:{(day + timedelta(days=1)).strftime('%Y%m%d')}",
+                f"SUMMARY:{escape_text(f'{bin_type} Collection')}",
+                "TRANSP:TRANSPARENT",
+            )
+        )
+        if projected:
+            lines.append(f"DESCRIPTION:{escape_text(PROJECTED_EVENT_DESCRIPTION)}")
+        lines.append("END:VEVENT")
+    return "".join(fold_line(line) for line in lines).encode()
+
+
+class BinCollectionFeedView(HomeAssistantView):
+    """Serve bin collections as iCalendar feeds."""
+
+    url = FEED_URL
+    extra_urls = [f"{FEED_URL}/{{entry_id}}"]
+    name = f"api:{DOMAIN}:feed"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the view with an empty render cache."""
+        self.hass = hass
+        self._chunks: Dict[str, FeedChunk] = {}
+
+    def chunk(self, entry_id: str) -> Optional[FeedChunk]:
+        """Return the rendered events of ``entry_id``, re-rendering if stale."""
+        coordinator = async_get_hub(self.hass).coordinator(entry_id)
+        if coordinator is None:
+            self._chunks.pop(entry_id, None)
+            return None
+
+        data = coordinator.data or {}
+        key = (id(coordinator), coordinator.schedule_generation, tuple(data.items()))
+        cached = self._chunks.get(entry_id)
+        if cached is not None and cached.key == key:
+            return cached
+
+        collections = sorted(
+            (day, bin_type, projected)
+            for bin_type in data
+            for day, projected in collection_dates(coordinator, bin_type)
+        )
+        digest = hashlib.sha1(repr(collections).encode()).hexdigest()
+        if cached is not None and cached.digest == digest:
+            # Same events under a new generation; keep the validators.
+            cached = cached._replace(key=key)
+        else:
+            now = dt_util.utcnow().replace(microsecond=0)
+            cached = FeedChunk(key, digest, render_events(entry_id, collections, now), now)
+            _LOGGER.debug(
+                "%s Rendered ICS feed for entry_id=%s (%s events)",
+                LOG_PREFIX,
+                entry_id,
+                len(collections),
+            )
+        self._chunks[entry_id] = cached
+        return cached
+
+    async def get(
+        self, request: web.Request, entry_id: Optional[str] = None
+    ) -> web.StreamResponse:
+        """Return the feed of one entry, or of every entry when none is given."""
+        hub = async_get_hub(self.hass)
+        entry_ids = [entry_id] if entry_id is not None else hub.entry_ids
+        for eid in entry_ids:
+            coordinator = hub.coordinator(eid)
+            if coordinator is not None:
+                coordinator.async_note_read()
+        chunks = [(eid, self.chunk(eid)) for eid in entry_ids]
+        chunks = [(eid, chunk) for eid, chunk in chunks if chunk is not None]
+        if entry_id is not None and not chunks:
+            return self.json_message(
+                f"No bin collection entry {entry_id}", HTTPStatus.NOT_FOUND
+            )
+
+        etag = '"{}"'.format(
+            hashlib.sha1(
+                "".join(eid + chunk.digest for eid, chunk in chunks).encode()
+            ).hexdigest()
+        )
+        last_modified = max(
+            (chunk.last_modified for _, chunk in chunks),
+            default=datetime(1970, 1, 1, tzinfo=dt_util.UTC),
+        )
+        headers = {
+            "ETag": etag,
+            "Last-Modified": last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+            "Cache-Control": "private, no-cache",
+        }
+
+        if self._not_modified(request, etag, last_modified):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        if entry_id is not None:
+            coordinator = hub.coordinator(entry_id)
+            body = calendar_header(coordinator.name) + chunks[0][1].events + CALENDAR_FOOTER
+            return web.Response(body=body, content_type=CONTENT_TYPE_ICS, headers=headers)
+
+        # Large multi-entry feeds are streamed rather than joined in memory.
+        response = web.StreamResponse(headers=headers)
+        response.content_type = CONTENT_TYPE_ICS
+        await response.prepare(request)
+        await response.write(calendar_header("UK Bin Collection"))
+        for _, chunk in chunks:
+            await response.write(chunk.events)
+        await response.write(CALENDAR_FOOTER)
+        await response.write_eof()
+        return response
+
+    @staticmethod
+    def _not_modified(
+        request: web.Request, etag: str, last_modified: datetime
+    ) -> bool:
+        """Return True if the client already holds the current feed."""
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = request.if_modified_since
+        return if_modified_since is not None and last_modified <= if_modified_since
@@ -0,0 +1,389 @@
+"""Integration-wide refresh hub for UK Bin Collection Data.
+
+Every config entry registers its coordinator with a single ``RefreshHub``
+stored in ``hass.data[DOMAIN]``. The hub keeps one heap of due times and one
+armed timer for the whole integration, so adding entries only adds a heap
+item rather than another timer. Scrapes are funnelled through the hub so that
+global and per-host concurrency limits and host backoff apply to scheduled
+and manual refreshes alike.
+
+When an entry falls due, the other entries on the same council website that
+are due within the few seconds of ``HOST_BATCH_WINDOW`` are refreshed with
+it as one batch, so entries due together are scraped back to back in a
+single wake-up. Entries are never pulled forward by more than that, so
+each keeps its configured interval.
+
+A multi-address entry registers each address's coordinator unscheduled, so
+the services and views find them, and its ``AddressGroup`` as an unlisted
+entry: the hub schedules the group, which scrapes every address in one job.
+"""
+
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    HUB,
+    HOST_BACKOFF_BASE,
+    HOST_BACKOFF_MAX,
+    HOST_BATCH_WINDOW,
+    LOG_PREFIX,
+    MAX_CONCURRENT_SCRAPES,
+    MAX_CONCURRENT_SCRAPES_PER_HOST,
+    SIGNAL_COORDINATOR_REGISTERED,
+    SIGNAL_COORDINATOR_UNREGISTERED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def async_get_hub(hass: HomeAssistant) -> "RefreshHub":
+    """Return the integration-wide refresh hub, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    hub = domain_data.get(HUB)
+    if hub is None:
+        hub = RefreshHub(hass)
+        domain_data[HUB] = hub
+    return hub
+
+
+def scrape_host(config_data: dict) -> str:
+    """Return the key used to group entries that scrape the same server."""
+    url = config_data.get("url") or ""
+    host = urlparse(url).hostname if url else None
+    if host:
+        return host.lower()
+    return config_data.get("original_parser") or config_data.get("council", "")
+
+
+class _HubEntry:
+    """Scheduling state the hub keeps for one registered coordinator."""
+
+    __slots__ = (
+        "coordinator",
+        "host",
+        "interval",
+        "listed",
+        "stretch",
+        "generation",
+        "due",
+    )
+
+    def __init__(
+        self, coordinator, host: str, interval: Optional[timedelta], listed: bool
+    ):
+        self.coordinator = coordinator
+        self.host = host
+        self.interval = interval
+        self.listed = listed
+        self.stretch = 1
+        self.generation = 0
+        self.due: Optional[datetime] = None
+
+
+class RefreshHub:
+    """Own the refresh schedule and scrape concurrency for every entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int = MAX_CONCURRENT_SCRAPES,
+        max_per_host: int = MAX_CONCURRENT_SCRAPES_PER_HOST,
+    ) -> None:
+        """Initialise the hub."""
+        self.hass = hass
+        self._entries: Dict[str, _HubEntry] = {}
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._timer: Optional[CALLBACK_TYPE] = None
+        self._timer_due: Optional[datetime] = None
+        self._global_slots = asyncio.Semaphore(max_concurrent)
+        self._max_per_host = max_per_host
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._host_failures: Dict[str, int] = {}
+        self._host_backoff_until: Dict[str, datetime] = {}
+        self.in_flight = 0
+        self.waiting = 0
+
+    # -----------------------------------------------------------------
+    # Registration and scheduling
+    # -----------------------------------------------------------------
+
+    @property
+    def entry_ids(self) -> List[str]:
+        """Return the listed entry ids currently registered with the hub."""
+        return [
+            entry_id for entry_id, hub_entry in self._entries.items() if hub_entry.listed
+        ]
+
+    def coordinator(self, entry_id: str):
+        """Return the coordinator registered for a listed ``entry_id``, if any."""
+        hub_entry = self._entries.get(entry_id)
+        return hub_entry.coordinator if hub_entry and hub_entry.listed else None
+
+    @callback
+    def async_register(
+        self,
+        entry_id: str,
+        coordinator,
+        host: str,
+        interval: Optional[timedelta],
+        due: Optional[datetime] = None,
+        listed: bool = True,
+    ) -> None:
+        """Register a coordinator and schedule its next automatic refresh.
+
+        The refresh falls due after ``interval``, or at ``due`` when the
+        coordinator starts with data fetched earlier. An entry that is not
+        ``listed`` is only scheduled: it is left out of ``entry_ids`` and
+        ``coordinator`` and no signal announces it.
+        """
+        self._entries[entry_id] = _HubEntry(coordinator, host, interval, listed)
+        _LOGGER.debug(
+            "%s Hub registered entry_id=%s host=%s interval=%s",
+            LOG_PREFIX,
+            entry_id,
+            host,
+            interval,
+        )
+        if interval is not None:
+            self._push(entry_id, due or dt_util.utcnow() + interval)
+        if listed:
+            async_dispatcher_send(self.hass, SIGNAL_COORDINATOR_REGISTERED, entry_id)
+
+    @callback
+    def async_unregister(self, entry_id: str) -> None:
+        """Forget an entry; its heap items are discarded lazily."""
+        hub_entry = self._entries.pop(entry_id, None)
+        if hub_entry is not None and hub_entry.listed:
+            async_dispatcher_send(self.hass, SIGNAL_COORDINATOR_UNREGISTERED, entry_id)
+        if not self._entries:
+            self._cancel_timer()
+            self._heap.clear()
+
+    @callback
+    def async_reschedule(
+        self,
+        entry_id: str,
+        interval: Optional[timedelta],
+        delay: Optional[timedelta] = None,
+    ) -> None:
+        """Change an entry's interval and move its next refresh accordingly."""
+        hub_entry = self._entries.get(entry_id)
+        if hub_entry is None:
+            return
+        hub_entry.interval = interval
+        hub_entry.generation += 1
+        hub_entry.due = None
+        if interval is None:
+            self._arm_timer()
+            return
+        self._push(entry_id, dt_util.utcnow() + (delay if delay is not None else interval))
+
+    @callback
+    def async_set_stretch(self, entry_id: str, stretch: int) -> None:
+        """Multiply an entry's interval from its next scheduled refresh on."""
+        hub_entry = self._entries.get(entry_id)
+        if hub_entry is not None:
+            hub_entry.stretch = stretch
+
+    def _push(self, entry_id: str, due: datetime) -> None:
+        """Queue ``entry_id`` for refresh at ``due`` and re-arm the timer."""
+        hub_entry = self._entries[entry_id]
+        hub_entry.due = due
+        heapq.heappush(self._heap, (due, hub_entry.generation, entry_id))
+        self._arm_timer()
+
+    def _is_current(self, item: Tuple[datetime, int, str]) -> bool:
+        """Return True if a heap item still reflects its entry's schedule."""
+        due, generation, entry_id = item
+        hub_entry = self._entries.get(entry_id)
+        return (
+            hub_entry is not None
+            and hub_entry.generation == generation
+            and hub_entry.due == due
+        )
+
+    def _arm_timer(self) -> None:
+        """Point the single hub timer at the earliest current heap item."""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        next_due = self._heap[0][0] if self._heap else None
+        if next_due == self._timer_due:
+            return
+
+        self._cancel_timer()
+        if next_due is not None:
+            self._timer_due = next_due
+            self._timer = async_track_point_in_utc_time(
+                self.hass, self._async_handle_timer, next_due
+            )
+
+    def _cancel_timer(self) -> None:
+        """Cancel the armed timer, if any."""
+        if self._timer is not None:
+            self._timer()
+        self._timer = None
+        self._timer_due = None
+
+    @callback
+    def _async_handle_timer(self, now: datetime) -> None:
+        """Start every refresh that has fallen due, batched by host."""
+        self._timer = None
+        self._timer_due = None
+
+        while self._heap and self._heap[0][0] <= now:
+            item = heapq.heappop(self._heap)
+            if not self._is_current(item):
+                continue
+            entry_id = item[2]
+            hub_entry = self._entries[entry_id]
+
+            backoff_until = self._host_backoff_until.get(hub_entry.host)
+            if backoff_until is not None and backoff_until > now:
+                # Another entry on this host failed recently; wait with it.
+                hub_entry.due = backoff_until
+                heapq.heappush(
+                    self._heap, (backoff_until, hub_entry.generation, entry_id)
+                )
+                continue
+
+            hub_entry.due = None
+            batch = [(entry_id, hub_entry.generation)]
+            batch_until = now + HOST_BATCH_WINDOW
+            for other_id, other in self._entries.items():
+                if (
+                    other.host == hub_entry.host
+                    and other.due is not None
+                    and other.due <= batch_until
+                ):
+                    # Its heap item goes stale and is discarded lazily
+                    other.due = None
+                    batch.append((other_id, other.generation))
+
+            if len(batch) > 1:
+                _LOGGER.debug(
+                    "%s Refreshing %d entries on %s together",
+                    LOG_PREFIX,
+                    len(batch),
+                    hub_entry.host,
+                )
+            for batch_id, generation in batch:
+                self.hass.async_create_background_task(
+                    self._async_run_scheduled(batch_id, generation),
+                    f"{DOMAIN}_scheduled_refresh_{batch_id}",
+                )
+
+        self._arm_timer()
+
+    async def _async_run_scheduled(self, entry_id: str, generation: int) -> None:
+        """Run one scheduled refresh and queue the entry's next one."""
+        hub_entry = self._entries.get(entry_id)
+        if hub_entry is None:
+            return
+
+        await hub_entry.coordinator.async_refresh()
+
+        hub_entry = self._entries.get(entry_id)
+        if (
+            hub_entry is None
+            or hub_entry.generation != generation
+            or hub_entry.due is not None
+            or hub_entry.interval is None
+        ):
+            return
+
+        delay = hub_entry.interval * hub_entry.stretch
+        if (
+            not hub_entry.coordinator.last_update_success
+            or hub_entry.host in self._host_failures
+        ):
+            delay = min(hub_entry.interval, self.host_backoff(hub_entry.host))
+        self._push(entry_id, dt_util.utcnow() + delay)
+
+    # -----------------------------------------------------------------
+    # Scrape execution
+    # -----------------------------------------------------------------
+
+    def _host_slot(self, host: str) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent scrapes of ``host``."""
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self._max_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    async def async_run_job(
+        self, host: str, job: Callable[[], Any], timeout: float
+    ) -> Any:
+        """Run a blocking scrape in the executor within the hub's limits.
+
+        ``timeout`` covers the scrape itself, not the time spent waiting for
+        a free slot.
+        """
+        self.waiting += 1
+        acquired = False
+        try:
+            async with self._global_slots, self._host_slot(host):
+                self.waiting -= 1
+                acquired = True
+                self.in_flight += 1
+                try:
+                    result = await asyncio.wait_for(
+                        self.hass.async_add_executor_job(job), timeout=timeout
+                    )
+                except Exception:
+                    self._record_failure(host)
+                    raise
+                finally:
+                    self.in_flight -= 1
+        finally:
+            if not acquired:
+                self.waiting -= 1
+        self._record_success(host)
+        return result
+
+    def _record_success(self, host: str) -> None:
+        """Clear any backoff held against ``host``."""
+        self._host_failures.pop(host, None)
+        self._host_backoff_until.pop(host, None)
+
+    def _record_failure(self, host: str) -> None:
+        """Extend the shared backoff for every entry scraping ``host``."""
+        failures = self._host_failures.get(host, 0) + 1
+        self._host_failures[host] = failures
+        self._host_backoff_until[host] = dt_util.utcnow() + self.host_backoff(host)
+        _LOGGER.warning(
+            "%s Scrape of %s failed %s time(s) in a row; backing off until %s",
+            LOG_PREFIX,
+            host,
+            failures,
+            self._host_backoff_until[host],
+        )
+
+    def host_backoff(self, host: str) -> timedelta:
+        """Return the current backoff delay for ``host``."""
+        failures = self._host_failures.get(host, 0)
+        if not failures:
+            return timedelta(0)
+        return min(HOST_BACKOFF_BASE * (2 ** (failures - 1)), HOST_BACKOFF_MAX)
+
+    def host_backoff_until(self, host: str) -> Optional[datetime]:
+        """Return when the backoff held against ``host`` expires, if any."""
+        return self._host_backoff_until.get(host)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the hub timer and drop all scheduling state."""
+        self._cancel_timer()
+        self._heap.clear()
+        self._entries.clear()
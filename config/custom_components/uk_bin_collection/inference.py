@@ -0,0 +1,135 @@
+"""Collection cadence inference for UK Bin Collection Data.
+
+Bin rounds repeat on a fixed weekly, fortnightly or monthly pattern. The
+``ScheduleInference`` engine learns each bin type's period and weekday phase
+from the dates it has been shown and projects future collections from them.
+The coordinator uses the projections to keep entities populated when a
+scrape fails, and to stretch its refresh interval while the council keeps
+publishing the dates that were predicted.
+"""
+
+from collections import Counter
+from datetime import date, timedelta
+from statistics import median
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from .const import (
+    INFERENCE_HISTORY_LIMIT,
+    INFERENCE_MIN_CONFIDENCE,
+    INFERENCE_SNAP_DAYS,
+)
+
+
+class BinCadence(NamedTuple):
+    """The learned collection pattern for one bin type."""
+
+    period_days: int
+    phase: int
+    confidence: float
+
+
+class ScheduleInference:
+    """Learn per-bin collection cadences and project future dates."""
+
+    def __init__(self, history_limit: int = INFERENCE_HISTORY_LIMIT) -> None:
+        """Initialise an engine with no observations."""
+        self._history_limit = history_limit
+        self._history: Dict[str, List[date]] = {}
+        self._cadences: Dict[str, Optional[BinCadence]] = {}
+
+    @property
+    def bin_types(self) -> List[str]:
+        """Return every bin type the engine has observed."""
+        return list(self._history)
+
+    def history(self, bin_type: str) -> List[date]:
+        """Return the observed dates for ``bin_type``, oldest first."""
+        return list(self._history.get(bin_type, []))
+
+    def observe(self, schedule: Dict[str, Iterable[date]]) -> None:
+        """Merge newly scraped collection dates into the history."""
+        for bin_type, dates in schedule.items():
+            known = set(self._history.get(bin_type, []))
+            merged = known.union(dates)
+            if merged == known:
+                continue
+            self._history[bin_type] = sorted(merged)[-self._history_limit :]
+            self._cadences[bin_type] = self._learn(self._history[bin_type])
+
+    def cadence(self, bin_type: str) -> Optional[BinCadence]:
+        """Return the learned cadence for ``bin_type``, if there is one."""
+        return self._cadences.get(bin_type)
+
+    @staticmethod
+    def _learn(dates: List[date]) -> Optional[BinCadence]:
+        """Infer period, phase and confidence from sorted distinct dates."""
+        if len(dates) < 2:
+            return None
+
+        gaps = [(later - earlier).days for earlier, later in zip(dates, dates[1:])]
+        period = int(round(median(gaps)))
+        # Most rounds run on whole weeks; allow for bank holiday slips.
+        weeks = max(1, int(round(period / 7)))
+        if abs(period - weeks * 7) <= INFERENCE_SNAP_DAYS:
+            period = weeks * 7
+        if period < 1:
+            return None
+
+        residues = Counter(day.toordinal() % period for day in dates)
+        phase, on_phase = residues.most_common(1)[0]
+
+        # Share of dates on the pattern, discounted until we have seen
+        # at least three repeats.
+        confidence = (on_phase / len(dates)) * min(1.0, len(gaps) / 3)
+        return BinCadence(period, phase, round(confidence, 3))
+
+    def project(
+        self,
+        bin_type: str,
+        start: date,
+        end: date,
+        min_confidence: float = INFERENCE_MIN_CONFIDENCE,
+    ) -> List[date]:
+        """Return projected dates for ``bin_type`` between ``start`` and ``end``."""
+        cadence = self._cadences.get(bin_type)
+        if cadence is None or cadence.confidence < min_confidence:
+            return []
+
+        offset = (cadence.phase - start.toordinal()) % cadence.period_days
+        current = start + timedelta(days=offset)
+        projected = []
+        while current <= end:
+            projected.append(current)
+            current += timedelta(days=cadence.period_days)
+        return projected
+
+    def projected_schedule(
+        self,
+        start: date,
+        end: date,
+        min_confidence: float = INFERENCE_MIN_CONFIDENCE,
+    ) -> Dict[str, List[date]]:
+        """Return projections for every bin type confident enough to project."""
+        schedule = {}
+        for bin_type in self._history:
+            dates = self.project(bin_type, start, end, min_confidence)
+            if dates:
+                schedule[bin_type] = dates
+        return schedule
+
+    def matches(self, schedule: Dict[str, List[date]], today: date) -> bool:
+        """Return True if every bin's next scraped date was predicted.
+
+        A schedule containing a bin type the engine cannot yet project never
+        matches, so the first scrapes after a change always run on time.
+        """
+        checked = 0
+        for bin_type, dates in schedule.items():
+            upcoming = [day for day in dates if day >= today]
+            if not upcoming:
+                continue
+            next_date = min(upcoming)
+            if self.project(bin_type, today, next_date)[:1] != [next_date]:
+                return False
+            checked += 1
+        return checked > 0
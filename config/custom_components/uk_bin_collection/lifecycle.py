@@ -0,0 +1,123 @@
+"""Per-bin entity lifecycle for UK Bin Collection Data.
+
+Councils add and drop bin types over the year, garden waste being the usual
+example. Each platform hands a ``BinEntityTracker`` a factory building the
+entities of one bin type; after every successful refresh the tracker adds
+entities for bin types that appeared and removes, through the entity
+registry, those of bin types that are gone. Nothing is reloaded and nothing
+is fetched: the tracker only looks at the data the refresh already produced.
+"""
+
+import logging
+from typing import Callable, Dict, Iterable, List
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import LOG_PREFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BinEntityTracker:
+    """Keep a platform's per-bin entities in step with the coordinator's bins."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DataUpdateCoordinator,
+        entry_id: str,
+        async_add_entities: AddEntitiesCallback,
+        factory: Callable[[str], List[Entity]],
+    ) -> None:
+        """Initialise a tracker building each bin type's entities with ``factory``."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.entry_id = entry_id
+        self._async_add_entities = async_add_entities
+        self._factory = factory
+        self._entities: Dict[str, List[Entity]] = {}
+
+    @property
+    def bin_types(self) -> List[str]:
+        """Return the bin types that currently have entities."""
+        return list(self._entities)
+
+    @property
+    def entities(self) -> List[Entity]:
+        """Return every entity the tracker currently owns."""
+        return [entity for entities in self._entities.values() for entity in entities]
+
+    def create(self, bin_types: Iterable[str]) -> List[Entity]:
+        """Build and track the entities of ``bin_types``; return the new ones."""
+        created = []
+        for bin_type in bin_types:
+            if bin_type in self._entities:
+                continue
+            entities = self._factory(bin_type)
+            if entities:
+                self._entities[bin_type] = entities
+                created.extend(entities)
+        return created
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the coordinator's refreshes; return the unsubscribe callback."""
+        return self.coordinator.async_add_listener(self._async_sync)
+
+    @callback
+    def _async_sync(self) -> None:
+        """Add and remove entities after a refresh changed the bin types."""
+        if not self.coordinator.last_update_success or self.coordinator.data is None:
+            return
+        current = self.coordinator.data
+        gone = [bin_type for bin_type in self._entities if bin_type not in current]
+        created = self.create(current)
+        if created:
+            _LOGGER.info(
+                "%s Adding %d entities for new bin types of entry_id=%s",
+                LOG_PREFIX,
+                len(created),
+                self.entry_id,
+            )
+            self._async_add_entities(created)
+        for bin_type in gone:
+            _LOGGER.info(
+                "%s Removing entities of bin type '%s' no longer collected for entry_id=%s",
+                LOG_PREFIX,
+                bin_type,
+                self.entry_id,
+            )
+            self._async_remove(self._entities.pop(bin_type))
+
+    @callback
+    def _async_remove(self, entities: List[Entity]) -> None:
+        """Remove ``entities`` and any per-bin device left without entities."""
+        entity_registry = er.async_get(self.hass)
+        device_ids = set()
+        for entity in entities:
+            entry = (
+                entity_registry.async_get(entity.entity_id) if entity.entity_id else None
+            )
+            if entry is None:
+                # Not registered: remove the entity itself
+                if entity.hass is not None:
+                    self.hass.async_create_task(entity.async_remove(force_remove=True))
+                continue
+            if entry.device_id:
+                device_ids.add(entry.device_id)
+            # The entity removes itself when its registry entry goes
+            entity_registry.async_remove(entity.entity_id)
+
+        device_registry = dr.async_get(self.hass)
+        for device_id in device_ids:
+            if not er.async_entries_for_device(
+                entity_registry, device_id, include_disabled_entities=True
+            ):
+                device_registry.async_update_device(
+                    device_id, remove_config_entry_id=self.entry_id
+                )
@@ -0,0 +1,283 @@
+"""In-memory refresh statistics for UK Bin Collection Data.
+
+Each ``HouseholdBinCoordinator`` owns a ``FetchStats`` that it updates on
+every refresh. Updates are plain attribute writes and a bounded deque append
+made from the event loop, so they need no locking and cost nothing
+measurable next to a scrape; percentiles and the Prometheus exposition
+served by ``BinCollectionMetricsView`` are only computed when read.
+"""
+
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    LATENCY_BUCKETS,
+    METRICS_URL,
+    OUTCOME_FAILED,
+    OUTCOME_PROJECTED,
+    OUTCOME_SEEDED,
+    OUTCOME_STALE,
+    OUTCOME_SUCCESS,
+    STATS_WINDOW,
+)
+from .hub import async_get_hub
+
+OUTCOMES = (
+    OUTCOME_SUCCESS,
+    OUTCOME_SEEDED,
+    OUTCOME_STALE,
+    OUTCOME_PROJECTED,
+    OUTCOME_FAILED,
+)
+
+
+class FetchStats:
+    """Counters describing how an entry's refreshes have been going."""
+
+    __slots__ = (
+        "durations",
+        "last_duration",
+        "last_queue_wait",
+        "consecutive_failures",
+        "fetches",
+        "failures",
+        "cache_hits",
+        "last_success",
+        "outcomes",
+        "latency_buckets",
+        "latency_sum",
+        "entity_writes",
+    )
+
+    def __init__(self, window: int = STATS_WINDOW) -> None:
+        """Initialise empty statistics keeping ``window`` recent durations."""
+        self.durations: Deque[float] = deque(maxlen=window)
+        self.last_duration: Optional[float] = None
+        self.last_queue_wait: Optional[float] = None
+        self.consecutive_failures = 0
+        self.fetches = 0
+        self.failures = 0
+        self.cache_hits = 0
+        self.last_success: Optional[datetime] = None
+        self.outcomes: Dict[str, int] = dict.fromkeys(OUTCOMES, 0)
+        # Per-bucket (not cumulative) counts; the last slot is +Inf
+        self.latency_buckets: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.entity_writes = 0
+
+    def record_fetch(self, duration: float, queue_wait: float) -> None:
+        """Record how long a scrape ran and how long it waited to start."""
+        self.fetches += 1
+        self.last_duration = duration
+        self.last_queue_wait = queue_wait
+        self.durations.append(duration)
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.latency_sum += duration
+
+    def record_outcome(self, outcome: str) -> None:
+        """Count how a refresh ended."""
+        self.outcomes[outcome] += 1
+
+    def record_success(self, now: datetime) -> None:
+        """Record a refresh that produced fresh data."""
+        self.consecutive_failures = 0
+        self.last_success = now
+        self.outcomes[OUTCOME_SUCCESS] += 1
+
+    def record_seed(self, fetched_at: datetime) -> None:
+        """Record a first refresh served from data scraped before setup."""
+        self.last_success = fetched_at
+        self.outcomes[OUTCOME_SEEDED] += 1
+
+    def record_failure(self) -> None:
+        """Record a refresh whose scrape failed."""
+        self.failures += 1
+        self.consecutive_failures += 1
+
+    def record_cache_hit(self, outcome: str = OUTCOME_STALE) -> None:
+        """Record a refresh answered from stored or projected data."""
+        self.cache_hits += 1
+        self.outcomes[outcome] += 1
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Return the nearest-rank percentile of the recent durations."""
+        if not self.durations:
+            return None
+        ordered = sorted(self.durations)
+        rank = max(1, -(-len(ordered) * percent // 100))
+        return ordered[int(rank) - 1]
+
+    def data_age(self, now: datetime) -> Optional[float]:
+        """Return the seconds since fresh data was last fetched."""
+        if self.last_success is None:
+            return None
+        return (now - self.last_success).total_seconds()
+
+
+def _escape(value) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    """Format ``labels`` as a Prometheus label set."""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class _Exposition:
+    """Accumulate metric families in text exposition format."""
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        """Start a metric family."""
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, labels: str, value) -> None:
+        """Add one sample to the current family."""
+        if isinstance(value, float):
+            value = repr(value)
+        self._lines.append(f"{name}{labels} {value}")
+
+    def text(self) -> str:
+        """Return the exposition."""
+        return "\n".join(self._lines) + "\n"
+
+
+def render_metrics(hub, now: Optional[datetime] = None) -> str:
+    """Render every entry's statistics and the hub's state for Prometheus."""
+    now = now or dt_util.utcnow()
+    entries = [
+        (entry_id, hub.coordinator(entry_id)) for entry_id in hub.entry_ids
+    ]
+    entries = [(entry_id, c) for entry_id, c in entries if c is not None]
+    label_sets = {
+        entry_id: dict(entry=entry_id, name=c.name, council=c.council)
+        for entry_id, c in entries
+    }
+    out = _Exposition()
+
+    out.family(
+        "uk_bin_collection_refreshes_total",
+        "counter",
+        "Refreshes by outcome: fresh data, seed, stale or projected fallback, or failure.",
+    )
+    for entry_id, coordinator in entries:
+        for outcome, count in coordinator.stats.outcomes.items():
+            out.sample(
+                "uk_bin_collection_refreshes_total",
+                _labels(**label_sets[entry_id], outcome=outcome),
+                count,
+            )
+
+    out.family(
+        "uk_bin_collection_fetch_duration_seconds",
+        "histogram",
+        "Time spent running the council parser.",
+    )
+    for entry_id, coordinator in entries:
+        stats = coordinator.stats
+        cumulative = 0
+        bounds: Iterable = list(LATENCY_BUCKETS) + ["+Inf"]
+        for bound, count in zip(bounds, stats.latency_buckets):
+            cumulative += count
+            out.sample(
+                "uk_bin_collection_fetch_duration_seconds_bucket",
+                _labels(**label_sets[entry_id], le=bound),
+                cumulative,
+            )
+        out.sample(
+            "uk_bin_collection_fetch_duration_seconds_sum",
+            _labels(**label_sets[entry_id]),
+            float(stats.latency_sum),
+        )
+        out.sample(
+            "uk_bin_collection_fetch_duration_seconds_count",
+            _labels(**label_sets[entry_id]),
+            stats.fetches,
+        )
+
+    per_entry = (
+        ("uk_bin_collection_queue_wait_seconds", "gauge", "Wait before the last scrape started.", lambda s: s.last_queue_wait),
+        ("uk_bin_collection_consecutive_failures", "gauge", "Failed refreshes since the last success.", lambda s: s.consecutive_failures),
+        ("uk_bin_collection_cache_hits_total", "counter", "Refreshes answered from stored or projected dates.", lambda s: s.cache_hits),
+        ("uk_bin_collection_entity_writes_total", "counter", "Entity state writes triggered by refreshes.", lambda s: s.entity_writes),
+        ("uk_bin_collection_data_age_seconds", "gauge", "Seconds since fresh data was last fetched.", lambda s: s.data_age(now)),
+    )
+    for name, kind, help_text, value_fn in per_entry:
+        out.family(name, kind, help_text)
+        for entry_id, coordinator in entries:
+            value = value_fn(coordinator.stats)
+            if value is not None:
+                out.sample(name, _labels(**label_sets[entry_id]), value)
+
+    out.family(
+        "uk_bin_collection_scrapes_in_flight",
+        "gauge",
+        "Scrapes currently running in the executor.",
+    )
+    out.sample("uk_bin_collection_scrapes_in_flight", "", hub.in_flight)
+    out.family(
+        "uk_bin_collection_scrapes_queued",
+        "gauge",
+        "Scrapes waiting for a global or per-host slot.",
+    )
+    out.sample("uk_bin_collection_scrapes_queued", "", hub.waiting)
+
+    # Host backoff is the integration's circuit breaker
+    hosts = sorted({coordinator.host for _, coordinator in entries})
+    out.family(
+        "uk_bin_collection_host_backoff_open",
+        "gauge",
+        "1 while scrapes of a council website are held back after failures.",
+    )
+    for host in hosts:
+        until = hub.host_backoff_until(host)
+        out.sample(
+            "uk_bin_collection_host_backoff_open",
+            _labels(host=host),
+            int(until is not None and until > now),
+        )
+    out.family(
+        "uk_bin_collection_host_backoff_seconds",
+        "gauge",
+        "Current backoff delay applied to a council website.",
+    )
+    for host in hosts:
+        out.sample(
+            "uk_bin_collection_host_backoff_seconds",
+            _labels(host=host),
+            hub.host_backoff(host).total_seconds(),
+        )
+
+    return out.text()
+
+
+class BinCollectionMetricsView(HomeAssistantView):
+    """Serve integration metrics in Prometheus text exposition format."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the current metrics."""
+        return web.Response(
+            text=render_metrics(async_get_hub(self.hass)),
+            content_type="text/plain",
+            headers={"Cache-Control": "no-cache"},
+            charset="utf-8",
+        )
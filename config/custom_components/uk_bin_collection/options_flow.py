@@ -7,8 +7,10 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 
-from .initialisation import initialisation_data
+from .const import DOMAIN
+from .reminders import is_valid_reminders
 from .utils import (
+    async_get_council_list,
     build_user_schema,
     build_council_schema,
     build_selenium_schema,
@@ -19,6 +21,22 @@ from .utils import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entry data replaced when the address or council is changed
+ADDRESS_DATA_KEYS = (
+    "name",
+    "council",
+    "url",
+    "postcode",
+    "uprn",
+    "number",
+    "usrn",
+    "original_parser",
+    "skip_get_url",
+    "web_driver",
+    "headless",
+    "local_browser",
+)
+
 class UkBinCollectionOptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for UkBinCollection."""
 
@@ -32,6 +50,9 @@ class UkBinCollectionOptionsFlowHandler(config_entries.OptionsFlow):
         # Initialise self.data from config_entry data
         self.data = dict(config_entry.data) if config_entry.data else {}
         self._initialised = False 
+
+        # Form input of the address steps, once the address is being changed
+        self._address = None
         
         # IMPORTANT: Ensure council is initialised from the start
         # If council doesn't exist in config data but original_parser does, use that
@@ -42,18 +63,24 @@ class UkBinCollectionOptionsFlowHandler(config_entries.OptionsFlow):
         _LOGGER.debug(f"Options flow initialised with council: {self.data.get('council')}, original_parser: {self.data.get('original_parser')}")
         
     async def async_step_init(self, user_input=None):
-        """First step in options flow - redirect to user selection."""
-        # Initialise the handler with councils data  
-        if not self._initialised:  
-            await initialisation_data(self)
-            self._initialised = True  
-            
-        # Redirect to the first step (user selection)
-        return await self.async_step_user()
+        """First step in options flow - choose what to change."""
+        # Settings are changed without loading anything from the network
+        if self.data.get("addresses"):
+            # The addresses of a multi-address entry come from a bulk import
+            return self.async_show_menu(step_id="init", menu_options=["advanced"])
+        return self.async_show_menu(step_id="init", menu_options=["advanced", "user"])
 
     async def async_step_user(self, user_input=None):
         """Step 1: Select Council."""
         errors = {}
+
+        # The council list is only needed to change the address or council
+        if not self._initialised:
+            self.data["council_list"] = await async_get_council_list(self.hass)
+            self._initialised = True
+        if not self.data.get("council_list"):
+            self._initialised = False
+            return self.async_abort(reason="council_data_unavailable")
         
         # Create a mapping of wiki names to council keys
         council_list = self.data.get("council_list", {})
@@ -115,8 +142,11 @@ class UkBinCollectionOptionsFlowHandler(config_entries.OptionsFlow):
             if "original_parser" in council_data:
                 self.data["original_parser"] = council_data["original_parser"]
                 _LOGGER.debug(f"Using original_parser '{council_data['original_parser']}' for council {council_key}")
+            else:
+                self.data.pop("original_parser", None)
             
             if not errors:
+                self._address = {}
                 return await self.async_step_council_info()
 
         # Dynamically set the description placeholders
@@ -148,6 +178,7 @@ class UkBinCollectionOptionsFlowHandler(config_entries.OptionsFlow):
             
             if not errors:
                 self.data.update(user_input)
+                self._address.update(user_input)
                 council_key = self.data.get("selected_council", "")
                 council_data = self.data.get("council_list", {}).get(council_key, {})
 
@@ -218,6 +249,7 @@ class UkBinCollectionOptionsFlowHandler(config_entries.OptionsFlow):
             can_proceed, error_code = await validate_selenium_config(user_input, self.data)
             
             if can_proceed:
+                self._address.update(user_input)
                 return await self.async_step_advanced()
             elif error_code:
                 errors["base"] = error_code
@@ -233,20 +265,63 @@ class UkBinCollectionOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_advanced(self, user_input=None):
         """Handle advanced options."""
+        errors = {}
         if user_input is not None:
-            # User submitted the form - pass is_options_flow=True to skip critical field validation
-            self.options.update(prepare_config_data(user_input, is_options_flow=True))
-            return self.async_create_entry(title="", data=self.options)
+            if not is_valid_reminders(user_input.get("reminders", "")):
+                errors["reminders"] = "invalid_reminders"
+            else:
+                # Options only hold settings; a changed address goes to the data
+                if self._address is not None:
+                    self._async_update_address()
+
+                # User submitted the form - pass is_options_flow=True to skip critical field validation
+                self.options.update(prepare_config_data(user_input, is_options_flow=True))
+                return self.async_create_entry(title="", data=self.options)
         
         # Get defaults from current config - use self instead of passing config_entry
         defaults = get_advanced_defaults(self)
+        if user_input is not None:
+            defaults.update(user_input)
         
+        # Other addresses that can be merged into this entry's household calendar
+        entry_choices = {
+            entry.entry_id: entry.title
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.entry_id != self.config_entry.entry_id
+        }
+
         # Create schema with the defaults
-        schema = build_advanced_schema(defaults)
+        schema = build_advanced_schema(defaults, entry_choices=entry_choices)
         
         return self.async_show_form(
             step_id="advanced",
             data_schema=schema,
+            errors=errors,
+        )
+
+    @callback
+    def _async_update_address(self):
+        """Save the address and council chosen in the earlier steps to the entry data."""
+        data = {
+            key: value
+            for key, value in self.config_entry.data.items()
+            if key not in ADDRESS_DATA_KEYS
+        }
+        data.update(
+            prepare_config_data(
+                {
+                    "name": self.data.get("name"),
+                    "selected_council": self.data.get("selected_council"),
+                    "council_list": self.data.get("council_list", {}),
+                    "original_parser": self.data.get("original_parser"),
+                    **self._address,
+                },
+                is_options_flow=True,
+            )
+        )
+        _LOGGER.debug(f"Updated address data: {data}")
+        self.hass.config_entries.async_update_entry(
+            self.config_entry, title=data.get("name"), data=data
         )
 
 # When loading settings for the options flow
@@ -274,6 +349,30 @@ def get_advanced_defaults(options_flow):
         "icon_color_mapping": config_entry.options.get(
             "icon_color_mapping", 
             config_entry.data.get("icon_color_mapping", "")
-        )
+        ),
+        "household_calendar": config_entry.options.get(
+            "household_calendar",
+            config_entry.data.get("household_calendar", False)
+        ),
+        "household_entries": config_entry.options.get(
+            "household_entries",
+            config_entry.data.get("household_entries", [])
+        ),
+        "compact_entities": config_entry.options.get(
+            "compact_entities",
+            config_entry.data.get("compact_entities", False)
+        ),
+        "diagnostic_sensors": config_entry.options.get(
+            "diagnostic_sensors",
+            config_entry.data.get("diagnostic_sensors", False)
+        ),
+        "reminders": config_entry.options.get(
+            "reminders",
+            config_entry.data.get("reminders", "")
+        ),
+        "refresh_on_read": config_entry.options.get(
+            "refresh_on_read",
+            config_entry.data.get("refresh_on_read", 0)
+        ),
     }
     return defaults
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""On-demand profiling of a single refresh for UK Bin Collection Data.
+
+The ``profile_refresh`` service hands a ``RefreshProfile`` to the entry's
+coordinator, which runs its next scrape under ``cProfile`` on the worker
+thread, optionally with ``tracemalloc``. Scheduled refreshes never see a
+profile: it is claimed by exactly one scrape and only when requested.
+
+The results are written as a ``pstats`` file and as collapsed stacks that
+flamegraph.pl, speedscope and similar tools read directly. ``cProfile``
+only records caller/callee pairs, so the collapsed stacks share each
+function's time among its callers in proportion to the time spent under
+each of them.
+"""
+
+import cProfile
+import os
+import pstats
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from .const import PROFILE_TOP_ALLOCATIONS, PROFILE_TOP_FUNCTIONS
+
+# Stacks deeper than this, or contributing under a microsecond, are dropped
+MAX_STACK_DEPTH = 200
+MIN_STACK_MICROSECONDS = 1
+
+_MEMORY_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+def _label(func: Tuple[str, int, str]) -> str:
+    """Return a flamegraph frame label for a pstats function key."""
+    filename, line, name = func
+    if filename == "~":
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    # ';' separates frames and a space separates the count
+    return label.replace(";", ",").replace(" ", "_")
+
+
+def collapsed_stacks(stats: Dict) -> List[str]:
+    """Return ``pstats`` data as collapsed stack lines in microseconds."""
+    callees: Dict[tuple, Dict[tuple, float]] = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    totals: Counter = Counter()
+
+    def walk(func, path: tuple, visiting: frozenset, share: float) -> None:
+        _, _, self_time, cumulative, _ = stats[func]
+        path = path + (_label(func),)
+        self_us = self_time * share * 1_000_000
+        if self_us >= MIN_STACK_MICROSECONDS:
+            totals[";".join(path)] += self_us
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        visiting = visiting | {func}
+        for callee, edge_time in callees.get(func, {}).items():
+            callee_total = stats[callee][3]
+            if callee in visiting or callee_total <= 0:
+                continue
+            if edge_time * share * 1_000_000 < MIN_STACK_MICROSECONDS:
+                continue
+            walk(callee, path, visiting, share * edge_time / callee_total)
+
+    for func, (_, _, _, _, callers) in stats.items():
+        if not callers:
+            walk(func, (), frozenset(), 1.0)
+
+    return [f"{stack} {round(value)}" for stack, value in sorted(totals.items())]
+
+
+class RefreshProfile:
+    """Profile of the scrape of one refresh."""
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        """Prepare a profile, optionally tracing memory allocations too."""
+        self.trace_memory = trace_memory
+        self.profiler = cProfile.Profile()
+        self.ran = False
+        self.peak_memory: Optional[int] = None
+        self.top_allocations: List[dict] = []
+
+    def runcall(self, func):
+        """Run ``func`` under the profiler; called on the worker thread."""
+        self.ran = True
+        started_tracing = False
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started_tracing = True
+        try:
+            return self.profiler.runcall(func)
+        finally:
+            if self.trace_memory:
+                self._record_memory()
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def _record_memory(self) -> None:
+        """Keep the allocation peak and the largest allocation sites."""
+        _, self.peak_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+        self.top_allocations = [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size": stat.size,
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics("lineno")[:PROFILE_TOP_ALLOCATIONS]
+        ]
+
+    def summary(self) -> dict:
+        """Return the slowest functions and memory figures as JSON-ready data."""
+        stats = pstats.Stats(self.profiler).stats
+        slowest = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)
+        top_functions = [
+            {
+                "function": pstats.func_std_string(func),
+                "calls": calls,
+                "total_time": round(self_time, 6),
+                "cumulative_time": round(cumulative, 6),
+            }
+            for func, (_, calls, self_time, cumulative, _) in slowest[
+                :PROFILE_TOP_FUNCTIONS
+            ]
+        ]
+        summary = {"top_functions": top_functions}
+        if self.trace_memory:
+            summary["peak_memory"] = self.peak_memory
+            summary["top_allocations"] = self.top_allocations
+        return summary
+
+    def write(self, directory: str, basename: str) -> Tuple[str, str]:
+        """Write the pstats and collapsed stack files; return their paths."""
+        os.makedirs(directory, exist_ok=True)
+        stats_path = os.path.join(directory, f"{basename}.prof")
+        collapsed_path = os.path.join(directory, f"{basename}.collapsed")
+        self.profiler.dump_stats(stats_path)
+        lines = collapsed_stacks(pstats.Stats(self.profiler).stats)
+        with open(collapsed_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        return stats_path, collapsed_path
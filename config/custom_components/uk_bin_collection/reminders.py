@@ -0,0 +1,269 @@
+"""Collection reminders for UK Bin Collection Data.
+
+Entries configure reminders such as ``1 19:00, 0 07:00``: the evening
+before and the morning of each collection. A single ``ReminderScheduler``
+stored in ``hass.data[DOMAIN]`` keeps every upcoming reminder of every entry
+in one heap ordered by fire time, with one armed timer for the integration,
+and fires a ``uk_bin_collection_reminder`` event for each reminder exactly
+once. When a refresh changes an entry's schedule only the reminders that
+differ are queued or dropped; superseded heap items are discarded lazily.
+"""
+
+import heapq
+import logging
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .calendar import collection_dates
+from .const import (
+    DOMAIN,
+    EVENT_REMINDER,
+    LOG_PREFIX,
+    REMINDERS,
+    SIGNAL_REMINDER_FIRED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_REMINDER = re.compile(r"^(\d{1,2})\s+([01]?\d|2[0-3]):([0-5]\d)$")
+
+# (entry_id, bin_type, collection date, days before, time of day)
+ReminderKey = Tuple[str, str, date, int, time]
+
+
+def parse_reminders(text: str) -> List[Tuple[int, time]]:
+    """Parse ``"1 19:00, 0 07:00"`` into ``(days before, time)`` pairs.
+
+    Raises ValueError for anything that is not a comma-separated list of
+    days before the collection followed by a 24 hour local time.
+    """
+    reminders = []
+    for part in (text or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        match = _REMINDER.match(part)
+        if match is None:
+            raise ValueError(f"Invalid reminder: {part!r}")
+        days, hour, minute = (int(group) for group in match.groups())
+        reminder = (days, time(hour, minute))
+        if reminder not in reminders:
+            reminders.append(reminder)
+    return reminders
+
+
+def is_valid_reminders(text: str) -> bool:
+    """Return True if ``text`` is a valid reminders option."""
+    try:
+        parse_reminders(text)
+    except ValueError:
+        return False
+    return True
+
+
+def async_get_reminders(hass: HomeAssistant) -> "ReminderScheduler":
+    """Return the integration-wide reminder scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get(REMINDERS)
+    if scheduler is None:
+        scheduler = ReminderScheduler(hass)
+        domain_data[REMINDERS] = scheduler
+    return scheduler
+
+
+class _TrackedEntry:
+    """Reminder state the scheduler keeps for one entry."""
+
+    __slots__ = ("coordinator", "reminders", "generation", "data", "keys", "unsubscribe")
+
+    def __init__(self, coordinator, reminders: List[Tuple[int, time]]):
+        self.coordinator = coordinator
+        self.reminders = reminders
+        self.generation: Optional[int] = None
+        self.data: Optional[dict] = None
+        self.keys: Set[ReminderKey] = set()
+        self.unsubscribe: Optional[CALLBACK_TYPE] = None
+
+
+class ReminderScheduler:
+    """Fire each entry's collection reminders from one heap and one timer."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the scheduler."""
+        self.hass = hass
+        self._entries: Dict[str, _TrackedEntry] = {}
+        self._heap: List[Tuple[datetime, ReminderKey]] = []
+        # Queued reminders with their fire time and projected flag
+        self._pending: Dict[ReminderKey, Tuple[datetime, bool]] = {}
+        self._fired: Set[ReminderKey] = set()
+        self._timer: Optional[CALLBACK_TYPE] = None
+        self._timer_due: Optional[datetime] = None
+
+    @property
+    def pending(self) -> List[Tuple[datetime, ReminderKey]]:
+        """Return the queued reminders in fire order."""
+        return sorted((due, key) for key, (due, _) in self._pending.items())
+
+    @callback
+    def async_track(
+        self, entry_id: str, coordinator, reminders: List[Tuple[int, time]]
+    ) -> None:
+        """Start, or replace, the reminders of one entry."""
+        self.async_untrack(entry_id)
+        if not reminders:
+            return
+        tracked = _TrackedEntry(coordinator, reminders)
+        self._entries[entry_id] = tracked
+        tracked.unsubscribe = coordinator.async_add_listener(
+            lambda: self._async_sync(entry_id)
+        )
+        self._async_sync(entry_id)
+
+    @callback
+    def async_untrack(self, entry_id: str) -> None:
+        """Drop the reminders of one entry."""
+        tracked = self._entries.pop(entry_id, None)
+        if tracked is None:
+            return
+        if tracked.unsubscribe is not None:
+            tracked.unsubscribe()
+        for key in tracked.keys:
+            self._pending.pop(key, None)
+        self._arm_timer()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the timer and drop all reminders."""
+        for entry_id in list(self._entries):
+            self.async_untrack(entry_id)
+        self._cancel_timer()
+        self._heap.clear()
+
+    def _wanted(self, entry_id: str, tracked: _TrackedEntry) -> Dict[ReminderKey, Tuple[datetime, bool]]:
+        """Return every reminder the entry's current schedule calls for."""
+        coordinator = tracked.coordinator
+        wanted = {}
+        for bin_type in coordinator.data or {}:
+            for day, projected in collection_dates(coordinator, bin_type):
+                for days_before, at in tracked.reminders:
+                    fire_at = dt_util.as_utc(
+                        datetime.combine(
+                            day - timedelta(days=days_before),
+                            at,
+                            tzinfo=dt_util.DEFAULT_TIME_ZONE,
+                        )
+                    )
+                    wanted[(entry_id, bin_type, day, days_before, at)] = (
+                        fire_at,
+                        projected,
+                    )
+        return wanted
+
+    @callback
+    def _async_sync(self, entry_id: str) -> None:
+        """Queue and drop reminders after the entry's schedule changed."""
+        tracked = self._entries.get(entry_id)
+        if tracked is None:
+            return
+        coordinator = tracked.coordinator
+        if (
+            coordinator.schedule_generation == tracked.generation
+            and coordinator.data == tracked.data
+        ):
+            return
+        tracked.generation = coordinator.schedule_generation
+        tracked.data = dict(coordinator.data or {})
+
+        wanted = self._wanted(entry_id, tracked)
+        for key in tracked.keys - wanted.keys():
+            self._pending.pop(key, None)
+
+        now = dt_util.utcnow()
+        today = dt_util.now().date()
+        self._fired = {key for key in self._fired if key[2] >= today}
+        for key, (fire_at, projected) in wanted.items():
+            # Reminders already sent or already past are never (re)sent
+            if key in self._fired or fire_at <= now:
+                continue
+            if self._pending.get(key) == (fire_at, projected):
+                continue
+            self._pending[key] = (fire_at, projected)
+            heapq.heappush(self._heap, (fire_at, key))
+        tracked.keys = set(wanted)
+        self._arm_timer()
+
+    def _is_current(self, item: Tuple[datetime, ReminderKey]) -> bool:
+        """Return True if a heap item is still a queued reminder."""
+        fire_at, key = item
+        pending = self._pending.get(key)
+        return pending is not None and pending[0] == fire_at
+
+    def _arm_timer(self) -> None:
+        """Point the single timer at the earliest queued reminder."""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        next_due = self._heap[0][0] if self._heap else None
+        if next_due == self._timer_due:
+            return
+
+        self._cancel_timer()
+        if next_due is not None:
+            self._timer_due = next_due
+            self._timer = async_track_point_in_utc_time(
+                self.hass, self._async_handle_timer, next_due
+            )
+
+    def _cancel_timer(self) -> None:
+        """Cancel the armed timer, if any."""
+        if self._timer is not None:
+            self._timer()
+        self._timer = None
+        self._timer_due = None
+
+    @callback
+    def _async_handle_timer(self, now: datetime) -> None:
+        """Fire every reminder that has fallen due."""
+        self._timer = None
+        self._timer_due = None
+
+        fired = set()
+        while self._heap and self._heap[0][0] <= now:
+            item = heapq.heappop(self._heap)
+            if not self._is_current(item):
+                continue
+            key = item[1]
+            _, projected = self._pending.pop(key)
+            self._fired.add(key)
+            entry_id, bin_type, day, days_before, at = key
+            fired.add(entry_id)
+            tracked = self._entries.get(entry_id)
+            self.hass.bus.async_fire(
+                EVENT_REMINDER,
+                {
+                    "entry_id": entry_id,
+                    "name": tracked.coordinator.name if tracked else None,
+                    "bin_type": bin_type,
+                    "collection_date": day.isoformat(),
+                    "days_before": days_before,
+                    "time": at.strftime("%H:%M"),
+                    "projected": projected,
+                },
+            )
+            _LOGGER.debug(
+                "%s Reminder fired for %s %s on %s",
+                LOG_PREFIX,
+                entry_id,
+                bin_type,
+                day,
+            )
+
+        for entry_id in fired:
+            async_dispatcher_send(self.hass, SIGNAL_REMINDER_FIRED.format(entry_id))
+        self._arm_timer()
@@ -1,17 +1,27 @@
 """Support for UK Bin Collection Data sensors."""
 
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+import heapq
 import json
 import logging
 import asyncio
-from typing import Any, Dict
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 from json import JSONDecodeError
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -22,13 +32,34 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
+    DATA_AGE_UPDATE_INTERVAL,
     DOMAIN,
     LOG_PREFIX,
     STATE_ATTR_DAYS,
     STATE_ATTR_NEXT_COLLECTION,
     DEVICE_CLASS,
     STATE_ATTR_COLOUR,
+    STATE_ATTR_PROJECTED,
+    STATE_ATTR_BIN_TYPE,
+    STATE_ATTR_NEXT_COLLECTION_DATE,
+    STATE_ATTR_LAST_FETCH,
+    STATE_ATTR_RAW_DATA,
     PLATFORMS,
+    NEXT_COLLECTIONS_COUNT,
+    SIGNAL_COORDINATOR_REGISTERED,
+    SIGNAL_COORDINATOR_UNREGISTERED,
+    SIGNAL_ICON_COLOR_MAPPING_UPDATED,
+    STATE_ATTR_COLLECTIONS,
+)
+from .calendar import collection_dates
+from .hub import async_get_hub
+from .lifecycle import BinEntityTracker
+from .utils import (
+    async_track_day_change,
+    data_hash,
+    entry_coordinators,
+    entry_device_info,
+    get_entry_config,
 )
 from uk_bin_collection.uk_bin_collection.collect_data import UKBinCollectionApp
 
@@ -43,51 +74,130 @@ async def async_setup_entry(
     """Set up the UK Bin Collection Data sensor platform."""
     _LOGGER.info(f"{LOG_PREFIX} Setting up UK Bin Collection Data platform.")
 
-    # Retrieve the coordinator from hass.data
-    coordinator: DataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id][
-        "coordinator"
-    ]
+    config = get_entry_config(config_entry)
+    compact = config.get("compact_entities", False)
 
-    # Get icon_color_mapping from config
-    icon_color_mapping = config_entry.data.get("icon_color_mapping", "{}")
+    # One coordinator per address; a multi-address entry has several
+    entities = []
+    trackers = []
+    for address_id, coordinator in entry_coordinators(
+        hass, config_entry.entry_id
+    ).items():
+
+        def bin_entities(
+            bin_type: str, coordinator=coordinator, address_id=address_id
+        ) -> list:
+            # Read the mapping per call so bins added later use the current option
+            icon_color_map = load_icon_color_mapping(
+                get_entry_config(config_entry).get("icon_color_mapping", "{}")
+            )
+            return create_bin_entities(
+                coordinator, address_id, bin_type, icon_color_map, compact
+            )
 
-    # Create sensor entities
-    entities = create_sensor_entities(
-        coordinator, config_entry.entry_id, icon_color_mapping
-    )
+        # Bin types appearing or disappearing later are handled by the tracker
+        tracker = BinEntityTracker(
+            hass, coordinator, address_id, async_add_entities, bin_entities
+        )
+        trackers.append(tracker)
+        entities.extend(tracker.create(coordinator.data))
+        if not compact:
+            entities.append(
+                UKBinCollectionRawJSONSensor(
+                    coordinator, f"{address_id}_raw_json", address_id
+                )
+            )
+
+        if config.get("diagnostic_sensors", False):
+            entities.extend(
+                UKBinCollectionDiagnosticSensor(coordinator, address_id, diagnostic)
+                for diagnostic in DIAGNOSTIC_SENSORS
+            )
 
     # Register all sensor entities with Home Assistant
     async_add_entities(entities)
+    for tracker in trackers:
+        config_entry.async_on_unload(tracker.async_start())
+
+    @callback
+    def _async_icon_color_mapping_updated(icon_color_mapping: str) -> None:
+        """Restyle the bin sensors after the mapping option changed."""
+        icon_color_map = load_icon_color_mapping(icon_color_mapping)
+        for tracker in trackers:
+            for entity in tracker.entities:
+                entity.set_icon_color_mapping(icon_color_map)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_ICON_COLOR_MAPPING_UPDATED.format(config_entry.entry_id),
+            _async_icon_color_mapping_updated,
+        )
+    )
 
 
-def create_sensor_entities(coordinator, entry_id, icon_color_mapping):
-    """Create sensor entities based on coordinator data."""
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: dict,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: Optional[dict] = None,
+) -> None:
+    """Set up the integration-wide next collections sensor."""
+    if discovery_info is None:
+        return
+    async_add_entities([UKBinCollectionNextCollectionsSensor(hass)])
+
+
+def create_bin_entities(
+    coordinator, entry_id, bin_type, icon_color_map, compact=False
+) -> list:
+    """Create the sensor entities of one bin type."""
+    if compact:
+        return [
+            UKBinCollectionCompactSensor(coordinator, bin_type, entry_id, icon_color_map)
+        ]
+
+    device_id = f"{entry_id}_{bin_type}"
+
+    # Main bin sensor
+    entities = [
+        UKBinCollectionDataSensor(coordinator, bin_type, device_id, icon_color_map)
+    ]
+
+    # Attribute sensors
+    attributes = [
+        "Colour",
+        "Next Collection Human Readable",
+        "Days Until Collection",
+        "Bin Type",
+        "Next Collection Date",
+    ]
+    for attr in attributes:
+        unique_id = f"{device_id}_{attr.lower().replace(' ', '_')}"
+        entities.append(
+            UKBinCollectionAttributeSensor(
+                coordinator, bin_type, unique_id, attr, device_id, icon_color_map
+            )
+        )
+    return entities
+
+
+def create_sensor_entities(coordinator, entry_id, icon_color_mapping, compact=False):
+    """Create sensor entities based on coordinator data.
+
+    In compact mode each bin gets a single sensor carrying every value as a
+    typed attribute, grouped under one device for the whole entry.
+    """
     entities = []
     icon_color_map = load_icon_color_mapping(icon_color_mapping)
 
     for bin_type in coordinator.data.keys():
-        device_id = f"{entry_id}_{bin_type}"
-
-        # Main bin sensor
-        entities.append(
-            UKBinCollectionDataSensor(coordinator, bin_type, device_id, icon_color_map)
+        entities.extend(
+            create_bin_entities(coordinator, entry_id, bin_type, icon_color_map, compact)
         )
 
-        # Attribute sensors
-        attributes = [
-            "Colour",
-            "Next Collection Human Readable",
-            "Days Until Collection",
-            "Bin Type",
-            "Next Collection Date",
-        ]
-        for attr in attributes:
-            unique_id = f"{device_id}_{attr.lower().replace(' ', '_')}"
-            entities.append(
-                UKBinCollectionAttributeSensor(
-                    coordinator, bin_type, unique_id, attr, device_id, icon_color_map
-                )
-            )
+    if compact:
+        return entities
 
     # Add the Raw JSON Sensor
     entities.append(
@@ -112,6 +222,8 @@ class UKBinCollectionDataSensor(CoordinatorEntity, SensorEntity):
     """Sensor entity for individual bin collection data."""
 
     _attr_device_class = DEVICE_CLASS
+    # Colour is fixed by configuration and days follows from the state
+    _unrecorded_attributes = frozenset({STATE_ATTR_COLOUR, STATE_ATTR_DAYS})
 
     def __init__(
         self,
@@ -177,6 +289,16 @@ class UKBinCollectionDataSensor(CoordinatorEntity, SensorEntity):
             day_label = "day" if self._days == 1 else "days"
             return f"In {self._days} {day_label}"
 
+    def set_icon_color_mapping(self, icon_color_mapping: Dict[str, Any]) -> None:
+        """Apply a new icon and colour mapping without refreshing."""
+        self._icon_color_mapping = icon_color_mapping
+        icon, color = self.get_icon(), self.get_color()
+        if (icon, color) == (self._icon, self._color):
+            return
+        self._icon, self._color = icon, color
+        if self.hass is not None:
+            self.async_write_ha_state()
+
     def get_icon(self) -> str:
         """Return the icon based on bin type or mapping."""
         return self._icon_color_mapping.get(self._bin_type, {}).get(
@@ -218,7 +340,7 @@ class UKBinCollectionDataSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra state attributes for the sensor."""
-        return {
+        attributes = {
             STATE_ATTR_COLOUR: self._color,
             STATE_ATTR_NEXT_COLLECTION: (
                 self._next_collection.strftime("%d/%m/%Y")
@@ -227,6 +349,9 @@ class UKBinCollectionDataSensor(CoordinatorEntity, SensorEntity):
             ),
             STATE_ATTR_DAYS: self._days,
         }
+        if self._bin_type in self.coordinator.projected:
+            attributes[STATE_ATTR_PROJECTED] = True
+        return attributes
 
     @property
     def available(self) -> bool:
@@ -239,9 +364,47 @@ class UKBinCollectionDataSensor(CoordinatorEntity, SensorEntity):
         return self._device_id
 
 
+class UKBinCollectionCompactSensor(UKBinCollectionDataSensor):
+    """Single sensor per bin used in compact mode."""
+
+    _unrecorded_attributes = UKBinCollectionDataSensor._unrecorded_attributes | {
+        STATE_ATTR_BIN_TYPE,
+        STATE_ATTR_NEXT_COLLECTION_DATE,
+    }
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        bin_type: str,
+        entry_id: str,
+        icon_color_mapping: Dict[str, Any],
+    ) -> None:
+        """Initialize the compact bin sensor."""
+        self._entry_id = entry_id
+        super().__init__(
+            coordinator, bin_type, f"{entry_id}_{bin_type}", icon_color_mapping
+        )
+
+    @property
+    def device_info(self) -> dict:
+        """Return one device for every bin of the entry."""
+        return entry_device_info(self.coordinator, self._entry_id)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the values the attribute sensors would otherwise carry."""
+        attributes = super().extra_state_attributes
+        attributes[STATE_ATTR_BIN_TYPE] = self._bin_type
+        attributes[STATE_ATTR_NEXT_COLLECTION_DATE] = self._next_collection
+        return attributes
+
+
 class UKBinCollectionAttributeSensor(CoordinatorEntity, SensorEntity):
     """Sensor entity for additional attributes of a bin."""
 
+    # Repeated on every attribute sensor and already recorded by the bin sensor
+    _unrecorded_attributes = frozenset({STATE_ATTR_COLOUR, STATE_ATTR_NEXT_COLLECTION})
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -309,6 +472,16 @@ class UKBinCollectionAttributeSensor(CoordinatorEntity, SensorEntity):
             return -1
         return (bin_date - dt_util.now().date()).days
 
+    def set_icon_color_mapping(self, icon_color_mapping: Dict[str, Any]) -> None:
+        """Apply a new icon and colour mapping without refreshing."""
+        self._icon_color_mapping = icon_color_mapping
+        icon, color = self.get_icon(), self.get_color()
+        if (icon, color) == (self._icon, self._color):
+            return
+        self._icon, self._color = icon, color
+        if self.hass is not None:
+            self.async_write_ha_state()
+
     def get_icon(self) -> str:
         """Return the icon based on bin type or mapping."""
         return self._icon_color_mapping.get(self._bin_type, {}).get(
@@ -337,10 +510,13 @@ class UKBinCollectionAttributeSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return the extra state attributes."""
-        return {
+        attributes = {
             STATE_ATTR_COLOUR: self._color,
             STATE_ATTR_NEXT_COLLECTION: self.coordinator.data.get(self._bin_type),
         }
+        if self._bin_type in self.coordinator.projected:
+            attributes[STATE_ATTR_PROJECTED] = True
+        return attributes
 
     @property
     def device_info(self) -> dict:
@@ -364,8 +540,111 @@ class UKBinCollectionAttributeSensor(CoordinatorEntity, SensorEntity):
         return self.coordinator.last_update_success
 
 
+# Diagnostic sensor name -> (unit, device class, state class)
+DIAGNOSTIC_SENSORS = {
+    "Last Fetch Duration": (UnitOfTime.SECONDS, SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT),
+    "Fetch Latency P50": (UnitOfTime.SECONDS, SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT),
+    "Fetch Latency P95": (UnitOfTime.SECONDS, SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT),
+    "Queue Wait": (UnitOfTime.SECONDS, SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT),
+    "Consecutive Failures": (None, None, SensorStateClass.MEASUREMENT),
+    "Last Success": (None, SensorDeviceClass.TIMESTAMP, None),
+    "Data Age": (UnitOfTime.SECONDS, SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT),
+    "Cache Hits": (None, None, SensorStateClass.TOTAL_INCREASING),
+}
+
+
+class UKBinCollectionDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor exposing one of the coordinator's refresh statistics."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry_id: str,
+        diagnostic: str,
+    ) -> None:
+        """Initialize the diagnostic sensor."""
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+        self._diagnostic = diagnostic
+        self._attr_unique_id = (
+            f"{entry_id}_diagnostic_{diagnostic.lower().replace(' ', '_')}"
+        )
+        unit, device_class, state_class = DIAGNOSTIC_SENSORS[diagnostic]
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._attr_state_class = state_class
+
+    @property
+    def name(self) -> str:
+        """Return the name of the diagnostic sensor."""
+        return f"{self.coordinator.name} {self._diagnostic}"
+
+    @property
+    def native_value(self):
+        """Return the statistic this sensor reports."""
+        stats = self.coordinator.stats
+        if self._diagnostic == "Last Fetch Duration":
+            return _round_seconds(stats.last_duration)
+        elif self._diagnostic == "Fetch Latency P50":
+            return _round_seconds(stats.percentile(50))
+        elif self._diagnostic == "Fetch Latency P95":
+            return _round_seconds(stats.percentile(95))
+        elif self._diagnostic == "Queue Wait":
+            return _round_seconds(stats.last_queue_wait)
+        elif self._diagnostic == "Consecutive Failures":
+            return stats.consecutive_failures
+        elif self._diagnostic == "Last Success":
+            return stats.last_success
+        elif self._diagnostic == "Data Age":
+            age = stats.data_age(dt_util.now())
+            return int(age) if age is not None else None
+        elif self._diagnostic == "Cache Hits":
+            return stats.cache_hits
+        return None
+
+    @property
+    def available(self) -> bool:
+        """Diagnostics stay available while refreshes are failing."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Keep the data age moving between refreshes, and while they fail."""
+        await super().async_added_to_hass()
+        if self._diagnostic == "Data Age":
+            self.async_on_remove(
+                async_track_time_interval(
+                    self.hass, self._async_tick, DATA_AGE_UPDATE_INTERVAL
+                )
+            )
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Write the data age as of now."""
+        self.async_write_ha_state()
+
+    @property
+    def device_info(self) -> dict:
+        """Return the device of the whole entry."""
+        return entry_device_info(self.coordinator, self._entry_id)
+
+
+def _round_seconds(value):
+    """Round a duration in seconds to milliseconds."""
+    return round(value, 3) if value is not None else None
+
+
 class UKBinCollectionRawJSONSensor(CoordinatorEntity, SensorEntity):
-    """Sensor entity to hold the raw JSON data for bin collections."""
+    """Sensor entity identifying the current bin collection data.
+
+    The state is a short hash of the data and the recorded ``last_fetch``
+    attribute is when it was fetched; state is only written when either or
+    the availability changes. The full payload stays available as the
+    unrecorded ``raw_data`` attribute and from the ``get_schedule`` service.
+    """
+
+    _unrecorded_attributes = frozenset({STATE_ATTR_RAW_DATA})
 
     def __init__(
         self,
@@ -378,6 +657,7 @@ class UKBinCollectionRawJSONSensor(CoordinatorEntity, SensorEntity):
         self.coordinator = coordinator
         self._unique_id = unique_id
         self._name = f"{name} Raw JSON"
+        self._written = None
 
     @property
     def name(self) -> str:
@@ -386,14 +666,8 @@ class UKBinCollectionRawJSONSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def state(self) -> str:
-        """Return the raw JSON data as the state."""
-        if not self.coordinator.data:
-            return "{}"
-        data = {
-            bin_type: bin_date.strftime("%d/%m/%Y") if bin_date else None
-            for bin_type, bin_date in self.coordinator.data.items()
-        }
-        return json.dumps(data)
+        """Return a short hash of the current data as the state."""
+        return data_hash(self.coordinator.data)
 
     @property
     def unique_id(self) -> str:
@@ -402,10 +676,215 @@ class UKBinCollectionRawJSONSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Return the raw JSON data as an attribute."""
-        return {"raw_data": self.coordinator.data or {}}
+        """Return the raw data and when it was fetched."""
+        last_fetch = self.coordinator.last_fetch
+        return {
+            STATE_ATTR_RAW_DATA: self.coordinator.data or {},
+            STATE_ATTR_LAST_FETCH: last_fetch.isoformat() if last_fetch else None,
+        }
 
     @property
     def available(self) -> bool:
         """Return the availability of the raw JSON sensor."""
         return self.coordinator.last_update_success
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._written = self._write_key()
+
+    def _write_key(self) -> tuple:
+        """Return what a state write of this sensor records."""
+        return (
+            self.state,
+            self.available,
+            self.coordinator.last_fetch,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the data hash, fetch time or availability changed."""
+        written = self._write_key()
+        if written == self._written:
+            return
+        self._written = written
+        self.async_write_ha_state()
+
+
+class NextCollectionsIndex:
+    """Upcoming collections of every entry, merged by date when read.
+
+    Each source keeps its own date-sorted list, replaced only when that
+    source's schedule changes. Reading the next ``count`` collections is a
+    heap merge of the sources from ``today`` on, which touches ``count``
+    items plus one per source rather than every collection.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty index."""
+        self._sources: Dict[str, List[Tuple[date, str, bool]]] = {}
+
+    @property
+    def source_ids(self) -> List[str]:
+        """Return the sources currently in the index."""
+        return list(self._sources)
+
+    def update_source(self, source_id: str, collections: List[Tuple[date, str, bool]]) -> None:
+        """Replace one source's ``(date, bin_type, projected)`` collections."""
+        self._sources[source_id] = sorted(collections)
+
+    def remove_source(self, source_id: str) -> bool:
+        """Drop one source; return True if it was indexed."""
+        return self._sources.pop(source_id, None) is not None
+
+    def upcoming(self, today: date, count: int) -> List[Tuple[date, str, str, bool]]:
+        """Return the next ``count`` ``(date, source_id, bin_type, projected)``."""
+        streams = [
+            self._stream(source_id, collections, today)
+            for source_id, collections in self._sources.items()
+        ]
+        return list(islice(heapq.merge(*streams), count))
+
+    @staticmethod
+    def _stream(source_id: str, collections: List[Tuple[date, str, bool]], today: date):
+        """Yield one source's collections from ``today`` on, tagged with its id."""
+        for day, bin_type, projected in islice(
+            collections, bisect_left(collections, (today,)), None
+        ):
+            yield day, source_id, bin_type, projected
+
+
+class UKBinCollectionNextCollectionsSensor(SensorEntity):
+    """The next collections across every configured address."""
+
+    _attr_device_class = SensorDeviceClass.DATE
+    _attr_icon = "mdi:delete-clock"
+    _attr_name = "UK Bin Collection Next Collections"
+    _attr_should_poll = False
+    _attr_unique_id = f"{DOMAIN}_next_collections"
+    # The list is long and follows from the bin sensors already recorded
+    _unrecorded_attributes = frozenset({STATE_ATTR_COLLECTIONS})
+
+    def __init__(self, hass: HomeAssistant, count: int = NEXT_COLLECTIONS_COUNT) -> None:
+        """Initialize the aggregate sensor."""
+        self.hass = hass
+        self._count = count
+        self._index = NextCollectionsIndex()
+        self._coordinators: Dict[str, DataUpdateCoordinator] = {}
+        self._seen: Dict[str, Tuple[int, dict]] = {}
+        self._listeners: Dict[str, Any] = {}
+        self._upcoming: List[Tuple[date, str, str, bool]] = []
+
+    @property
+    def native_value(self) -> Optional[date]:
+        """Return the date of the next collection anywhere."""
+        return self._upcoming[0][0] if self._upcoming else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the next collections with their address and bin."""
+        return {
+            STATE_ATTR_COLLECTIONS: [
+                {
+                    "date": day.isoformat(),
+                    "entry_id": source_id,
+                    "name": self._coordinators[source_id].name,
+                    "bin_type": bin_type,
+                    "projected": projected,
+                }
+                for day, source_id, bin_type, projected in self._upcoming
+            ]
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Follow every entry, entries coming and going, and the date."""
+        for source_id in async_get_hub(self.hass).entry_ids:
+            self._attach(source_id)
+        self._recompute(write=False)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_COORDINATOR_REGISTERED, self._async_source_registered
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_COORDINATOR_UNREGISTERED,
+                self._async_source_unregistered,
+            )
+        )
+        self.async_on_remove(async_track_day_change(self.hass, self._recompute))
+        self.async_on_remove(self._detach_all)
+
+    def _attach(self, source_id: str) -> None:
+        """Start following the coordinator of ``source_id``."""
+        coordinator = async_get_hub(self.hass).coordinator(source_id)
+        if coordinator is None or self._coordinators.get(source_id) is coordinator:
+            return
+        self._detach(source_id)
+        self._coordinators[source_id] = coordinator
+        self._listeners[source_id] = coordinator.async_add_listener(
+            lambda: self._async_source_updated(source_id)
+        )
+        self._index_source(source_id)
+
+    def _detach(self, source_id: str) -> None:
+        """Stop following ``source_id`` and drop its collections."""
+        unsubscribe = self._listeners.pop(source_id, None)
+        if unsubscribe is not None:
+            unsubscribe()
+        self._coordinators.pop(source_id, None)
+        self._seen.pop(source_id, None)
+        self._index.remove_source(source_id)
+
+    @callback
+    def _detach_all(self) -> None:
+        """Stop following every source."""
+        for source_id in list(self._listeners):
+            self._detach(source_id)
+
+    def _index_source(self, source_id: str) -> bool:
+        """Re-index one source if its schedule changed; return True if it did."""
+        coordinator = self._coordinators[source_id]
+        seen = (coordinator.schedule_generation, dict(coordinator.data or {}))
+        if self._seen.get(source_id) == seen:
+            return False
+        self._seen[source_id] = seen
+        self._index.update_source(
+            source_id,
+            [
+                (day, bin_type, projected)
+                for bin_type in coordinator.data or {}
+                for day, projected in collection_dates(coordinator, bin_type)
+            ],
+        )
+        return True
+
+    @callback
+    def _recompute(self, write: bool = True) -> None:
+        """Re-read the next collections; write state if they changed."""
+        upcoming = self._index.upcoming(dt_util.now().date(), self._count)
+        if upcoming == self._upcoming:
+            return
+        self._upcoming = upcoming
+        if write:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_source_updated(self, source_id: str) -> None:
+        """Re-index a source after its coordinator refreshed."""
+        if source_id in self._coordinators and self._index_source(source_id):
+            self._recompute()
+
+    @callback
+    def _async_source_registered(self, source_id: str) -> None:
+        """Pick up an entry that was (re)loaded."""
+        self._attach(source_id)
+        self._recompute()
+
+    @callback
+    def _async_source_unregistered(self, source_id: str) -> None:
+        """Drop an entry that was unloaded."""
+        if source_id in self._coordinators:
+            self._detach(source_id)
+            self._recompute()
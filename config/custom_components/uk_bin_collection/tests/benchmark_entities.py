@@ -0,0 +1,139 @@
+"""Compare the cost of the full and compact entity modes.
+
+Builds the sensor and calendar entities for a number of entries in both
+modes and reports the entity and device counts, the memory held by the
+entities and their first state, the bytes the recorder would write for one
+refresh of every entry, and the time to create them.
+
+Run from the ``config`` directory:
+
+    python -m custom_components.uk_bin_collection.tests.benchmark_entities [entries] [bins]
+"""
+
+import asyncio
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from custom_components.uk_bin_collection.calendar import (
+    UKBinCollectionCalendar,
+    UKBinCollectionHouseholdCalendar,
+    calc_unique_calendar_id,
+)
+from custom_components.uk_bin_collection.hub import async_get_hub
+from custom_components.uk_bin_collection.sensor import create_sensor_entities
+
+BIN_TYPES = ["General Waste", "Recycling", "Garden Waste", "Food Waste", "Glass"]
+
+
+def make_coordinator(index, bins):
+    """Return a stand-in coordinator with a year of fortnightly collections."""
+    start = date.today() + timedelta(days=1)
+    schedule = {
+        bin_type: [start + timedelta(days=offset + 14 * week) for week in range(26)]
+        for offset, bin_type in enumerate(BIN_TYPES[:bins])
+    }
+    return SimpleNamespace(
+        name=f"Address {index}",
+        data={bin_type: dates[0] for bin_type, dates in schedule.items()},
+        schedule=schedule,
+        projected_dates={},
+        projected=set(),
+        schedule_generation=1,
+        last_update_success=True,
+        async_add_listener=lambda update: (lambda: None),
+    )
+
+
+def build_entities(hass, coordinators, compact):
+    """Create every entity both platforms would add for ``coordinators``."""
+    entities = []
+    for entry_id, coordinator in coordinators.items():
+        entities.extend(
+            create_sensor_entities(coordinator, entry_id, "", compact=compact)
+        )
+        if compact:
+            calendar = UKBinCollectionHouseholdCalendar(
+                hass, entry_id, [entry_id], f"{coordinator.name} Calendar"
+            )
+            asyncio.run(calendar.async_added_to_hass())
+            entities.append(calendar)
+        else:
+            for bin_type in coordinator.data:
+                entities.append(
+                    UKBinCollectionCalendar(
+                        coordinator,
+                        bin_type,
+                        calc_unique_calendar_id(entry_id, bin_type),
+                        f"{coordinator.name} {bin_type} Calendar",
+                    )
+                )
+    return entities
+
+
+def recorded_bytes(entities):
+    """Return the bytes of state and attributes written for one refresh."""
+    total = 0
+    for entity in entities:
+        attributes = getattr(entity, "state_attributes", None) or {}
+        attributes = {**attributes, **(entity.extra_state_attributes or {})}
+        total += len(str(entity.state)) + len(json.dumps(attributes, default=str))
+    return total
+
+
+def measure(entries, bins, compact):
+    """Return the cost figures of one mode."""
+    hass = SimpleNamespace(data={})
+    hub = async_get_hub(hass)
+    coordinators = {}
+    for index in range(entries):
+        entry_id = f"entry_{index}"
+        coordinators[entry_id] = make_coordinator(index, bins)
+        hub.async_register(entry_id, coordinators[entry_id], "host", None)
+
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    entities = build_entities(hass, coordinators, compact)
+    written = recorded_bytes(entities)
+    elapsed = time.perf_counter() - started
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    devices = set()
+    for entity in entities:
+        info = getattr(entity, "device_info", None) or getattr(
+            entity, "_attr_device_info", None
+        )
+        if info:
+            devices |= set(info["identifiers"])
+
+    return {
+        "entities": len(entities),
+        "devices": len(devices),
+        "memory_kib": memory / 1024,
+        "recorded_kib_per_refresh": written / 1024,
+        "startup_ms": elapsed * 1000,
+    }
+
+
+def main():
+    """Print the figures of both modes side by side."""
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    bins = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    full = measure(entries, bins, compact=False)
+    compact = measure(entries, bins, compact=True)
+
+    print(f"{entries} entries x {bins} bins")
+    print(f"{'':28}{'full':>12}{'compact':>12}{'saved':>9}")
+    for key in full:
+        saved = 1 - compact[key] / full[key] if full[key] else 0
+        print(f"{key:28}{full[key]:12.1f}{compact[key]:12.1f}{saved:9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Estimate how much one entry adds to the recorder database per month.
+
+Simulates a month of refreshes at the default 12 hour interval for one
+entry and counts what the recorder would store: a ``states`` row whenever an
+entity's state or any attribute changes, and a ``state_attributes`` row for
+every distinct set of recorded attributes (the recorder de-duplicates those
+by content). Attributes listed in ``_unrecorded_attributes`` still trigger a
+``states`` row when they change but are left out of ``state_attributes``.
+
+Run from the ``config`` directory:
+
+    python -m custom_components.uk_bin_collection.tests.benchmark_recorder [bins] [interval_hours]
+"""
+
+import json
+import sys
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+from freezegun import freeze_time
+
+from custom_components.uk_bin_collection.sensor import create_sensor_entities
+
+from .benchmark_entities import BIN_TYPES
+
+# Fixed per-row overhead of a states row (ids, timestamps, indexes), bytes
+STATES_ROW_OVERHEAD = 120
+ATTRIBUTES_ROW_OVERHEAD = 40
+
+
+def recorded(entity):
+    """Return the state, all attributes and the recorded attributes of ``entity``."""
+    attributes = dict(entity.extra_state_attributes or {})
+    everything = json.dumps(attributes, default=str, sort_keys=True)
+    for name in getattr(entity, "_unrecorded_attributes", frozenset()):
+        attributes.pop(name, None)
+    return (
+        str(entity.state),
+        everything,
+        json.dumps(attributes, default=str, sort_keys=True),
+    )
+
+
+def simulate(bins, interval_hours, compact):
+    """Return the rows and bytes one entry writes in 30 days."""
+    start = datetime(2025, 1, 1, 6, 0)
+    schedule = {
+        bin_type: [start.date() + timedelta(days=offset + 14 * week) for week in range(8)]
+        for offset, bin_type in enumerate(BIN_TYPES[:bins])
+    }
+    coordinator = SimpleNamespace(
+        name="Address",
+        data={},
+        schedule=schedule,
+        projected_dates={},
+        projected=set(),
+        schedule_generation=1,
+        last_update_success=True,
+        last_fetch=None,
+    )
+
+    entities = None
+    previous = {}
+    seen_attributes = set()
+    rows = attribute_rows = size = 0
+    refreshes = int(30 * 24 / interval_hours)
+    for refresh in range(refreshes):
+        now = start + timedelta(hours=interval_hours * refresh)
+        with freeze_time(now):
+            today = now.date()
+            coordinator.data = {
+                bin_type: next(day for day in dates if day >= today)
+                for bin_type, dates in schedule.items()
+            }
+            coordinator.last_fetch = now
+            if entities is None:
+                entities = create_sensor_entities(
+                    coordinator, "entry", "", compact=compact
+                )
+            for entity in entities:
+                if hasattr(entity, "update_state"):
+                    entity.update_state()
+                state, everything, attributes = recorded(entity)
+                if previous.get(entity.unique_id) == (state, everything):
+                    continue
+                previous[entity.unique_id] = (state, everything)
+                rows += 1
+                size += STATES_ROW_OVERHEAD + len(state)
+                if attributes not in seen_attributes:
+                    seen_attributes.add(attributes)
+                    attribute_rows += 1
+                    size += ATTRIBUTES_ROW_OVERHEAD + len(attributes)
+    return {
+        "states_rows": rows,
+        "attribute_rows": attribute_rows,
+        "kib_per_month": size / 1024,
+    }
+
+
+def main():
+    """Print the monthly growth of one entry in both entity modes."""
+    bins = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    interval_hours = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    print(f"1 entry x {bins} bins, refreshed every {interval_hours}h, 30 days")
+    for compact in (False, True):
+        figures = simulate(bins, interval_hours, compact)
+        mode = "compact" if compact else "full"
+        print(
+            f"{mode:8} {figures['states_rows']:6} states rows "
+            f"{figures['attribute_rows']:6} attribute rows "
+            f"{figures['kib_per_month']:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
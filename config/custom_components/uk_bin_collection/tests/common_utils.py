@@ -30,6 +30,17 @@ class MockConfigEntry:
         self.entry_id = entry_id or uuid.uuid4().hex
         self.version = version
         self.state = config_entries.ConfigEntryState.NOT_LOADED
+        self.update_listeners = []
+        self._on_unload = []
+
+    def add_update_listener(self, listener):
+        """Register an options update listener; return its remover."""
+        self.update_listeners.append(listener)
+        return lambda: self.update_listeners.remove(listener)
+
+    def async_on_unload(self, func):
+        """Record a callback to run when the entry unloads."""
+        self._on_unload.append(func)
 
     def add_to_hass(self, hass):
         """Add the mock config entry to Home Assistant."""
@@ -0,0 +1,126 @@
+"""Tests for scraping the addresses of a multi-address entry together."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.uk_bin_collection.address_group import AddressGroup
+from custom_components.uk_bin_collection.hub import RefreshHub
+
+
+@pytest.fixture
+def group_hass():
+    """Return a mock hass that runs background tasks and executor jobs."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.ensure_future(coro)
+    )
+
+    async def run_in_executor(job, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, job, *args)
+
+    hass.async_add_executor_job = run_in_executor
+    return hass
+
+
+def make_member(entry_id, job):
+    """Return a mock address coordinator whose scrape runs ``job``."""
+    member = MagicMock()
+    member.entry_id = entry_id
+    member.name = entry_id
+    member.refresh_in_progress = False
+    member.has_seed = False
+    member.claim_scrape_job = MagicMock(return_value=job)
+    member.async_refresh = AsyncMock()
+    return member
+
+
+def make_group(hass, members):
+    """Return a group of ``members`` on a hub whose job runner is watched."""
+    hub = RefreshHub(hass)
+    hub.async_run_job = AsyncMock(wraps=hub.async_run_job)
+    group = AddressGroup(hass, hub, "entry", "Flats", "bins.example", 10)
+    group.members = members
+    return group
+
+
+@pytest.mark.asyncio
+async def test_addresses_are_scraped_in_one_hub_job(group_hass):
+    """N addresses take one hub job, scraped one at a time, with their own results."""
+    lock = threading.Lock()
+    running = 0
+    most = 0
+
+    def scrape(raw):
+        def run():
+            nonlocal running, most
+            with lock:
+                running += 1
+                most = max(most, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            if raw is None:
+                raise ValueError("no such address")
+            return raw
+
+        return run
+
+    members = [make_member(f"flat_{index}", scrape(f"raw {index}")) for index in range(5)]
+    members.append(make_member("flat_broken", scrape(None)))
+    group = make_group(group_hass, members)
+
+    # Two addresses ask at once; both share the one batch
+    first, second = await asyncio.gather(
+        group.async_scrape(members[0], MagicMock()),
+        group.async_scrape(members[1], MagicMock()),
+    )
+    assert (first, second) == ("raw 0", "raw 1")
+    assert group.hub.async_run_job.call_count == 1
+    assert group.hub.async_run_job.call_args.args[0] == "bins.example"
+    assert most == 1
+
+    # The addresses that did not ask pick their results up themselves
+    await asyncio.sleep(0)
+    for member in members[2:]:
+        member.async_refresh.assert_called_once()
+    assert await group.async_scrape(members[4], MagicMock()) == "raw 4"
+    with pytest.raises(ValueError):
+        await group.async_scrape(members[5], MagicMock())
+    assert group.hub.async_run_job.call_count == 1
+
+    # One failed address does not count against the website
+    assert group.hub.host_backoff_until("bins.example") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_counts_against_the_website(group_hass):
+    """A batch in which every address failed backs the website off."""
+
+    def fail():
+        raise ConnectionError("down")
+
+    members = [make_member(f"flat_{index}", fail) for index in range(2)]
+    group = make_group(group_hass, members)
+
+    with pytest.raises(ConnectionError):
+        await group.async_scrape(members[0], MagicMock())
+    assert group.hub.host_backoff_until("bins.example") is not None
+
+
+@pytest.mark.asyncio
+async def test_seeded_addresses_are_left_out_of_the_batch(group_hass):
+    """An address with an unused seed is neither scraped nor refreshed by a batch."""
+    members = [make_member(f"flat_{index}", lambda: "raw") for index in range(2)]
+    members[1].has_seed = True
+    group = make_group(group_hass, members)
+
+    assert await group.async_scrape(members[0], MagicMock()) == "raw"
+    await asyncio.sleep(0)
+    members[1].claim_scrape_job.assert_not_called()
+    members[1].async_refresh.assert_not_called()
+    assert "flat_1" not in group._results
@@ -0,0 +1,55 @@
+"""Tests for the collection today/tomorrow binary sensors."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+from custom_components.uk_bin_collection.binary_sensor import (
+    UKBinCollectionBinBinarySensor,
+    UKBinCollectionEntryBinarySensor,
+)
+
+
+def make_coordinator():
+    """Return a stand-in coordinator with two bins."""
+    coordinator = MagicMock()
+    coordinator.name = "Home"
+    coordinator.data = {"Refuse": date(2024, 5, 2), "Recycling": date(2024, 5, 3)}
+    coordinator.schedule = {
+        "Refuse": [date(2024, 5, 2), date(2024, 5, 9)],
+        "Recycling": [date(2024, 5, 3)],
+    }
+    coordinator.projected_dates = {}
+    return coordinator
+
+
+def test_binary_sensors_follow_the_local_date(freezer):
+    """Sensors change at midnight and write state only when their value changes."""
+    freezer.move_to("2024-05-01 12:00")
+    coordinator = make_coordinator()
+    refuse_tomorrow = UKBinCollectionBinBinarySensor(
+        coordinator, "entry", "Refuse", "Tomorrow", 1
+    )
+    any_today = UKBinCollectionEntryBinarySensor(coordinator, "entry", "Today", 0)
+    any_tomorrow = UKBinCollectionEntryBinarySensor(coordinator, "entry", "Tomorrow", 1)
+
+    assert refuse_tomorrow.unique_id == "entry_Refuse_collection_tomorrow"
+    assert refuse_tomorrow.is_on
+    assert not any_today.is_on
+    assert any_tomorrow.extra_state_attributes == {"bin_types": ["Refuse"]}
+
+    for entity in (refuse_tomorrow, any_today, any_tomorrow):
+        entity.async_write_ha_state = MagicMock()
+
+    # A refresh that changes nothing writes nothing
+    any_today._handle_coordinator_update()
+    any_today.async_write_ha_state.assert_not_called()
+
+    freezer.move_to("2024-05-02 00:00:01")
+    for entity in (refuse_tomorrow, any_today, any_tomorrow):
+        entity._async_recompute()
+        entity.async_write_ha_state.assert_called_once()
+
+    assert not refuse_tomorrow.is_on
+    assert any_today.extra_state_attributes == {"bin_types": ["Refuse"]}
+    assert any_tomorrow.extra_state_attributes == {"bin_types": ["Recycling"]}
+
@@ -0,0 +1,193 @@
+"""Tests for importing addresses in bulk."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.uk_bin_collection import build_ukbcd_args
+from custom_components.uk_bin_collection.bulk_import import (
+    async_import_addresses,
+    check_row,
+    read_import_file,
+)
+from custom_components.uk_bin_collection.utils import address_configs, pop_seed
+
+COUNCILS = {
+    "CouncilUPRN": {"wiki_name": "Council UPRN", "uprn": "1", "url": "https://uprn.example"},
+    "CouncilDriver": {"wiki_name": "Council Driver", "postcode": "X", "web_driver": "http://selenium"},
+    "CouncilTemplate": {
+        "wiki_name": "Council Template",
+        "url": "https://template.example",
+        "wiki_command_url_override": "https://template.example/XXXX",
+    },
+}
+
+SCRAPE = json.dumps({"bins": [{"type": "Refuse", "collectionDate": "01/01/2099"}]})
+
+
+def test_read_import_file(tmp_path):
+    """CSV and YAML files give the same rows; empty CSV cells are dropped."""
+    csv_file = tmp_path / "bins.csv"
+    csv_file.write_text("name,council,uprn,url\nHome,CouncilUPRN,100012,\n")
+    yaml_file = tmp_path / "bins.yaml"
+    yaml_file.write_text("addresses:\n  - name: Home\n    council: CouncilUPRN\n    uprn: '100012'\n")
+
+    assert read_import_file(str(csv_file)) == [
+        {"name": "Home", "council": "CouncilUPRN", "uprn": "100012"}
+    ]
+    assert read_import_file(str(yaml_file)) == read_import_file(str(csv_file))
+    with pytest.raises(ValueError):
+        read_import_file(str(tmp_path / "bins.txt"))
+
+
+def test_check_row():
+    """Rows are matched to councils by key or name and need the council's fields."""
+    index = {"counciluprn": "CouncilUPRN", "council uprn": "CouncilUPRN",
+             "councildriver": "CouncilDriver", "counciltemplate": "CouncilTemplate"}
+
+    config, error = check_row(
+        {"name": "Home", "council": "council uprn", "uprn": 100012, "update_interval": "6"},
+        COUNCILS,
+        index,
+    )
+    assert error is None
+    assert config["council"] == "CouncilUPRN"
+    assert config["uprn"] == "100012"
+    assert config["url"] == "https://uprn.example"
+    assert config["update_interval"] == 6
+    assert config["manual_refresh_only"] is True
+
+    for row, message in (
+        ({"name": "Home", "council": "Nowhere"}, "Unknown council"),
+        ({"name": "Home", "council": "CouncilUPRN"}, "needs a uprn"),
+        ({"name": "Home", "council": "CouncilDriver", "postcode": "AB1 2CD"}, "needs a driver"),
+        ({"name": "Home", "council": "CouncilTemplate"}, "own url"),
+        ({"name": "Home", "council": "CouncilUPRN", "uprn": "1", "reminders": "soon"}, "reminders"),
+        ({"council": "CouncilUPRN"}, "name"),
+    ):
+        config, error = check_row(row, COUNCILS, index)
+        assert config is None
+        assert message in error
+
+
+@pytest.mark.asyncio
+async def test_import_addresses(hass):
+    """Valid rows are scraped at most max_parallel at a time and added with a seed."""
+    existing = MagicMock(data={"name": "Office", "council": "CouncilUPRN"}, options={})
+    # Moved to another address in the options flow
+    moved = MagicMock(
+        data={
+            "name": "Shop",
+            "council": "CouncilUPRN",
+            "url": "https://uprn.example",
+            "uprn": "6",
+        },
+        options={"uprn": "8"},
+    )
+    hass.config_entries.async_entries.return_value = [existing, moved]
+    hass.config_entries.flow.async_init = AsyncMock(
+        side_effect=lambda domain, context, data: {
+            "type": "create_entry",
+            "result": MagicMock(entry_id=f"id_{data['name']}"),
+        }
+    )
+    hass.data = {}
+
+    running = 0
+    most = 0
+
+    async def scrape(hass, args, timeout, host):
+        nonlocal running, most
+        assert host == "uprn.example"
+        running += 1
+        most = max(most, running)
+        await asyncio.sleep(0)
+        running -= 1
+        if "--uprn=999" in args:
+            raise TimeoutError()
+        return SCRAPE
+
+    rows = [
+        {"name": f"House {number}", "council": "CouncilUPRN", "uprn": str(number)}
+        for number in range(1, 5)
+    ]
+    rows += [
+        {"name": "Office", "council": "CouncilUPRN", "uprn": "5"},
+        {"name": "Broken", "council": "CouncilUPRN", "uprn": "999"},
+        {"name": "House 1", "council": "CouncilUPRN", "uprn": "1"},
+        {"name": "Shop front", "council": "CouncilUPRN", "uprn": "8"},
+        "not a row",
+    ]
+    with patch(
+        "custom_components.uk_bin_collection.bulk_import.async_get_council_list",
+        AsyncMock(return_value=COUNCILS),
+    ), patch(
+        "custom_components.uk_bin_collection.bulk_import.async_validate_address",
+        side_effect=scrape,
+    ), patch(
+        "custom_components.uk_bin_collection.bulk_import.store_seed"
+    ) as store_seed:
+        reports = await async_import_addresses(hass, rows, max_parallel=2)
+
+    assert [report["status"] for report in reports] == [
+        "created", "created", "created", "created",
+        "duplicate", "failed", "duplicate", "duplicate", "invalid",
+    ]
+    assert reports[0]["entry_id"] == "id_House 1"
+    assert reports[0]["collections"] == 1
+    assert most == 2
+    assert store_seed.call_count == 4
+    assert hass.config_entries.flow.async_init.call_count == 4
+    assert hass.config_entries.flow.async_init.call_args.kwargs["context"] == {
+        "source": "import"
+    }
+
+
+@pytest.mark.asyncio
+async def test_import_groups_rows_into_one_entry(hass):
+    """Rows sharing a group become one multi-address entry seeded per address."""
+    hass.config_entries.async_entries.return_value = []
+    hass.config_entries.flow.async_init = AsyncMock(
+        return_value={"type": "create_entry", "result": MagicMock(entry_id="id_flats")}
+    )
+    hass.data = {}
+
+    async def scrape(hass, args, timeout, host):
+        if "--uprn=3" in args:
+            raise TimeoutError()
+        return SCRAPE
+
+    rows = [
+        {"name": f"Flat {number}", "council": "CouncilUPRN", "uprn": str(number), "group": "Flats"}
+        for number in range(1, 4)
+    ]
+    rows.append(
+        {"name": "Shop", "council": "CouncilDriver", "postcode": "X", "driver": "http://s", "group": "Flats"}
+    )
+    with patch(
+        "custom_components.uk_bin_collection.bulk_import.async_get_council_list",
+        AsyncMock(return_value=COUNCILS),
+    ), patch(
+        "custom_components.uk_bin_collection.bulk_import.async_validate_address",
+        side_effect=scrape,
+    ):
+        reports = await async_import_addresses(hass, rows)
+
+    assert [report["status"] for report in reports] == [
+        "created", "created", "failed", "invalid",
+    ]
+    assert reports[0]["entry_id"] == reports[1]["entry_id"] == "id_flats"
+    assert "mixes councils" in reports[3]["error"]
+
+    hass.config_entries.flow.async_init.assert_awaited_once()
+    data = hass.config_entries.flow.async_init.call_args.kwargs["data"]
+    assert data["name"] == "Flats"
+    assert data["council"] == "CouncilUPRN"
+    assert [address["uprn"] for address in data["addresses"]] == ["1", "2"]
+    assert "uprn" not in data
+
+    # Setting the entry up reuses each address's scrape
+    for address in address_configs("id_flats", data).values():
+        assert pop_seed(hass, build_ukbcd_args(address))[0] == SCRAPE
@@ -7,16 +7,20 @@ from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime, date, timedelta
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from custom_components.uk_bin_collection import HouseholdBinCoordinator
 
-from custom_components.uk_bin_collection.const import DOMAIN
+from custom_components.uk_bin_collection.const import DOMAIN, PROJECTED_EVENT_DESCRIPTION
 from custom_components.uk_bin_collection.calendar import (
+    HouseholdEventIndex,
     UKBinCollectionCalendar,
+    UKBinCollectionHouseholdCalendar,
     async_setup_entry,
     async_unload_entry,
 )
 from homeassistant.components.calendar import CalendarEvent
 
+from custom_components.uk_bin_collection.hub import async_get_hub
+
 from .common_utils import MockConfigEntry
 
 pytest_plugins = ["freezegun"]
@@ -32,10 +36,13 @@ MOCK_COORDINATOR_DATA = {
 @pytest.fixture
 def mock_coordinator():
     """Fixture to create a mock DataUpdateCoordinator with sample data."""
-    coordinator = MagicMock(spec=DataUpdateCoordinator)
+    coordinator = MagicMock(spec=HouseholdBinCoordinator)
     coordinator.data = MOCK_COORDINATOR_DATA.copy()
     coordinator.name = "Test Council"
     coordinator.last_update_success = True
+    coordinator.schedule = {}
+    coordinator.projected_dates = {}
+    coordinator.schedule_generation = 0
     return coordinator
 
 
@@ -175,6 +182,28 @@ async def test_async_get_events_no_events_in_range(hass_instance, mock_coordinat
     assert events == []
 
 
+@pytest.mark.asyncio
+async def test_async_get_events_end_is_exclusive(hass_instance, mock_coordinator):
+    """A range ending at midnight leaves out the collection on the day it ends."""
+    mock_coordinator.data = {"Recycling": date(2024, 4, 25)}
+
+    calendar = UKBinCollectionCalendar(
+        coordinator=mock_coordinator,
+        bin_type="Recycling",
+        unique_id="test_entry_id_Recycling_calendar",
+        name="Test Council Recycling Calendar",
+    )
+
+    assert await calendar.async_get_events(
+        hass_instance, datetime(2024, 4, 24), datetime(2024, 4, 25)
+    ) == []
+    assert len(
+        await calendar.async_get_events(
+            hass_instance, datetime(2024, 4, 24), datetime(2024, 4, 25, 0, 1)
+        )
+    ) == 1
+
+
 def test_calendar_update_on_coordinator_change(hass_instance, mock_coordinator):
     """Test that the calendar entity updates when the coordinator's data changes."""
     collection_date_initial = date(2024, 4, 25)
@@ -267,7 +296,7 @@ async def test_async_setup_entry_creates_calendar_entities(
 async def test_async_setup_entry_handles_empty_data(hass_instance, mock_config_entry):
     """Test that async_setup_entry handles empty coordinator data gracefully."""
     # Mock an empty data coordinator
-    mock_coordinator = MagicMock(spec=DataUpdateCoordinator)
+    mock_coordinator = MagicMock(spec=HouseholdBinCoordinator)
     mock_coordinator.data = {}
     mock_coordinator.name = "Test Council"
     mock_coordinator.last_update_success = True
@@ -287,26 +316,6 @@ async def test_async_setup_entry_handles_empty_data(hass_instance, mock_config_e
         mock_calendar_cls.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_async_setup_entry_handles_coordinator_failure(
-    hass_instance, mock_config_entry
-):
-    """Test that async_setup_entry raises ConfigEntryNotReady on coordinator failure."""
-    mock_coordinator = MagicMock(spec=DataUpdateCoordinator)
-    mock_coordinator.async_config_entry_first_refresh.side_effect = Exception(
-        "Update failed"
-    )
-    mock_coordinator.name = "Test Council"
-
-    # Patch the hass.data to include the coordinator
-    hass_instance.data[DOMAIN][mock_config_entry.entry_id] = {
-        "coordinator": mock_coordinator,
-    }
-
-    with pytest.raises(Exception, match="Update failed"):
-        await async_setup_entry(hass_instance, mock_config_entry, lambda entities: None)
-
-
 @pytest.mark.asyncio
 async def test_async_unload_entry(hass_instance, mock_coordinator, mock_config_entry):
     """Test that async_unload_entry unloads calendar entities correctly."""
@@ -351,7 +360,7 @@ async def test_async_setup_entry_creates_no_calendar_entities_on_empty_data(
     hass_instance, mock_config_entry
 ):
     """Test that async_setup_entry does not create calendar entities when coordinator data is empty."""
-    mock_coordinator = MagicMock(spec=DataUpdateCoordinator)
+    mock_coordinator = MagicMock(spec=HouseholdBinCoordinator)
     mock_coordinator.data = {}
     mock_coordinator.name = "Test Council"
     mock_coordinator.last_update_success = True
@@ -372,45 +381,22 @@ async def test_async_setup_entry_creates_no_calendar_entities_on_empty_data(
 
 
 @pytest.mark.asyncio
-async def test_async_setup_entry_with_coordinator_failure(
-    hass_instance, mock_config_entry
-):
-    """Test that async_setup_entry handles coordinator failures gracefully."""
-    mock_coordinator = MagicMock(spec=DataUpdateCoordinator)
-    mock_coordinator.async_config_entry_first_refresh.side_effect = Exception(
-        "Update failed"
-    )
-    mock_coordinator.name = "Test Council"
-
-    # Patch the hass.data to include the coordinator
-    hass_instance.data[DOMAIN][mock_config_entry.entry_id] = {
-        "coordinator": mock_coordinator,
-    }
-
-    with pytest.raises(Exception, match="Update failed"):
-        await async_setup_entry(hass_instance, mock_config_entry, lambda entities: None)
-
-
-@pytest.mark.asyncio
-async def test_async_setup_entry_handles_coordinator_failure(
-    hass_instance, mock_config_entry
-):
-    """Test that async_setup_entry raises an exception when coordinator refresh fails."""
-    mock_coordinator = MagicMock(spec=DataUpdateCoordinator)
-    # Provide an empty data dictionary so that accessing .data does not fail immediately.
+async def test_async_setup_entry_does_not_refresh(hass_instance, mock_config_entry):
+    """The calendar platform reuses the data of the entry's first refresh."""
+    mock_coordinator = MagicMock(spec=HouseholdBinCoordinator)
     mock_coordinator.data = {}
     mock_coordinator.name = "Test Council"
-    # Make the refresh raise an exception.
-    mock_coordinator.async_config_entry_first_refresh = AsyncMock(
-        side_effect=Exception("Update failed")
-    )
+    mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+    mock_coordinator.async_refresh = AsyncMock()
 
     hass_instance.data[DOMAIN][mock_config_entry.entry_id] = {
         "coordinator": mock_coordinator
     }
 
-    with pytest.raises(Exception, match="Update failed"):
-        await async_setup_entry(hass_instance, mock_config_entry, lambda entities: None)
+    await async_setup_entry(hass_instance, mock_config_entry, lambda entities: None)
+
+    mock_coordinator.async_config_entry_first_refresh.assert_not_awaited()
+    mock_coordinator.async_refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -524,7 +510,7 @@ async def test_async_setup_entry_handles_coordinator_partial_data(
     hass_instance, mock_config_entry
 ):
     """Test that async_setup_entry creates calendar entities only for available data."""
-    mock_coordinator = MagicMock(spec=DataUpdateCoordinator)
+    mock_coordinator = MagicMock(spec=HouseholdBinCoordinator)
     mock_coordinator.data = {
         "Recycling": date(2024, 4, 25),
         "General Waste": None,  # No collection date
@@ -570,3 +556,188 @@ async def test_async_setup_entry_handles_coordinator_partial_data(
             ),
             name="Test Council Garden Waste Calendar",
         )
+
+
+@pytest.mark.asyncio
+async def test_async_get_events_month_view(hass_instance, mock_coordinator):
+    """A month range returns every known and projected collection."""
+    mock_coordinator.data = {"Recycling": date(2024, 4, 3)}
+    mock_coordinator.schedule = {"Recycling": [date(2024, 4, 3), date(2024, 4, 17)]}
+    mock_coordinator.projected_dates = {"Recycling": [date(2024, 5, 1), date(2024, 5, 15)]}
+
+    calendar = UKBinCollectionCalendar(
+        coordinator=mock_coordinator,
+        bin_type="Recycling",
+        unique_id="test_entry_id_Recycling_calendar",
+        name="Test Council Recycling Calendar",
+    )
+
+    events = await calendar.async_get_events(
+        hass_instance, datetime(2024, 4, 1), datetime(2024, 5, 5)
+    )
+
+    assert [event.start for event in events] == [
+        date(2024, 4, 3),
+        date(2024, 4, 17),
+        date(2024, 5, 1),
+    ]
+    assert events[0].description is None
+    assert events[2].description == PROJECTED_EVENT_DESCRIPTION
+    assert calendar.event is events[0]
+
+
+@pytest.mark.asyncio
+async def test_events_built_once_per_generation(hass_instance, mock_coordinator):
+    """Events are reused until the coordinator publishes a new schedule."""
+    mock_coordinator.data = {"Recycling": date(2024, 4, 3)}
+    mock_coordinator.schedule = {"Recycling": [date(2024, 4, 3), date(2024, 4, 17)]}
+
+    calendar = UKBinCollectionCalendar(
+        coordinator=mock_coordinator,
+        bin_type="Recycling",
+        unique_id="test_entry_id_Recycling_calendar",
+        name="Test Council Recycling Calendar",
+    )
+    start, end = datetime(2024, 4, 1), datetime(2024, 4, 30)
+
+    with patch.object(
+        calendar, "_create_calendar_event", wraps=calendar._create_calendar_event
+    ) as mock_create:
+        first = await calendar.async_get_events(hass_instance, start, end)
+        second = await calendar.async_get_events(hass_instance, start, end)
+        assert mock_create.call_count == 2
+        assert first[0] is second[0]
+
+        mock_coordinator.schedule = {"Recycling": [date(2024, 4, 3)]}
+        mock_coordinator.schedule_generation += 1
+        third = await calendar.async_get_events(hass_instance, start, end)
+
+    assert mock_create.call_count == 3
+    assert [event.start for event in third] == [date(2024, 4, 3)]
+
+
+def test_household_index_merges_same_day_collections():
+    """Bins of every source collected on one day become one event."""
+    index = HouseholdEventIndex("household")
+    index.update_source(
+        "home",
+        {
+            "Recycling": [(date(2024, 4, 3), False), (date(2024, 4, 17), True)],
+            "Food": [(date(2024, 4, 3), False), (date(2024, 4, 10), False)],
+        },
+    )
+    index.update_source("office", {"General Waste": [(date(2024, 4, 10), False)]}, "Office ")
+
+    events = index.events(date(2024, 4, 1), date(2024, 4, 30))
+    assert [(event.start, event.summary) for event in events] == [
+        (date(2024, 4, 3), "Food, Recycling Collection"),
+        (date(2024, 4, 10), "Food, Office General Waste Collection"),
+        (date(2024, 4, 17), "Recycling Collection"),
+    ]
+    assert events[2].description == f"{PROJECTED_EVENT_DESCRIPTION} (Recycling)"
+    assert index.next_event(date(2024, 4, 4)) is events[1]
+
+    # Only the days touched by an update are rebuilt
+    assert index.update_source("office", {"General Waste": [(date(2024, 4, 24), False)]}, "Office ")
+    updated = index.events(date(2024, 4, 1), date(2024, 4, 30))
+    assert updated[0] is events[0]
+    assert updated[1].summary == "Food Collection"
+    assert updated[3].start == date(2024, 4, 24)
+    assert not index.update_source("office", {"General Waste": [(date(2024, 4, 24), False)]}, "Office ")
+
+    index.remove_source("home")
+    assert [event.start for event in index.events(date(2024, 4, 1), date(2024, 4, 30))] == [
+        date(2024, 4, 24)
+    ]
+    assert index.source_ids == ["office"]
+
+
+@pytest.mark.asyncio
+async def test_household_calendar_follows_source_coordinators(
+    hass_instance, mock_coordinator
+):
+    """The household calendar indexes each entry and re-indexes on updates."""
+    mock_coordinator.data = {"Recycling": date(2024, 4, 3)}
+    other = MagicMock(spec=HouseholdBinCoordinator)
+    other.name = "Office"
+    other.data = {"Recycling": date(2024, 4, 3)}
+    other.schedule = {}
+    other.projected_dates = {}
+    listeners = {}
+    other.async_add_listener.side_effect = lambda update: listeners.setdefault(
+        "office", update
+    )
+
+    hub = async_get_hub(hass_instance)
+    hub.async_register("home", mock_coordinator, "host", None)
+    hub.async_register("office", other, "host", None)
+
+    calendar = UKBinCollectionHouseholdCalendar(
+        hass_instance, "home", ["home", "office", "missing"], "Home Household Calendar"
+    )
+    calendar.async_write_ha_state = MagicMock()
+    await calendar.async_added_to_hass()
+
+    start, end = datetime(2024, 4, 1), datetime(2024, 4, 30)
+    events = await calendar.async_get_events(hass_instance, start, end)
+    assert [event.summary for event in events] == ["Recycling, Office Recycling Collection"]
+    assert calendar.unique_id == "home_household_calendar"
+
+    other.data = {"Recycling": date(2024, 4, 10)}
+    listeners["office"]()
+    calendar.async_write_ha_state.assert_called_once()
+    events = await calendar.async_get_events(hass_instance, start, end)
+    assert [event.summary for event in events] == [
+        "Recycling Collection",
+        "Office Recycling Collection",
+    ]
+
+    calendar._async_source_unregistered("office")
+    events = await calendar.async_get_events(hass_instance, start, end)
+    assert [event.start for event in events] == [date(2024, 4, 3)]
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_adds_household_calendar(
+    hass_instance, mock_coordinator
+):
+    """Enabling the option adds one household calendar to the entry."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Test Name", "council": "Test Council"},
+        options={"household_calendar": True, "household_entries": ["other_entry"]},
+        entry_id="test_entry_id",
+    )
+    hass_instance.data[DOMAIN][config_entry.entry_id] = {"coordinator": mock_coordinator}
+    async_add_entities = MagicMock()
+
+    await async_setup_entry(hass_instance, config_entry, async_add_entities)
+
+    entities = async_add_entities.call_args[0][0]
+    household = [
+        entity for entity in entities if isinstance(entity, UKBinCollectionHouseholdCalendar)
+    ]
+    assert len(household) == 1
+    assert household[0].name == "Test Council Household Calendar"
+    assert household[0]._source_ids == ["test_entry_id", "other_entry"]
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_compact_mode(hass_instance, mock_coordinator):
+    """Compact mode adds one calendar for the entry instead of one per bin."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Test Name", "council": "Test Council", "compact_entities": True},
+        options={"household_entries": ["other_entry"]},
+        entry_id="test_entry_id",
+    )
+    hass_instance.data[DOMAIN][config_entry.entry_id] = {"coordinator": mock_coordinator}
+    async_add_entities = MagicMock()
+
+    await async_setup_entry(hass_instance, config_entry, async_add_entities)
+
+    entities = async_add_entities.call_args[0][0]
+    assert len(entities) == 1
+    assert isinstance(entities[0], UKBinCollectionHouseholdCalendar)
+    assert entities[0].name == "Test Council Calendar"
+    assert entities[0]._source_ids == ["test_entry_id"]
@@ -0,0 +1,40 @@
+"""Tests for UK Bin Collection diagnostics."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.uk_bin_collection import HouseholdBinCoordinator
+from custom_components.uk_bin_collection.const import DOMAIN
+from custom_components.uk_bin_collection.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.uk_bin_collection.hub import async_get_hub
+
+from .common_utils import MockConfigEntry
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_report_fetches_and_redact_address(hass):
+    """Diagnostics expose the fetch counter and hide the address."""
+    hass.data = {}
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "council": "TestCouncil", "uprn": "100", "postcode": "AB1 2CD"},
+        entry_id="entry",
+    )
+    coordinator = HouseholdBinCoordinator(hass, MagicMock(), "Home")
+    coordinator.data = {"Recycling": date(2024, 4, 3)}
+    coordinator.stats.record_fetch(2.0, 0.1)
+    async_get_hub(hass).async_register("entry", coordinator, "host", None)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["config"]["uprn"] == "**REDACTED**"
+    assert diagnostics["config"]["postcode"] == "**REDACTED**"
+    assert diagnostics["config"]["council"] == "TestCouncil"
+    assert diagnostics["coordinator"]["fetches"] == 1
+    assert diagnostics["coordinator"]["seeded"] is False
+    assert diagnostics["coordinator"]["bin_types"] == ["Recycling"]
+    assert diagnostics["stats"]["p50"] == 2.0
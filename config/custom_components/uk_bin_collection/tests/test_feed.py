@@ -0,0 +1,147 @@
+"""Tests for the UK Bin Collection iCalendar feed."""
+
+from datetime import date
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+from custom_components.uk_bin_collection import HouseholdBinCoordinator
+
+from custom_components.uk_bin_collection.const import FEED_URL
+from custom_components.uk_bin_collection.feed import (
+    BinCollectionFeedView,
+    fold_line,
+)
+from custom_components.uk_bin_collection.hub import async_get_hub
+
+
+def make_coordinator(name, data, schedule=None, projected=None):
+    """Return a mock coordinator holding ``data``."""
+    coordinator = MagicMock(spec=HouseholdBinCoordinator)
+    coordinator.name = name
+    coordinator.data = data
+    coordinator.schedule = schedule or {}
+    coordinator.projected_dates = projected or {}
+    coordinator.schedule_generation = 1
+    return coordinator
+
+
+@pytest.fixture
+def feed():
+    """Return a feed view over two registered entries."""
+    hass = MagicMock()
+    hass.data = {}
+    hub = async_get_hub(hass)
+    hub.async_register(
+        "home",
+        make_coordinator(
+            "Home",
+            {"Recycling": date(2024, 4, 3)},
+            schedule={"Recycling": [date(2024, 4, 3), date(2024, 4, 17)]},
+            projected={"Recycling": [date(2024, 5, 1)]},
+        ),
+        "host",
+        None,
+    )
+    hub.async_register(
+        "office", make_coordinator("Office", {"General Waste": date(2024, 4, 4)}), "host", None
+    )
+    return BinCollectionFeedView(hass)
+
+
+def test_fold_line():
+    """Long lines are folded at 75 octets with a leading space."""
+    folded = fold_line("SUMMARY:" + "x" * 100)
+    lines = folded.split("\r\n")
+    assert len(lines[0]) == 75
+    assert lines[1].startswith(" ")
+    assert "".join(line[1:] if index else line for index, line in enumerate(lines)) == (
+        "SUMMARY:" + "x" * 100
+    )
+
+
+@pytest.mark.asyncio
+async def test_entry_feed_and_conditional_requests(feed):
+    """An entry feed is rendered once and then answered with 304s."""
+    request = make_mocked_request("GET", f"{FEED_URL}/home")
+    response = await feed.get(request, "home")
+
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "text/calendar"
+    body = response.body.decode()
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert body.count("BEGIN:VEVENT") == 3
+    assert "DTSTART;VALUE=DATE:20240417" in body
+    assert "DESCRIPTION:Projected" in body
+
+    etag = response.headers["ETag"]
+    chunk = feed.chunk("home")
+    request = make_mocked_request(
+        "GET", f"{FEED_URL}/home", headers={"If-None-Match": etag}
+    )
+    assert (await feed.get(request, "home")).status == HTTPStatus.NOT_MODIFIED
+
+    request = make_mocked_request(
+        "GET",
+        f"{FEED_URL}/home",
+        headers={"If-Modified-Since": response.headers["Last-Modified"]},
+    )
+    assert (await feed.get(request, "home")).status == HTTPStatus.NOT_MODIFIED
+
+    # A new generation with identical events keeps the validators
+    coordinator = async_get_hub(feed.hass).coordinator("home")
+    coordinator.schedule_generation += 1
+    assert feed.chunk("home").events is chunk.events
+
+    coordinator.schedule = {"Recycling": [date(2024, 4, 3)]}
+    coordinator.schedule_generation += 1
+    response = await feed.get(
+        make_mocked_request("GET", f"{FEED_URL}/home", headers={"If-None-Match": etag}),
+        "home",
+    )
+    assert response.status == HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_unknown_entry_is_not_found(feed):
+    """Entries that are not loaded have no feed."""
+    response = await feed.get(make_mocked_request("GET", f"{FEED_URL}/x"), "missing")
+    assert response.status == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_all_entries_feed_is_streamed(feed):
+    """The all-entries feed writes each entry's cached events in turn."""
+    written = []
+
+    class Writer:
+        buffer_size = 0
+        output_size = 0
+
+        async def write_headers(self, status_line, headers):
+            pass
+
+        async def write(self, data):
+            written.append(bytes(data))
+
+        async def write_eof(self, data=b""):
+            written.append(bytes(data))
+
+        def enable_compression(self, *args, **kwargs):
+            pass
+
+        def enable_chunking(self):
+            pass
+
+    request = make_mocked_request("GET", FEED_URL, writer=Writer())
+    response = await feed.get(request)
+
+    assert response.status == HTTPStatus.OK
+    body = b"".join(written).decode()
+    assert body.startswith("BEGIN:VCALENDAR")
+    assert body.rstrip().endswith("END:VCALENDAR")
+    assert body.count("BEGIN:VEVENT") == 4
+    assert "SUMMARY:General Waste Collection" in body
+    assert feed.chunk("office").events in written
@@ -0,0 +1,251 @@
+"""Tests for the UK Bin Collection refresh hub."""
+
+import asyncio
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.uk_bin_collection.const import DOMAIN, HUB
+from custom_components.uk_bin_collection.hub import (
+    RefreshHub,
+    async_get_hub,
+    scrape_host,
+)
+
+
+@pytest.fixture
+def hub_hass():
+    """Return a mock hass that runs background tasks and executor jobs."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.ensure_future(coro)
+    )
+
+    async def run_in_executor(job, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, job, *args)
+
+    hass.async_add_executor_job = run_in_executor
+    return hass
+
+
+def make_coordinator(success=True):
+    """Return a mock coordinator whose refresh always succeeds or fails."""
+    coordinator = MagicMock()
+    coordinator.async_refresh = AsyncMock()
+    coordinator.last_update_success = success
+    return coordinator
+
+
+def test_scrape_host():
+    """Entries are grouped by URL host, falling back to the council."""
+    assert scrape_host({"url": "https://Bins.Example.gov.uk/x?y=1"}) == "bins.example.gov.uk"
+    assert scrape_host({"council": "TestCouncil", "url": ""}) == "TestCouncil"
+    assert (
+        scrape_host({"council": "Alias", "original_parser": "GooglePublicCalendarCouncil"})
+        == "GooglePublicCalendarCouncil"
+    )
+
+
+def test_async_get_hub_is_shared(hub_hass):
+    """Every caller gets the same hub stored in hass.data."""
+    hub = async_get_hub(hub_hass)
+    assert async_get_hub(hub_hass) is hub
+    assert hub_hass.data[DOMAIN][HUB] is hub
+
+
+def test_single_timer_for_many_entries(hub_hass):
+    """Registering hundreds of entries arms the timer only once."""
+    hub = RefreshHub(hub_hass)
+    with patch(
+        "custom_components.uk_bin_collection.hub.async_track_point_in_utc_time"
+    ) as mock_track:
+        for index in range(300):
+            hub.async_register(
+                f"entry_{index}", make_coordinator(), "host", timedelta(hours=12)
+            )
+
+    assert mock_track.call_count == 1
+    assert len(hub.entry_ids) == 300
+
+
+def test_manual_only_entry_is_not_scheduled(hub_hass):
+    """Entries without an interval never arm the timer."""
+    hub = RefreshHub(hub_hass)
+    with patch(
+        "custom_components.uk_bin_collection.hub.async_track_point_in_utc_time"
+    ) as mock_track:
+        hub.async_register("entry", make_coordinator(), "host", None)
+
+    mock_track.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unlisted_entry_is_scheduled_but_not_listed(hub_hass):
+    """A multi-address group is refreshed on schedule but is not an entry of its own."""
+    hub = RefreshHub(hub_hass)
+    group = make_coordinator()
+
+    with patch(
+        "custom_components.uk_bin_collection.hub.async_track_point_in_utc_time"
+    ), patch(
+        "custom_components.uk_bin_collection.hub.async_dispatcher_send"
+    ) as mock_send:
+        hub.async_register("address", make_coordinator(), "host", None)
+        hub.async_register("group", group, "host", timedelta(hours=1), listed=False)
+        hub._async_handle_timer(dt_util.utcnow() + timedelta(hours=1, minutes=1))
+        await asyncio.sleep(0)
+        hub.async_unregister("group")
+
+    group.async_refresh.assert_awaited_once()
+    assert hub.entry_ids == ["address"]
+    assert hub.coordinator("group") is None
+    assert [call.args[2] for call in mock_send.call_args_list] == ["address"]
+
+
+@pytest.mark.asyncio
+async def test_timer_refreshes_due_entries_and_reschedules(hub_hass):
+    """Due entries are refreshed and queued again one interval later."""
+    hub = RefreshHub(hub_hass)
+    early = make_coordinator()
+    late = make_coordinator()
+
+    with patch(
+        "custom_components.uk_bin_collection.hub.async_track_point_in_utc_time"
+    ):
+        hub.async_register("early", early, "host_a", timedelta(hours=1))
+        hub.async_register("late", late, "host_b", timedelta(hours=6))
+
+        hub._async_handle_timer(dt_util.utcnow() + timedelta(hours=1, minutes=1))
+        await asyncio.sleep(0)
+
+    early.async_refresh.assert_awaited_once()
+    late.async_refresh.assert_not_awaited()
+    next_due = hub._entries["early"].due - dt_util.utcnow()
+    assert timedelta(minutes=59) < next_due <= timedelta(hours=1)
+
+
+@pytest.mark.asyncio
+async def test_entries_on_one_host_are_refreshed_together(hub_hass):
+    """Entries on the due entry's host due within seconds join its batch; none run early."""
+    hub = RefreshHub(hub_hass)
+    due, soon, later, elsewhere = (make_coordinator() for _ in range(4))
+
+    with patch(
+        "custom_components.uk_bin_collection.hub.async_track_point_in_utc_time"
+    ):
+        now = dt_util.utcnow()
+        hub.async_register("due", due, "council", timedelta(hours=12), due=now)
+        hub.async_register("soon", soon, "council", timedelta(hours=12), due=now + timedelta(seconds=2))
+        hub.async_register("later", later, "council", timedelta(hours=12), due=now + timedelta(minutes=20))
+        hub.async_register("elsewhere", elsewhere, "other", timedelta(hours=12), due=now + timedelta(seconds=2))
+
+        hub._async_handle_timer(now)
+        await asyncio.sleep(0)
+
+        due.async_refresh.assert_awaited_once()
+        soon.async_refresh.assert_awaited_once()
+        later.async_refresh.assert_not_awaited()
+        elsewhere.async_refresh.assert_not_awaited()
+
+        # The batch is rescheduled together; its stale heap item is skipped
+        assert abs(hub._entries["soon"].due - hub._entries["due"].due) < timedelta(minutes=1)
+        hub._async_handle_timer(now + timedelta(minutes=25))
+        await asyncio.sleep(0)
+
+    soon.async_refresh.assert_awaited_once()
+    later.async_refresh.assert_awaited_once()
+    elsewhere.async_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unregistered_entry_is_not_refreshed(hub_hass):
+    """Heap items of removed entries are discarded when they fall due."""
+    hub = RefreshHub(hub_hass)
+    coordinator = make_coordinator()
+
+    with patch(
+        "custom_components.uk_bin_collection.hub.async_track_point_in_utc_time"
+    ):
+        hub.async_register("entry", coordinator, "host", timedelta(hours=1))
+        hub.async_register("other", make_coordinator(), "host", timedelta(hours=8))
+        hub.async_unregister("entry")
+
+        hub._async_handle_timer(dt_util.utcnow() + timedelta(hours=2))
+        await asyncio.sleep(0)
+
+    coordinator.async_refresh.assert_not_awaited()
+    assert hub.entry_ids == ["other"]
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency(hub_hass):
+    """Scrapes of the same host never overlap; other hosts run alongside."""
+    hub = RefreshHub(hub_hass, max_concurrent=4, max_per_host=1)
+    lock = threading.Lock()
+    running = {"shared": 0, "peak_shared": 0, "total": 0, "peak_total": 0}
+
+    def job(host):
+        def run():
+            with lock:
+                running["total"] += 1
+                running["peak_total"] = max(running["peak_total"], running["total"])
+                if host == "shared":
+                    running["shared"] += 1
+                    running["peak_shared"] = max(
+                        running["peak_shared"], running["shared"]
+                    )
+            time.sleep(0.02)
+            with lock:
+                running["total"] -= 1
+                if host == "shared":
+                    running["shared"] -= 1
+            return host
+
+        return run
+
+    hosts = ["shared", "shared", "shared", "other_a", "other_b"]
+    results = await asyncio.gather(
+        *(hub.async_run_job(host, job(host), timeout=5) for host in hosts)
+    )
+
+    assert results == hosts
+    assert running["peak_shared"] == 1
+    assert running["peak_total"] > 1
+    assert hub.in_flight == 0
+    assert hub.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_failure_backs_off_whole_host(hub_hass):
+    """A failed scrape defers other due entries on the same host."""
+    hub = RefreshHub(hub_hass)
+
+    def failing_job():
+        raise ValueError("council site down")
+
+    with pytest.raises(ValueError):
+        await hub.async_run_job("host", failing_job, timeout=5)
+
+    backoff_until = hub.host_backoff_until("host")
+    assert backoff_until is not None
+    assert hub.host_backoff("host") == timedelta(minutes=5)
+
+    coordinator = make_coordinator()
+    with patch(
+        "custom_components.uk_bin_collection.hub.async_track_point_in_utc_time"
+    ):
+        hub.async_register("entry", coordinator, "host", timedelta(minutes=1))
+        hub._async_handle_timer(dt_util.utcnow() + timedelta(minutes=2))
+        await asyncio.sleep(0)
+
+    coordinator.async_refresh.assert_not_awaited()
+    assert hub._entries["entry"].due == backoff_until
+
+    await hub.async_run_job("host", lambda: "ok", timeout=5)
+    assert hub.host_backoff_until("host") is None
+    assert hub.host_backoff("host") == timedelta(0)
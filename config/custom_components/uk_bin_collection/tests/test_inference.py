@@ -0,0 +1,75 @@
+"""Tests for UK Bin Collection schedule inference."""
+
+from datetime import date, timedelta
+
+from custom_components.uk_bin_collection.inference import ScheduleInference
+
+
+def fortnightly(start, count):
+    """Return ``count`` fortnightly dates from ``start``."""
+    return [start + timedelta(days=14 * index) for index in range(count)]
+
+
+def test_learns_fortnightly_cadence():
+    """Four fortnightly dates give a fully confident 14 day cadence."""
+    engine = ScheduleInference()
+    engine.observe({"Recycling": fortnightly(date(2024, 1, 3), 4)})
+
+    cadence = engine.cadence("Recycling")
+    assert cadence.period_days == 14
+    assert cadence.confidence == 1.0
+    assert engine.project("Recycling", date(2024, 2, 15), date(2024, 3, 20)) == [
+        date(2024, 2, 28),
+        date(2024, 3, 13),
+    ]
+
+
+def test_bank_holiday_slip_keeps_the_pattern():
+    """A one-off late collection lowers confidence but not the phase."""
+    dates = [date(2024, 12, 2) + timedelta(weeks=week) for week in range(6)]
+    dates[3] += timedelta(days=1)  # Boxing day slip
+    engine = ScheduleInference()
+    engine.observe({"General Waste": dates})
+
+    cadence = engine.cadence("General Waste")
+    assert cadence.period_days == 7
+    assert 0.6 < cadence.confidence < 1.0
+    assert engine.project("General Waste", date(2025, 1, 7), date(2025, 1, 14)) == [
+        date(2025, 1, 13)
+    ]
+
+
+def test_too_little_history_is_not_projected():
+    """Two dates are a guess, not a pattern."""
+    engine = ScheduleInference()
+    engine.observe({"Garden": [date(2024, 5, 1)]})
+    assert engine.cadence("Garden") is None
+
+    engine.observe({"Garden": [date(2024, 5, 15)]})
+    assert engine.cadence("Garden").confidence < 0.6
+    assert engine.projected_schedule(date(2024, 5, 16), date(2024, 7, 1)) == {}
+
+
+def test_history_accumulates_and_is_bounded():
+    """Repeated scrapes merge into a bounded, de-duplicated history."""
+    engine = ScheduleInference(history_limit=5)
+    dates = fortnightly(date(2024, 1, 3), 8)
+    engine.observe({"Recycling": dates[:4]})
+    engine.observe({"Recycling": dates[2:]})
+
+    assert engine.history("Recycling") == dates[-5:]
+    assert engine.bin_types == ["Recycling"]
+
+
+def test_matches_only_predicted_schedules():
+    """A scrape matches when every bin's next date lands on the pattern."""
+    engine = ScheduleInference()
+    engine.observe({"Recycling": fortnightly(date(2024, 1, 3), 4)})
+    today = date(2024, 2, 20)
+
+    assert engine.matches({"Recycling": [date(2024, 2, 28)]}, today)
+    assert not engine.matches({"Recycling": [date(2024, 2, 29)]}, today)
+    assert not engine.matches(
+        {"Recycling": [date(2024, 2, 28)], "Food": [date(2024, 2, 22)]}, today
+    )
+    assert not engine.matches({}, today)
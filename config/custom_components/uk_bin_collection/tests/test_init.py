@@ -1,12 +1,14 @@
 """Test UK Bin Collection integration initialization."""
 
+import asyncio
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch, call
 
 import pytest
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
 from homeassistant.util import dt as dt_util
 
 from custom_components.uk_bin_collection import (
@@ -14,10 +16,15 @@ from custom_components.uk_bin_collection import (
     async_setup_entry,
     async_unload_entry,
     async_migrate_entry,
+    async_remove_entry,
     build_ukbcd_args,
     HouseholdBinCoordinator
 )
-from custom_components.uk_bin_collection.const import DOMAIN, PLATFORMS
+from custom_components.uk_bin_collection.const import DOMAIN, HUB, PLATFORMS
+from custom_components.uk_bin_collection.hub import async_get_hub
+from custom_components.uk_bin_collection.reminders import async_get_reminders
+
+from custom_components.uk_bin_collection.utils import data_hash, pop_seed, store_seed
 
 from .common_utils import MockConfigEntry
 
@@ -52,9 +59,61 @@ async def test_async_setup(hass):
         assert DOMAIN in hass.data
         
         # Verify service registration
-        mock_register.assert_called_once_with(
-            DOMAIN, "manual_refresh", mock_register.call_args[0][2]
+        registered = {c.args[1]: c for c in mock_register.call_args_list}
+        assert set(registered) == {
+            "manual_refresh",
+            "get_schedule",
+            "export_traces",
+            "profile_refresh",
+            "import_addresses",
+        }
+        assert (
+            registered["get_schedule"].kwargs["supports_response"]
+            == SupportsResponse.ONLY
         )
+        assert hass.http.register_view.call_count == 2
+
+        # max_parallel is bounded before it reaches a semaphore
+        for name in ("manual_refresh", "import_addresses"):
+            schema = registered[name].kwargs["schema"]
+            assert schema({"max_parallel": "3"})["max_parallel"] == 3
+            for bad in (0, -1, 21, "many"):
+                with pytest.raises(vol.Invalid):
+                    schema({"max_parallel": bad})
+
+
+@pytest.mark.asyncio
+async def test_get_schedule_service(hass):
+    """The get_schedule service returns the full payload of an entry."""
+    hass.data = {}
+    with patch.object(hass.services, "async_register") as mock_register:
+        await async_setup(hass, {})
+    handler = next(
+        c.args[2] for c in mock_register.call_args_list if c.args[1] == "get_schedule"
+    )
+
+    coordinator = HouseholdBinCoordinator(hass, MagicMock(), "Test Name", timeout=60)
+    coordinator.data = {"Recycling": date(2024, 4, 3)}
+    coordinator.schedule = {"Recycling": [date(2024, 4, 3), date(2024, 4, 17)]}
+    coordinator.projected_dates = {"Recycling": [date(2024, 5, 1)]}
+    coordinator.last_fetch = datetime(2024, 4, 1, 6, 0, tzinfo=dt_util.UTC)
+    async_get_hub(hass).async_register("entry", coordinator, "host", None)
+
+    response = await handler(MagicMock(data={"entry_id": "entry"}))
+    assert response == {
+        "name": "Test Name",
+        "hash": data_hash(coordinator.data),
+        "last_fetch": "2024-04-01T06:00:00+00:00",
+        "next_collections": {"Recycling": "2024-04-03"},
+        "schedule": {"Recycling": ["2024-04-03", "2024-04-17"]},
+        "projected_dates": {"Recycling": ["2024-05-01"]},
+        "projected": [],
+    }
+
+    # Keys of the integration's shared state are not entries
+    for entry_id in ("missing", HUB):
+        with pytest.raises(ServiceValidationError):
+            await handler(MagicMock(data={"entry_id": entry_id}))
 
 
 @pytest.mark.asyncio
@@ -95,7 +154,11 @@ async def test_manual_refresh_service_no_entry_id(hass):
     
     with patch.object(hass.services, "async_register") as mock_register:
         await async_setup(hass, {})
-        service_handler = mock_register.call_args[0][2]
+        service_handler = next(
+            c.args[2]
+            for c in mock_register.call_args_list
+            if c.args[1] == "manual_refresh"
+        )
         
         # Call without entry_id
         mock_call = ServiceCall(DOMAIN, "manual_refresh", {})
@@ -158,6 +221,11 @@ async def test_async_setup_entry(hass, config_entry):
             assert "coordinator" in hass.data[DOMAIN][config_entry.entry_id]
             assert async_forward_mock.called
 
+            # Scheduling is owned by the shared hub, not the coordinator
+            coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+            assert hass.data[DOMAIN][HUB].coordinator(config_entry.entry_id) is coordinator
+            assert coordinator.update_interval is None
+
 
 @pytest.mark.asyncio
 async def test_async_setup_entry_update_failed(hass, config_entry):
@@ -256,4 +324,587 @@ async def test_household_bin_coordinator_update(hass):
     # The date should match what we provided
     today = dt_util.now().date()
     assert data["Recycling"] == (today + timedelta(days=2))
-    assert data["General Waste"] == (today + timedelta(days=5))
\ No newline at end of file
+    assert data["General Waste"] == (today + timedelta(days=5))
+
+@pytest.mark.asyncio
+async def test_coordinator_serves_projection_when_scrape_fails(hass, freezer):
+    """A failed scrape falls back to flagged projections of the learned cadence."""
+    freezer.move_to("2024-02-01")
+    ukbcd_mock = MagicMock()
+    ukbcd_mock.run.return_value = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": day}
+        for day in ["07/02/2024", "21/02/2024", "06/03/2024", "20/03/2024"]
+    ]})
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    coordinator = HouseholdBinCoordinator(hass, ukbcd_mock, "Test Coordinator")
+
+    data = await coordinator._async_update_data()
+    assert data == {"Recycling": date(2024, 2, 7)}
+    assert coordinator.projected == set()
+    assert coordinator.schedule_generation == 1
+
+    await coordinator._async_update_data()
+    assert coordinator.schedule_generation == 1
+
+    freezer.move_to("2024-04-01")
+    ukbcd_mock.run.side_effect = Exception("Council site down")
+    data = await coordinator._async_update_data()
+
+    assert data == {"Recycling": date(2024, 4, 3)}
+    assert coordinator.projected == {"Recycling"}
+    assert coordinator.schedule_generation == 2
+    assert coordinator.schedule == {}
+    assert coordinator.projected_dates["Recycling"][:2] == [
+        date(2024, 4, 3),
+        date(2024, 4, 17),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_stretches_interval_while_predictions_hold(hass, freezer):
+    """Each scrape that confirms the prediction doubles the refresh stretch."""
+    freezer.move_to("2024-02-01")
+    dates = ["07/02/2024", "21/02/2024", "06/03/2024", "20/03/2024"]
+    ukbcd_mock = MagicMock()
+    ukbcd_mock.run.return_value = json.dumps(
+        {"bins": [{"type": "Recycling", "collectionDate": day} for day in dates]}
+    )
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    hub = MagicMock()
+    hub.async_run_job = AsyncMock(side_effect=lambda host, job, timeout: job())
+    coordinator = HouseholdBinCoordinator(
+        hass, ukbcd_mock, "Test Coordinator", hub=hub, entry_id="entry"
+    )
+
+    await coordinator._async_update_data()
+    assert coordinator.refresh_stretch == 1
+
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+    assert coordinator.refresh_stretch == 4
+    hub.async_set_stretch.assert_called_with("entry", 4)
+
+    ukbcd_mock.run.return_value = json.dumps(
+        {"bins": [{"type": "Recycling", "collectionDate": "08/02/2024"}]}
+    )
+    await coordinator._async_update_data()
+    assert coordinator.refresh_stretch == 1
+
+
+@pytest.mark.asyncio
+async def test_coordinator_records_fetch_statistics(hass):
+    """Each refresh updates the coordinator's in-memory statistics."""
+    ukbcd_mock = MagicMock()
+    ukbcd_mock.run.return_value = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": (dt_util.now() + timedelta(days=2)).strftime("%d/%m/%Y")}
+    ]})
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    coordinator = HouseholdBinCoordinator(hass, ukbcd_mock, "Test Coordinator")
+
+    await coordinator._async_update_data()
+    stats = coordinator.stats
+    assert stats.fetches == 1
+    assert stats.last_duration >= 0
+    assert stats.last_queue_wait >= 0
+    assert stats.last_success == coordinator.last_fetch
+    assert stats.consecutive_failures == 0
+
+    # A failed scrape is served from the stored schedule
+    ukbcd_mock.run.side_effect = Exception("Council site down")
+    await coordinator._async_update_data()
+    assert stats.fetches == 2
+    assert stats.consecutive_failures == 1
+    assert stats.cache_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_coordinator_records_refresh_traces(hass):
+    """Each refresh leaves a trace of its phases in the coordinator's buffer."""
+    ukbcd_mock = MagicMock()
+    ukbcd_mock.parsed_args.module = None
+    ukbcd_mock.parsed_args.web_driver = None
+    ukbcd_mock.run.return_value = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": (dt_util.now() + timedelta(days=2)).strftime("%d/%m/%Y")}
+    ]})
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    coordinator = HouseholdBinCoordinator(hass, ukbcd_mock, "Test Coordinator")
+    coordinator.async_add_listener(lambda: None)
+
+    await coordinator._async_update_data()
+    coordinator.async_update_listeners()
+    ukbcd_mock.run.side_effect = Exception("Council site down")
+    await coordinator._async_update_data()
+
+    first, second = coordinator.traces.traces
+    assert [span.name for span in first.spans] == [
+        "queue",
+        "scrape",
+        "json parse",
+        "process bin data",
+        "learn schedule",
+        "update data",
+        "entity writes",
+    ]
+    assert first.spans[-1].args == {"listeners": 1}
+    assert second.spans[1].args == {"error": "Exception"}
+    assert coordinator._trace is second
+
+    hass.data = {}
+    with patch.object(hass.services, "async_register") as mock_register:
+        await async_setup(hass, {})
+    handler = next(
+        c.args[2] for c in mock_register.call_args_list if c.args[1] == "export_traces"
+    )
+    async_get_hub(hass).async_register("entry", coordinator, "host", None)
+
+    exported = await handler(MagicMock(data={}))
+    spans = [event for event in exported["traceEvents"] if event["ph"] == "X"]
+    assert len(spans) == 7 + len(second.spans)
+    with pytest.raises(ServiceValidationError):
+        await handler(MagicMock(data={"entry_id": "missing"}))
+
+
+@pytest.mark.asyncio
+async def test_profile_refresh_service(hass, tmp_path):
+    """The profile_refresh service profiles exactly one scrape."""
+    ukbcd_mock = MagicMock()
+    ukbcd_mock.run.return_value = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": (dt_util.now() + timedelta(days=2)).strftime("%d/%m/%Y")}
+    ]})
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    hass.data = {}
+    with patch.object(hass.services, "async_register") as mock_register:
+        await async_setup(hass, {})
+    handler = next(
+        c.args[2] for c in mock_register.call_args_list if c.args[1] == "profile_refresh"
+    )
+    coordinator = HouseholdBinCoordinator(hass, ukbcd_mock, "Test Coordinator")
+    async_get_hub(hass).async_register("entry", coordinator, "host", None)
+
+    response = await handler(MagicMock(data={"entry_id": "entry"}))
+
+    assert response["success"] is True
+    assert response["stats_file"].startswith(str(tmp_path / "uk_bin_collection_profiles"))
+    assert response["collapsed_file"].endswith(".collapsed")
+    assert response["top_functions"]
+    assert "peak_memory" not in response
+    assert not coordinator.profiling
+
+    # Ordinary refreshes are not profiled afterwards
+    with patch(
+        "custom_components.uk_bin_collection.RefreshProfile.runcall"
+    ) as runcall:
+        await coordinator._async_update_data()
+    runcall.assert_not_called()
+
+    with pytest.raises(ServiceValidationError):
+        await handler(MagicMock(data={"entry_id": "missing"}))
+
+
+@pytest.mark.asyncio
+async def test_overlapping_refreshes_share_one_scrape(hass):
+    """A refresh requested while one is running waits for it instead."""
+    coordinator = HouseholdBinCoordinator(hass, MagicMock(), "Test Coordinator")
+    release = asyncio.Event()
+
+    async def slow_refresh(self):
+        await release.wait()
+
+    with patch(
+        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_refresh",
+        side_effect=slow_refresh,
+        autospec=True,
+    ) as refresh:
+        first = asyncio.ensure_future(coordinator.async_refresh())
+        await asyncio.sleep(0)
+        assert coordinator.refresh_in_progress
+        second = asyncio.ensure_future(coordinator.async_refresh())
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, second)
+
+    assert refresh.call_count == 1
+    assert not coordinator.refresh_in_progress
+
+
+@pytest.mark.asyncio
+async def test_manual_refresh_selects_entries_and_reports(hass):
+    """manual_refresh takes lists, councils or "all" and reports per entry."""
+    hass.data = {}
+    with patch.object(hass.services, "async_register") as mock_register:
+        await async_setup(hass, {})
+    handler = next(
+        c.args[2] for c in mock_register.call_args_list if c.args[1] == "manual_refresh"
+    )
+
+    hub = async_get_hub(hass)
+    coordinators = {}
+    for entry_id, council in (("a", "CouncilA"), ("b", "CouncilA"), ("c", "CouncilB")):
+        coordinator = HouseholdBinCoordinator(
+            hass, MagicMock(), entry_id, council=council
+        )
+        coordinator.async_refresh = AsyncMock()
+        coordinators[entry_id] = coordinator
+        hub.async_register(entry_id, coordinator, "host", None)
+
+    async def change_schedule():
+        coordinators["a"].schedule_generation += 1
+
+    coordinators["a"].async_refresh.side_effect = change_schedule
+    coordinators["c"].last_update_success = False
+
+    response = await handler(MagicMock(data={"entry_id": "all"}))
+    assert set(response["entries"]) == {"a", "b", "c"}
+    assert response["entries"]["a"]["schedule_changed"] is True
+    assert response["entries"]["a"]["status"] == "success"
+    assert response["entries"]["b"]["schedule_changed"] is False
+    assert response["entries"]["c"]["status"] == "failed"
+    assert response["entries"]["a"]["coalesced"] is False
+
+    response = await handler(MagicMock(data={"council": "CouncilA", "max_parallel": 1}))
+    assert list(response["entries"]) == ["a", "b"]
+
+    response = await handler(MagicMock(data={"entry_id": ["c", "missing"]}))
+    assert response["entries"]["missing"] == {"status": "not_found"}
+    assert coordinators["c"].async_refresh.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coordinator_first_refresh_uses_seed(hass):
+    """Data scraped by the config flow stands in for the first scrape only."""
+    raw = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": (dt_util.now() + timedelta(days=2)).strftime("%d/%m/%Y")}
+    ]})
+    ukbcd_mock = MagicMock()
+    ukbcd_mock.run.return_value = raw
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    fetched_at = dt_util.utcnow() - timedelta(hours=1)
+    coordinator = HouseholdBinCoordinator(
+        hass, ukbcd_mock, "Test Coordinator", seed=(raw, fetched_at)
+    )
+
+    data = await coordinator._async_update_data()
+    assert "Recycling" in data
+    ukbcd_mock.run.assert_not_called()
+    assert coordinator.stats.fetches == 0
+    assert coordinator.stats.outcomes["seeded"] == 1
+    assert coordinator.stats.outcomes["success"] == 0
+    assert coordinator.seeded
+    assert coordinator.last_fetch == fetched_at
+
+    await coordinator._async_update_data()
+    ukbcd_mock.run.assert_called_once()
+    assert coordinator.stats.outcomes["success"] == 1
+
+
+@pytest.mark.asyncio
+async def test_setup_and_reload_fetch_once(hass, config_entry):
+    """Setup scrapes exactly once and a reload with the same arguments reuses it."""
+    hass.data = {}
+    await async_setup(hass, {})
+    config_entry.data["manual_refresh_only"] = True
+    ukbcd_mock = MagicMock()
+    ukbcd_mock.run.return_value = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": (dt_util.now() + timedelta(days=2)).strftime("%d/%m/%Y")}
+    ]})
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
+    hass.config_entries.async_forward_entry_unload = AsyncMock(return_value=True)
+
+    with patch("custom_components.uk_bin_collection.UKBinCollectionApp", return_value=ukbcd_mock):
+        assert await async_setup_entry(hass, config_entry)
+        first = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+        assert ukbcd_mock.run.call_count == 1
+        assert first.stats.fetches == 1
+
+        assert await async_unload_entry(hass, config_entry)
+        assert await async_setup_entry(hass, config_entry)
+        second = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+
+        assert second is not first
+        assert ukbcd_mock.run.call_count == 1
+        assert second.stats.fetches == 0
+        assert second.seeded
+        assert second.data == first.data
+        assert second.last_fetch == first.last_fetch
+
+        # Changing what is scraped means the reload fetches again
+        assert await async_unload_entry(hass, config_entry)
+        config_entry.data["uprn"] = "100"
+        assert await async_setup_entry(hass, config_entry)
+        third = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+        assert ukbcd_mock.run.call_count == 2
+        assert third.stats.fetches == 1
+        assert not third.seeded
+
+
+@pytest.mark.asyncio
+async def test_options_update_hot_applies_or_reloads(hass, config_entry):
+    """Cosmetic and scheduling options apply in place; anything else reloads."""
+    hass.data = {}
+    await async_setup(hass, {})
+    config_entry.data["manual_refresh_only"] = True
+    ukbcd_mock = MagicMock()
+    ukbcd_mock.run.return_value = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": (dt_util.now() + timedelta(days=2)).strftime("%d/%m/%Y")}
+    ]})
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
+    hass.config_entries.async_reload = AsyncMock(return_value=True)
+
+    with patch("custom_components.uk_bin_collection.UKBinCollectionApp", return_value=ukbcd_mock):
+        assert await async_setup_entry(hass, config_entry)
+    listener = config_entry.update_listeners[0]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    hub = async_get_hub(hass)
+
+    config_entry.options = {
+        "timeout": 120,
+        "update_interval": 6,
+        "icon_color_mapping": '{"Recycling": {"icon": "mdi:recycle"}}',
+    }
+    with patch.object(hub, "async_reschedule") as reschedule, patch(
+        "custom_components.uk_bin_collection.async_dispatcher_send"
+    ) as dispatch:
+        await listener(hass, config_entry)
+
+    hass.config_entries.async_reload.assert_not_called()
+    assert ukbcd_mock.run.call_count == 1
+    assert coordinator.timeout == 120
+    assert coordinator.refresh_interval == timedelta(hours=6)
+    entry_id, interval, delay = reschedule.call_args.args
+    assert (entry_id, interval) == (config_entry.entry_id, timedelta(hours=6))
+    assert timedelta(hours=5) < delay <= timedelta(hours=6)
+    dispatch.assert_called_once()
+    assert dispatch.call_args.args[2] == config_entry.options["icon_color_mapping"]
+
+    # Unchanged options do nothing; a changed address reloads
+    await listener(hass, config_entry)
+    hass.config_entries.async_reload.assert_not_called()
+    config_entry.options = {**config_entry.options, "uprn": "100"}
+    await listener(hass, config_entry)
+    hass.config_entries.async_reload.assert_awaited_once_with(config_entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_fires_schedule_changed_event(hass, freezer):
+    """A scrape that moves a date fires one event carrying the diff."""
+    freezer.move_to("2024-02-01")
+    ukbcd_mock = MagicMock()
+    ukbcd_mock.run.return_value = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": day}
+        for day in ["07/02/2024", "21/02/2024"]
+    ]})
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    coordinator = HouseholdBinCoordinator(
+        hass, ukbcd_mock, "Test Coordinator", entry_id="entry", council="TestCouncil"
+    )
+
+    # Neither the first scrape nor an unchanged one fires
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+    hass.bus.async_fire.assert_not_called()
+
+    ukbcd_mock.run.return_value = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": day}
+        for day in ["08/02/2024", "21/02/2024"]
+    ]})
+    await coordinator._async_update_data()
+
+    hass.bus.async_fire.assert_called_once_with(
+        "uk_bin_collection_schedule_changed",
+        {
+            "entry_id": "entry",
+            "name": "Test Coordinator",
+            "council": "TestCouncil",
+            "changes": {
+                "Recycling": {
+                    "added": [],
+                    "removed": [],
+                    "moved": [{"from": "2024-02-07", "to": "2024-02-08"}],
+                }
+            },
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_coordinator_refreshes_stale_data_on_read(hass):
+    """Reading stale data starts one background refresh at a time."""
+    coordinator = HouseholdBinCoordinator(
+        hass, MagicMock(), "Test Name", timeout=60, stale_after=timedelta(hours=6)
+    )
+    coordinator.async_refresh = AsyncMock()
+    started = []
+    hass.async_create_background_task = lambda target, name: started.append(target) or target
+
+    coordinator.last_fetch = dt_util.utcnow() - timedelta(hours=1)
+    coordinator.async_note_read()
+    assert started == []
+
+    coordinator.last_fetch = dt_util.utcnow() - timedelta(hours=7)
+    coordinator.async_note_read()
+    coordinator.async_note_read()
+    assert len(started) == 1
+
+    # A refresh that leaves the data stale is not retried on every read
+    await started[0]
+    coordinator.async_refresh.assert_awaited_once()
+    coordinator.async_note_read()
+    assert len(started) == 1
+
+    coordinator.stale_after = None
+    coordinator._read_refresh_at = None
+    coordinator.async_note_read()
+    assert len(started) == 1
+
+
+@pytest.mark.asyncio
+async def test_hub_shut_down_on_stop_and_last_unload(hass, config_entry):
+    """The hub and reminder timers are cancelled when Home Assistant stops or no entry is left."""
+    hass.data = {}
+    await async_setup(hass, {})
+    hass.bus.async_listen_once.assert_called_once()
+    event, handle_stop = hass.bus.async_listen_once.call_args.args
+    assert event == "homeassistant_stop"
+
+    hub = async_get_hub(hass)
+    hub.async_register("other", MagicMock(), "host", None)
+    hub.async_register(config_entry.entry_id, MagicMock(), "host", None)
+    hass.data[DOMAIN][config_entry.entry_id] = {"coordinator": MagicMock(last_raw=None)}
+    hass.config_entries.async_forward_entry_unload = AsyncMock(return_value=True)
+
+    reminders = async_get_reminders(hass)
+    with patch.object(hub, "async_shutdown") as shutdown, patch.object(
+        reminders, "async_shutdown"
+    ) as reminders_shutdown:
+        assert await async_unload_entry(hass, config_entry)
+        shutdown.assert_not_called()
+
+        hub.async_unregister("other")
+        hass.data[DOMAIN][config_entry.entry_id] = {"coordinator": MagicMock(last_raw=None)}
+        hub.async_register(config_entry.entry_id, MagicMock(), "host", None)
+        assert await async_unload_entry(hass, config_entry)
+        shutdown.assert_called_once()
+        reminders_shutdown.assert_called_once()
+
+        handle_stop(MagicMock())
+        assert shutdown.call_count == 2
+        assert reminders_shutdown.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_remove_entry_drops_its_seed(hass, config_entry):
+    """Removing an entry forgets the data its unload kept for a reload."""
+    hass.data = {}
+    args = build_ukbcd_args(config_entry.data)
+    store_seed(hass, args, "{}")
+
+    await async_remove_entry(hass, config_entry)
+    assert pop_seed(hass, args) is None
+
+
+@pytest.mark.asyncio
+async def test_multi_address_entry_scrapes_in_one_job(hass, config_entry):
+    """Every address of a multi-address entry is scraped in one hub job and reloads from seeds."""
+    hass.data = {}
+    await async_setup(hass, {})
+    config_entry.data.update(
+        manual_refresh_only=True,
+        addresses=[{"name": "Flat 1", "uprn": "1"}, {"name": "Flat 2", "uprn": "2"}],
+    )
+    raw = json.dumps({"bins": [
+        {"type": "Recycling", "collectionDate": (dt_util.now() + timedelta(days=2)).strftime("%d/%m/%Y")}
+    ]})
+    scraped = []
+
+    def make_app():
+        app = MagicMock()
+        app.set_args.side_effect = lambda args: setattr(
+            app.run, "side_effect", lambda: scraped.append(args) or raw
+        )
+        return app
+
+    async def mock_async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_async_add_executor_job
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.ensure_future(coro)
+    )
+    hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
+    hass.config_entries.async_forward_entry_unload = AsyncMock(return_value=True)
+    hub = async_get_hub(hass)
+
+    with patch(
+        "custom_components.uk_bin_collection.UKBinCollectionApp", side_effect=make_app
+    ), patch.object(hub, "async_run_job", wraps=hub.async_run_job) as run_job:
+        assert await async_setup_entry(hass, config_entry)
+        coordinators = hass.data[DOMAIN][config_entry.entry_id]["coordinators"]
+        assert list(coordinators) == ["test_init_flat_1", "test_init_flat_2"]
+        assert run_job.call_count == 1
+        assert sorted(args[2] for args in scraped) == ["--uprn=1", "--uprn=2"]
+        assert hub.entry_ids == ["test_init_flat_1", "test_init_flat_2"]
+        assert hub.coordinator(config_entry.entry_id) is None
+        assert coordinators["test_init_flat_2"].name == "Flat 2"
+
+        # A reload with the same addresses scrapes none of them
+        assert await async_unload_entry(hass, config_entry)
+        assert hub.entry_ids == []
+        assert await async_setup_entry(hass, config_entry)
+        assert run_job.call_count == 1
+        assert all(
+            coordinator.seeded
+            for coordinator in hass.data[DOMAIN][config_entry.entry_id]["coordinators"].values()
+        )
+
+        # With one seed gone only that address is scraped; the other keeps its seed
+        args = hass.data[DOMAIN][config_entry.entry_id]["address_args"]["test_init_flat_1"]
+        assert await async_unload_entry(hass, config_entry)
+        pop_seed(hass, args)
+        scraped.clear()
+        assert await async_setup_entry(hass, config_entry)
+        await asyncio.sleep(0)
+        assert run_job.call_count == 2
+        assert [entry_args[2] for entry_args in scraped] == ["--uprn=1"]
+        coordinators = hass.data[DOMAIN][config_entry.entry_id]["coordinators"]
+        assert coordinators["test_init_flat_2"].seeded
+        assert not coordinators["test_init_flat_1"].seeded
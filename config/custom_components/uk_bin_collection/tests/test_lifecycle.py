@@ -0,0 +1,87 @@
+"""Tests for the per-bin entity lifecycle."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from custom_components.uk_bin_collection.lifecycle import BinEntityTracker
+
+
+def make_entity(bin_type):
+    """Return a stand-in entity registered as sensor.<bin_type>."""
+    entity = MagicMock()
+    entity.entity_id = f"sensor.{bin_type.lower()}"
+    entity.bin_type = bin_type
+    return entity
+
+
+def make_tracker(hass, coordinator):
+    """Return a tracker building two entities per bin type, and its add callback."""
+    add_entities = MagicMock()
+    tracker = BinEntityTracker(
+        hass,
+        coordinator,
+        "entry",
+        add_entities,
+        lambda bin_type: [make_entity(bin_type), make_entity(f"{bin_type}_days")],
+    )
+    return tracker, add_entities
+
+
+def test_tracker_adds_and_removes_bin_types(hass):
+    """New bin types get entities; vanished ones are removed with their device."""
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.data = {"Refuse": date(2025, 1, 2), "Recycling": date(2025, 1, 9)}
+    tracker, add_entities = make_tracker(hass, coordinator)
+
+    assert len(tracker.create(coordinator.data)) == 4
+    tracker.async_start()
+    sync = coordinator.async_add_listener.call_args.args[0]
+
+    entity_registry = MagicMock()
+    entity_registry.async_get.side_effect = lambda entity_id: MagicMock(
+        device_id=f"device_{entity_id.split('.')[1].split('_')[0]}"
+    )
+    device_registry = MagicMock()
+    with patch(
+        "custom_components.uk_bin_collection.lifecycle.er.async_get",
+        return_value=entity_registry,
+    ), patch(
+        "custom_components.uk_bin_collection.lifecycle.er.async_entries_for_device",
+        return_value=[],
+    ), patch(
+        "custom_components.uk_bin_collection.lifecycle.dr.async_get",
+        return_value=device_registry,
+    ):
+        # Garden waste starts being collected and recycling stops
+        coordinator.data = {"Refuse": date(2025, 1, 2), "Garden": date(2025, 1, 3)}
+        sync()
+
+    added = add_entities.call_args.args[0]
+    assert [entity.bin_type for entity in added] == ["Garden", "Garden_days"]
+    assert sorted(tracker.bin_types) == ["Garden", "Refuse"]
+    assert {c.args[0] for c in entity_registry.async_remove.call_args_list} == {
+        "sensor.recycling",
+        "sensor.recycling_days",
+    }
+    device_registry.async_update_device.assert_called_once_with(
+        "device_recycling", remove_config_entry_id="entry"
+    )
+
+
+def test_tracker_ignores_failed_refreshes(hass):
+    """A failed refresh neither adds nor removes entities."""
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.data = {"Refuse": date(2025, 1, 2)}
+    tracker, add_entities = make_tracker(hass, coordinator)
+    tracker.create(coordinator.data)
+    tracker.async_start()
+    sync = coordinator.async_add_listener.call_args.args[0]
+
+    coordinator.last_update_success = False
+    coordinator.data = {}
+    sync()
+
+    add_entities.assert_not_called()
+    assert tracker.bin_types == ["Refuse"]
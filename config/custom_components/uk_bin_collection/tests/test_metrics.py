@@ -0,0 +1,80 @@
+"""Tests for the UK Bin Collection refresh statistics."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.uk_bin_collection.const import OUTCOME_PROJECTED
+from custom_components.uk_bin_collection.hub import async_get_hub
+from custom_components.uk_bin_collection.metrics import FetchStats, render_metrics
+
+
+def test_percentiles_over_rolling_window():
+    """Percentiles use nearest rank over the most recent durations only."""
+    stats = FetchStats(window=20)
+    assert stats.percentile(50) is None
+
+    for duration in range(1, 41):
+        stats.record_fetch(float(duration), 0.5)
+
+    assert list(stats.durations) == [float(value) for value in range(21, 41)]
+    assert stats.percentile(50) == 30.0
+    assert stats.percentile(95) == 39.0
+    assert stats.last_duration == 40.0
+    assert stats.last_queue_wait == 0.5
+    assert stats.fetches == 40
+
+
+def test_failures_successes_and_age():
+    """A success clears the failure streak and dates the data."""
+    stats = FetchStats()
+    stats.record_failure()
+    stats.record_failure()
+    stats.record_cache_hit()
+    assert stats.consecutive_failures == 2
+    assert stats.data_age(datetime(2024, 1, 1)) is None
+
+    fetched = datetime(2024, 1, 1, 6, 0)
+    stats.record_success(fetched)
+    assert stats.consecutive_failures == 0
+    assert stats.failures == 2
+    assert stats.cache_hits == 1
+    assert stats.data_age(fetched + timedelta(minutes=5)) == 300
+
+
+def test_render_metrics():
+    """Entry statistics and hub state are exported with entry labels."""
+    hass = MagicMock()
+    hass.data = {}
+    hub = async_get_hub(hass)
+    coordinator = MagicMock()
+    coordinator.name = 'Home "Main"'
+    coordinator.council = "ExampleCouncil"
+    coordinator.host = "bins.example.gov.uk"
+    coordinator.stats = FetchStats()
+    coordinator.stats.record_fetch(0.75, 0.1)
+    coordinator.stats.record_fetch(45.0, 2.0)
+    coordinator.stats.record_success(datetime(2024, 1, 1, 6, 0, tzinfo=dt_util.UTC))
+    coordinator.stats.record_failure()
+    coordinator.stats.record_cache_hit(OUTCOME_PROJECTED)
+    hub.async_register("entry", coordinator, coordinator.host, None)
+    hub._record_failure(coordinator.host)
+
+    text = render_metrics(hub, now=datetime(2024, 1, 1, 6, 10, tzinfo=dt_util.UTC))
+    lines = text.splitlines()
+    labels = 'entry="entry",name="Home \\"Main\\"",council="ExampleCouncil"'
+
+    assert "# TYPE uk_bin_collection_fetch_duration_seconds histogram" in lines
+    assert f'uk_bin_collection_refreshes_total{{{labels},outcome="success"}} 1' in lines
+    assert f'uk_bin_collection_refreshes_total{{{labels},outcome="projected"}} 1' in lines
+    assert f'uk_bin_collection_fetch_duration_seconds_bucket{{{labels},le="0.5"}} 0' in lines
+    assert f'uk_bin_collection_fetch_duration_seconds_bucket{{{labels},le="1"}} 1' in lines
+    assert f'uk_bin_collection_fetch_duration_seconds_bucket{{{labels},le="60"}} 2' in lines
+    assert f'uk_bin_collection_fetch_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"uk_bin_collection_fetch_duration_seconds_count{{{labels}}} 2" in lines
+    assert f"uk_bin_collection_consecutive_failures{{{labels}}} 1" in lines
+    assert f"uk_bin_collection_data_age_seconds{{{labels}}} 600.0" in lines
+    assert "uk_bin_collection_scrapes_in_flight 0" in lines
+    assert 'uk_bin_collection_host_backoff_open{host="bins.example.gov.uk"} 1' in lines
+    assert 'uk_bin_collection_host_backoff_seconds{host="bins.example.gov.uk"} 300.0' in lines
@@ -72,16 +72,28 @@ async def setup_flow_with_council_list(options_flow):
 
 
 @pytest.mark.asyncio
-async def test_options_flow_init_to_user(options_flow):
-    """Test that init step redirects to user step."""
-    await setup_flow_with_council_list(options_flow)
-    
-    # Test the init step
-    result = await options_flow.async_step_init()
-    
-    # Should show user form
-    assert result["type"] == data_entry_flow.FlowResultType.FORM
-    assert result["step_id"] == "user"
+async def test_options_flow_init_to_user(options_flow, config_entry):
+    """Test that init step offers the settings and the address steps."""
+    options_flow.config_entry = config_entry
+    fetch = AsyncMock(return_value=MOCK_COUNCILS_DATA)
+    with patch(
+        "custom_components.uk_bin_collection.options_flow.async_get_council_list", fetch
+    ):
+        result = await options_flow.async_step_init()
+        assert result["type"] == data_entry_flow.FlowResultType.MENU
+        assert result["menu_options"] == ["advanced", "user"]
+
+        # Changing settings loads nothing from the network
+        result = await options_flow.async_step_advanced()
+        assert result["step_id"] == "advanced"
+        fetch.assert_not_awaited()
+
+        # The council list is loaded once the address is edited
+        result = await options_flow.async_step_user()
+        assert result["type"] == data_entry_flow.FlowResultType.FORM
+        assert result["step_id"] == "user"
+        await options_flow.async_step_user()
+        fetch.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -311,4 +323,47 @@ async def test_options_flow_advanced_to_create_entry(options_flow):
     assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
     assert result["data"]["update_interval"] == 24
     assert result["data"]["timeout"] == 120
-    assert "icon_color_mapping" in result["data"]
\ No newline at end of file
+    assert "icon_color_mapping" in result["data"]
+
+@pytest.mark.asyncio
+async def test_options_flow_saves_changed_address(options_flow, config_entry, hass):
+    """A changed address or council is saved to the entry data, settings to options."""
+    options_flow.config_entry = config_entry
+    await setup_flow_with_council_list(options_flow)
+    hass.config_entries.async_update_entry = MagicMock()
+    hass.config_entries.async_entries.return_value = [config_entry]
+
+    await options_flow.async_step_user(
+        user_input={"name": "New Home", "selected_council": "Council with UPRN"}
+    )
+    await options_flow.async_step_council_info(user_input={"uprn": "1234567890"})
+    result = await options_flow.async_step_advanced(
+        user_input={"automatically_refresh": True, "update_interval": 6, "timeout": 60}
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert result["data"]["update_interval"] == 6
+    assert "uprn" not in result["data"]
+
+    hass.config_entries.async_update_entry.assert_called_once()
+    kwargs = hass.config_entries.async_update_entry.call_args.kwargs
+    assert kwargs["title"] == "New Home"
+    assert kwargs["data"]["name"] == "New Home"
+    assert kwargs["data"]["council"] == "CouncilWithUPRN"
+    assert kwargs["data"]["uprn"] == "1234567890"
+    # Settings kept in the data are left alone
+    assert kwargs["data"]["icon_color_mapping"] == config_entry.data["icon_color_mapping"]
+
+
+@pytest.mark.asyncio
+async def test_options_flow_settings_leave_data_alone(options_flow, config_entry, hass):
+    """Changing only the settings does not touch the entry data."""
+    options_flow.config_entry = config_entry
+    hass.config_entries.async_update_entry = MagicMock()
+    hass.config_entries.async_entries.return_value = [config_entry]
+
+    result = await options_flow.async_step_advanced(
+        user_input={"automatically_refresh": True, "update_interval": 6, "timeout": 60}
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    hass.config_entries.async_update_entry.assert_not_called()
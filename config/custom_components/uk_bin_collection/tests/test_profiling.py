@@ -0,0 +1,72 @@
+"""Tests for UK Bin Collection refresh profiling."""
+
+import os
+
+from custom_components.uk_bin_collection.profiling import (
+    RefreshProfile,
+    collapsed_stacks,
+)
+
+
+def leaf(size):
+    """Allocate and do some work."""
+    return sum(range(size))
+
+
+def branch():
+    """Call the leaf twice with different amounts of work."""
+    return leaf(20000) + leaf(60000)
+
+
+def test_collapsed_stacks_share_time_among_callers():
+    """A function called from two places is split by the time under each."""
+    key = lambda name: ("mod.py", 1, name)
+    stats = {
+        key("main"): (1, 1, 0.001, 0.010, {}),
+        key("a"): (1, 1, 0.001, 0.004, {key("main"): (1, 1, 0.001, 0.004)}),
+        key("b"): (1, 1, 0.001, 0.005, {key("main"): (1, 1, 0.001, 0.005)}),
+        key("shared"): (
+            2,
+            2,
+            0.007,
+            0.007,
+            {key("a"): (1, 1, 0.003, 0.003), key("b"): (1, 1, 0.004, 0.004)},
+        ),
+    }
+
+    assert collapsed_stacks(stats) == [
+        "main_(mod.py:1) 1000",
+        "main_(mod.py:1);a_(mod.py:1) 1000",
+        "main_(mod.py:1);a_(mod.py:1);shared_(mod.py:1) 3000",
+        "main_(mod.py:1);b_(mod.py:1) 1000",
+        "main_(mod.py:1);b_(mod.py:1);shared_(mod.py:1) 4000",
+    ]
+
+
+def test_profile_summary_and_files(tmp_path):
+    """A profiled call reports its slowest functions and writes both files."""
+    profile = RefreshProfile(trace_memory=True)
+    assert profile.runcall(branch) == sum(range(20000)) + sum(range(60000))
+    assert profile.ran
+
+    summary = profile.summary()
+    names = [entry["function"] for entry in summary["top_functions"]]
+    assert any(name.endswith("(branch)") for name in names)
+    leaf_entry = next(e for e in summary["top_functions"] if e["function"].endswith("(leaf)"))
+    assert leaf_entry["calls"] == 2
+    assert summary["peak_memory"] > 0
+    assert isinstance(summary["top_allocations"], list)
+
+    stats_file, collapsed_file = profile.write(str(tmp_path / "profiles"), "entry")
+    assert os.path.getsize(stats_file) > 0
+    with open(collapsed_file, encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    assert any(";leaf_(test_profiling.py:" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_profile_without_memory_tracing():
+    """Memory figures are only reported when asked for."""
+    profile = RefreshProfile()
+    profile.runcall(branch)
+    assert set(profile.summary()) == {"top_functions"}
@@ -0,0 +1,80 @@
+"""Tests for the collection reminder scheduler."""
+
+from datetime import time, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.uk_bin_collection.reminders import (
+    ReminderScheduler,
+    parse_reminders,
+)
+
+
+def test_parse_reminders():
+    """Reminders are days before plus a time; anything else is rejected."""
+    assert parse_reminders("1 19:00, 0 7:30,1 19:00") == [(1, time(19, 0)), (0, time(7, 30))]
+    assert parse_reminders("") == []
+    for invalid in ("19:00", "1 24:00", "tomorrow 19:00", "-1 19:00"):
+        with pytest.raises(ValueError):
+            parse_reminders(invalid)
+
+
+def make_coordinator(schedule):
+    """Return a stand-in coordinator publishing ``schedule``."""
+    coordinator = MagicMock()
+    coordinator.name = "Home"
+    coordinator.schedule = schedule
+    coordinator.projected_dates = {}
+    coordinator.data = {bin_type: dates[0] for bin_type, dates in schedule.items()}
+    coordinator.schedule_generation = 1
+    return coordinator
+
+
+@patch("custom_components.uk_bin_collection.reminders.async_track_point_in_utc_time")
+def test_scheduler_fires_each_reminder_once(track, hass):
+    """Reminders fire once, in order, and follow schedule changes incrementally."""
+    today = dt_util.now().date()
+    first, second = today + timedelta(days=3), today + timedelta(days=10)
+    coordinator = make_coordinator({"Refuse": [first, second]})
+    scheduler = ReminderScheduler(hass)
+    scheduler.async_track("entry", coordinator, [(1, time(19, 0)), (0, time(7, 0))])
+
+    pending = scheduler.pending
+    assert [key[2] for _, key in pending] == [first, first, second, second]
+    first_due = pending[0][0]
+    assert track.call_args.args[2] == first_due
+    sync = coordinator.async_add_listener.call_args.args[0]
+
+    # The first collection moves a day later: only its reminders are redone
+    moved = first + timedelta(days=1)
+    coordinator.schedule = {"Refuse": [moved, second]}
+    coordinator.data = {"Refuse": moved}
+    coordinator.schedule_generation = 2
+    sync()
+    assert [key[2] for _, key in scheduler.pending] == [moved, moved, second, second]
+
+    # Fire everything due before the second collection's reminders
+    fire = track.call_args.args[1]
+    with patch(
+        "custom_components.uk_bin_collection.reminders.async_dispatcher_send"
+    ) as send:
+        fire(dt_util.as_utc(dt_util.start_of_local_day(moved)) + timedelta(hours=8))
+    # The entry's binary sensors are told once, however many reminders fired
+    send.assert_called_once_with(hass, "uk_bin_collection_reminder_fired_entry")
+    events = [c.args for c in hass.bus.async_fire.call_args_list]
+    assert [(data["collection_date"], data["days_before"]) for _, data in events] == [
+        (moved.isoformat(), 1),
+        (moved.isoformat(), 0),
+    ]
+    assert events[0][0] == "uk_bin_collection_reminder"
+    assert events[0][1]["time"] == "19:00"
+
+    # A refresh re-publishing the same collection never repeats a reminder
+    coordinator.schedule_generation = 3
+    sync()
+    assert [key[2] for _, key in scheduler.pending] == [second, second]
+
+    scheduler.async_untrack("entry")
+    assert scheduler.pending == []
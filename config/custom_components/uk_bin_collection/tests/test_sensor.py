@@ -28,13 +28,20 @@ from custom_components.uk_bin_collection.const import (
 )
 from custom_components.uk_bin_collection.sensor import (
     UKBinCollectionAttributeSensor,
+    UKBinCollectionCompactSensor,
     UKBinCollectionDataSensor,
+    UKBinCollectionDiagnosticSensor,
     UKBinCollectionRawJSONSensor,
+    DIAGNOSTIC_SENSORS,
     create_sensor_entities,
     load_icon_color_mapping,
+    NextCollectionsIndex,
+    UKBinCollectionNextCollectionsSensor,
 )
 
 from custom_components.uk_bin_collection import HouseholdBinCoordinator
+from custom_components.uk_bin_collection.hub import async_get_hub
+from custom_components.uk_bin_collection.utils import data_hash
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -268,17 +275,38 @@ async def test_raw_json_sensor(hass, mock_config_entry):
     coordinator.data = MOCK_PROCESSED_DATA
     coordinator.name = "Test Name"
     coordinator.last_update_success = True
+    coordinator.last_fetch = datetime(2023, 10, 14, 6, 0, tzinfo=dt_util.UTC)
 
     sensor = UKBinCollectionRawJSONSensor(coordinator, "test_raw_json", "Test Name")
 
-    expected_state = json.dumps(
-        {k: v.strftime("%d/%m/%Y") for k, v in MOCK_PROCESSED_DATA.items()}
-    )
-
     assert sensor.name == "Test Name Raw JSON"
     assert sensor.unique_id == "test_raw_json"
-    assert sensor.state == expected_state
-    assert sensor.extra_state_attributes == {"raw_data": MOCK_PROCESSED_DATA}
+    assert sensor.state == data_hash(MOCK_PROCESSED_DATA)
+    assert len(sensor.state) == 12
+    assert sensor.extra_state_attributes == {
+        "raw_data": MOCK_PROCESSED_DATA,
+        "last_fetch": "2023-10-14T06:00:00+00:00",
+    }
+    # The bulky payload is kept out of the recorder; the fetch time is recorded
+    assert sensor._unrecorded_attributes == {"raw_data"}
+
+    # The state is only written when the data, its fetch time or availability change
+    sensor._written = sensor._write_key()
+    sensor.async_write_ha_state = MagicMock()
+    coordinator.data = dict(MOCK_PROCESSED_DATA)
+    sensor._handle_coordinator_update()
+    assert sensor.state == data_hash(MOCK_PROCESSED_DATA)
+    sensor.async_write_ha_state.assert_not_called()
+
+    coordinator.last_fetch = datetime(2023, 10, 14, 18, 0, tzinfo=dt_util.UTC)
+    sensor._handle_coordinator_update()
+    assert sensor.extra_state_attributes["last_fetch"] == "2023-10-14T18:00:00+00:00"
+    coordinator.data["Recycling"] = date(2023, 10, 30)
+    sensor._handle_coordinator_update()
+    assert sensor.state != data_hash(MOCK_PROCESSED_DATA)
+    coordinator.last_update_success = False
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 3
 
 
 @pytest.mark.asyncio
@@ -310,6 +338,31 @@ async def test_bin_sensor_custom_icon_color(hass, mock_config_entry):
     assert sensor.extra_state_attributes["colour"] == "green"
 
 
+@freeze_time("2023-10-14")
+def test_bin_sensors_apply_new_icon_color_mapping():
+    """A changed mapping restyles the sensors without a refresh."""
+    coordinator = MagicMock()
+    coordinator.data = {"General Waste": date(2023, 10, 15)}
+    sensor = UKBinCollectionDataSensor(coordinator, "General Waste", "test_general_waste", {})
+    colour = UKBinCollectionAttributeSensor(
+        coordinator, "General Waste", "test_general_waste_colour", "Colour", "test_general_waste", {}
+    )
+    assert sensor.extra_state_attributes["colour"] == "black"
+
+    mapping = {"General Waste": {"icon": "mdi:delete", "color": "green"}}
+    for entity in (sensor, colour):
+        entity.hass = MagicMock()
+        with patch.object(entity, "async_write_ha_state") as write:
+            entity.set_icon_color_mapping(mapping)
+            entity.set_icon_color_mapping(mapping)
+        write.assert_called_once()
+
+    assert sensor.icon == "mdi:delete"
+    assert sensor.extra_state_attributes["colour"] == "green"
+    assert colour.state == "green"
+    coordinator.async_refresh.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_bin_sensor_today_collection(hass, freezer, mock_config_entry):
     """Test bin sensor when collection is today."""
@@ -421,13 +474,14 @@ async def test_raw_json_sensor_invalid_data(hass, mock_config_entry):
     coordinator.data = {}  # Empty data
     coordinator.last_update_success = False
     coordinator.name = "Test Name"
+    coordinator.last_fetch = None
 
     # Create the raw JSON sensor
     sensor = UKBinCollectionRawJSONSensor(coordinator, "test_raw_json", "Test Name")
 
     # Since data fetch failed, sensor.state should reflect the failure
-    assert sensor.state == json.dumps({})
-    assert sensor.extra_state_attributes == {"raw_data": {}}
+    assert sensor.state == data_hash({})
+    assert sensor.extra_state_attributes == {"raw_data": {}, "last_fetch": None}
     assert sensor.available is False
 
 
@@ -732,6 +786,7 @@ async def test_raw_json_sensor_invalid_data_2(hass, mock_config_entry):
     coordinator.data = {}  # Empty data
     coordinator.name = "Test Name"
     coordinator.last_update_success = False
+    coordinator.last_fetch = None
     
     # Create the raw JSON sensor
     raw_json_sensor = UKBinCollectionRawJSONSensor(
@@ -739,8 +794,8 @@ async def test_raw_json_sensor_invalid_data_2(hass, mock_config_entry):
     )
     
     # Check properties
-    assert raw_json_sensor.state == "{}"
-    assert raw_json_sensor.extra_state_attributes == {"raw_data": {}}
+    assert raw_json_sensor.state == data_hash({})
+    assert raw_json_sensor.extra_state_attributes == {"raw_data": {}, "last_fetch": None}
     assert raw_json_sensor.available is False
 
 
@@ -1022,7 +1077,8 @@ def test_raw_json_sensor_partial_data():
     
     # Check state with null value
     state = sensor.state
-    assert state == '{"General Waste": null, "Recycling": "01/01/2025"}'
+    assert state == data_hash({"General Waste": None, "Recycling": date(2025, 1, 1)})
+    assert state != data_hash({"Recycling": date(2025, 1, 1)})
 
 
 def test_data_sensor_unavailable_if_unknown_state():
@@ -1097,8 +1153,38 @@ def test_create_sensor_entities_coordinator_data():
     raw_sensor = next(
         e for e in entities if isinstance(e, UKBinCollectionRawJSONSensor)
     )
-    raw_state = json.loads(raw_sensor.state)
-    assert "General Waste" in raw_state and "Recycling" in raw_state
+    raw_data = raw_sensor.extra_state_attributes["raw_data"]
+    assert "General Waste" in raw_data and "Recycling" in raw_data
+
+
+@freeze_time("2025-02-08")
+def test_create_sensor_entities_compact():
+    """Compact mode creates one typed sensor per bin under one device."""
+    coordinator = MagicMock()
+    coordinator.data = {
+        "General Waste": date(2025, 2, 8),
+        "Recycling": date(2025, 2, 11),
+    }
+    coordinator.name = "Test Coordinator"
+    coordinator.projected = set()
+
+    entities = create_sensor_entities(coordinator, "test_entry", "", compact=True)
+
+    assert len(entities) == 2
+    assert all(isinstance(e, UKBinCollectionCompactSensor) for e in entities)
+    recycling = entities[1]
+    assert recycling.unique_id == "test_entry_Recycling"
+    assert recycling.state == "In 3 days"
+    assert recycling.extra_state_attributes == {
+        STATE_ATTR_COLOUR: "black",
+        STATE_ATTR_NEXT_COLLECTION: "11/02/2025",
+        STATE_ATTR_DAYS: 3,
+        "bin_type": "Recycling",
+        "next_collection_date": date(2025, 2, 11),
+    }
+    assert {e.device_info["identifiers"].pop() for e in entities} == {
+        (DOMAIN, "test_entry")
+    }
 
 
 def test_create_sensor_entities_invalid_icon_json():
@@ -1504,13 +1590,14 @@ def test_raw_json_sensor_with_no_data():
     coordinator = MagicMock()
     coordinator.data = {}
     coordinator.last_update_success = True
+    coordinator.last_fetch = None
     
     # Create sensor
     sensor = UKBinCollectionRawJSONSensor(coordinator, "raw_test", "Test Name")
     
     # Check state and attributes
-    assert sensor.state == "{}"
-    assert sensor.extra_state_attributes == {"raw_data": {}}
+    assert sensor.state == data_hash({})
+    assert sensor.extra_state_attributes == {"raw_data": {}, "last_fetch": None}
     assert sensor.available is True
 
 
@@ -1560,3 +1647,157 @@ def test_attribute_sensor_calculate_human_readable_and_days_until():
     # From 2025-02-08 to 2025-02-11 is 3 days away.
     assert human_readable == "In 3 days"
     assert days_until == 3
+
+
+@freeze_time("2024-01-01 06:10:00")
+def test_diagnostic_sensors_report_coordinator_statistics():
+    """Diagnostic sensors read the coordinator's counters."""
+    from custom_components.uk_bin_collection.metrics import FetchStats
+    from homeassistant.const import EntityCategory
+
+    coordinator = MagicMock()
+    coordinator.name = "Test Name"
+    coordinator.stats = FetchStats()
+    for duration in (1.0, 2.0, 3.0, 10.0):
+        coordinator.stats.record_fetch(duration, 0.25)
+    coordinator.stats.record_failure()
+    coordinator.stats.record_cache_hit()
+    coordinator.stats.record_success(datetime(2024, 1, 1, 6, 0, tzinfo=dt_util.UTC))
+    coordinator.stats.record_failure()
+
+    sensors = {
+        name: UKBinCollectionDiagnosticSensor(coordinator, "entry", name)
+        for name in DIAGNOSTIC_SENSORS
+    }
+    values = {name: sensor.native_value for name, sensor in sensors.items()}
+
+    assert values == {
+        "Last Fetch Duration": 10.0,
+        "Fetch Latency P50": 2.0,
+        "Fetch Latency P95": 10.0,
+        "Queue Wait": 0.25,
+        "Consecutive Failures": 1,
+        "Last Success": datetime(2024, 1, 1, 6, 0, tzinfo=dt_util.UTC),
+        "Data Age": 600,
+        "Cache Hits": 1,
+    }
+    sensor = sensors["Fetch Latency P95"]
+    assert sensor.unique_id == "entry_diagnostic_fetch_latency_p95"
+    assert sensor.name == "Test Name Fetch Latency P95"
+    assert sensor.entity_category == EntityCategory.DIAGNOSTIC
+    assert sensor.available is True
+
+
+@pytest.mark.asyncio
+async def test_data_age_sensor_ticks_between_refreshes(hass):
+    """Only the data age is rewritten on a timer, so it keeps moving while refreshes fail."""
+    from custom_components.uk_bin_collection.const import DATA_AGE_UPDATE_INTERVAL
+    from custom_components.uk_bin_collection.metrics import FetchStats
+
+    coordinator = MagicMock()
+    coordinator.stats = FetchStats()
+    age = UKBinCollectionDiagnosticSensor(coordinator, "entry", "Data Age")
+    duration = UKBinCollectionDiagnosticSensor(coordinator, "entry", "Last Fetch Duration")
+    for sensor in (age, duration):
+        sensor.hass = hass
+
+    with patch(
+        "custom_components.uk_bin_collection.sensor.async_track_time_interval"
+    ) as track:
+        await age.async_added_to_hass()
+        await duration.async_added_to_hass()
+
+    track.assert_called_once()
+    assert track.call_args.args[2] == DATA_AGE_UPDATE_INTERVAL
+    age.async_write_ha_state = MagicMock()
+    track.call_args.args[1](dt_util.utcnow())
+    age.async_write_ha_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_adds_diagnostic_sensors(hass):
+    """Diagnostic sensors are only created when the option is enabled."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Test Name", "council": "Test Council"},
+        options={"diagnostic_sensors": True},
+        entry_id="test",
+    )
+    coordinator = MagicMock()
+    coordinator.data = {"Recycling": date(2024, 1, 3)}
+    coordinator.name = "Test Name"
+    hass.data = {DOMAIN: {"test": {"coordinator": coordinator}}}
+    async_add_entities = MagicMock()
+
+    await async_setup_entry_sensor(hass, config_entry, async_add_entities)
+
+    entities = async_add_entities.call_args[0][0]
+    diagnostics = [e for e in entities if isinstance(e, UKBinCollectionDiagnosticSensor)]
+    assert len(diagnostics) == len(DIAGNOSTIC_SENSORS)
+
+
+def test_next_collections_index_merges_sources():
+    """The next collections come from every source in date order from today."""
+    index = NextCollectionsIndex()
+    index.update_source("a", [(date(2024, 5, 9), "Refuse", False), (date(2024, 5, 2), "Refuse", False)])
+    index.update_source("b", [(date(2024, 5, 3), "Glass", True), (date(2024, 4, 30), "Glass", False)])
+
+    assert index.upcoming(date(2024, 5, 1), 2) == [
+        (date(2024, 5, 2), "a", "Refuse", False),
+        (date(2024, 5, 3), "b", "Glass", True),
+    ]
+    assert index.remove_source("a")
+    assert index.upcoming(date(2024, 5, 1), 5) == [(date(2024, 5, 3), "b", "Glass", True)]
+
+
+@pytest.mark.asyncio
+async def test_next_collections_sensor_follows_entries(hass, freezer):
+    """The aggregate sensor updates only when a schedule or the entries change."""
+    freezer.move_to("2024-05-01")
+    hass.data = {}
+
+    def coordinator(name, schedule):
+        mock = MagicMock()
+        mock.name = name
+        mock.schedule = schedule
+        mock.projected_dates = {}
+        mock.data = {bin_type: dates[0] for bin_type, dates in schedule.items()}
+        mock.schedule_generation = 1
+        return mock
+
+    home = coordinator("Home", {"Refuse": [date(2024, 5, 2), date(2024, 5, 16)]})
+    async_get_hub(hass).async_register("home", home, "host", None)
+    sensor = UKBinCollectionNextCollectionsSensor(hass, count=2)
+    sensor.async_write_ha_state = MagicMock()
+    with patch("custom_components.uk_bin_collection.sensor.async_dispatcher_connect"), patch(
+        "custom_components.uk_bin_collection.sensor.async_track_day_change"
+    ):
+        await sensor.async_added_to_hass()
+
+    assert sensor.native_value == date(2024, 5, 2)
+    assert [c["date"] for c in sensor.extra_state_attributes["collections"]] == [
+        "2024-05-02",
+        "2024-05-16",
+    ]
+
+    # A refresh that changes nothing neither re-indexes nor writes
+    listener = home.async_add_listener.call_args.args[0]
+    listener()
+    sensor.async_write_ha_state.assert_not_called()
+
+    office = coordinator("Office", {"Glass": [date(2024, 5, 3)]})
+    async_get_hub(hass).async_register("office", office, "host", None)
+    sensor._async_source_registered("office")
+    assert sensor.extra_state_attributes["collections"][1] == {
+        "date": "2024-05-03",
+        "entry_id": "office",
+        "name": "Office",
+        "bin_type": "Glass",
+        "projected": False,
+    }
+
+    sensor._async_source_unregistered("home")
+    freezer.move_to("2024-05-04")
+    sensor._recompute()
+    assert sensor.native_value is None
+    assert sensor.async_write_ha_state.call_count == 3
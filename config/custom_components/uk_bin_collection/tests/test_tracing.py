@@ -0,0 +1,69 @@
+"""Tests for UK Bin Collection refresh tracing."""
+
+import threading
+
+import pytest
+
+from custom_components.uk_bin_collection.tracing import TraceBuffer, chrome_trace
+
+
+def test_buffer_keeps_the_most_recent_traces():
+    """The buffer drops the oldest trace once full."""
+    buffer = TraceBuffer(maxlen=2)
+    first = buffer.start()
+    second = buffer.start()
+    third = buffer.start()
+    assert buffer.traces == [second, third]
+    assert first not in buffer.traces
+
+
+def test_span_records_duration_args_and_errors():
+    """Spans time their block, collect args and note exceptions."""
+    trace = TraceBuffer().start()
+    with trace.span("json parse", size=10) as args:
+        args["bins"] = 2
+    with pytest.raises(ValueError):
+        with trace.span("scrape"):
+            raise ValueError
+
+    parse, scrape = trace.spans
+    assert parse.name == "json parse"
+    assert parse.args == {"size": 10, "bins": 2}
+    assert parse.end >= parse.start >= trace.origin
+    assert scrape.args == {"error": "ValueError"}
+    assert trace.duration >= scrape.end - trace.origin - 1e-9
+
+
+def test_chrome_trace_export():
+    """Entries become processes and spans complete events in microseconds."""
+    buffer = TraceBuffer()
+    trace = buffer.start()
+    trace.add("queue", trace.origin, trace.origin + 0.25)
+    worker = threading.Thread(
+        target=lambda: trace.add("scrape", trace.origin + 0.25, trace.origin + 1.25)
+    )
+    worker.start()
+    worker.join()
+
+    exported = chrome_trace(
+        [("entry", "Home", buffer)], event_loop_thread=threading.get_ident()
+    )
+    events = exported["traceEvents"]
+    assert events[0] == {
+        "name": "process_name",
+        "ph": "M",
+        "pid": 1,
+        "args": {"name": "Home (entry)"},
+    }
+    queue, scrape = [event for event in events if event["ph"] == "X"]
+    assert queue["dur"] == 250000.0
+    assert scrape["dur"] == 1000000.0
+    assert scrape["ts"] - queue["ts"] == pytest.approx(250000.0, abs=1)
+    assert queue["ts"] == pytest.approx(trace.started_at.timestamp() * 1_000_000, abs=1)
+    assert queue["tid"] != scrape["tid"]
+    names = {
+        event["tid"]: event["args"]["name"]
+        for event in events
+        if event["name"] == "thread_name"
+    }
+    assert names == {queue["tid"]: "event loop", scrape["tid"]: "worker"}
@@ -1,17 +1,29 @@
 """Test UK Bin Collection utility functions."""
 
 import json
+from datetime import date
+
 import pytest
 import voluptuous as vol
+from homeassistant.exceptions import HomeAssistantError
 from unittest.mock import patch, MagicMock, AsyncMock
 
+from custom_components.uk_bin_collection.const import DAY_TICK, DOMAIN, SEED
+from custom_components.uk_bin_collection.hub import async_get_hub
 from custom_components.uk_bin_collection.utils import (
+    async_get_council_list,
+    async_validate_address,
+    async_track_day_change,
     build_user_schema,
     build_council_schema,
     build_selenium_schema,
     build_advanced_schema,
+    diff_schedules,
+    get_entry_config,
     is_valid_json,
+    pop_seed,
     prepare_config_data,
+    store_seed,
     validate_selenium_config
 )
 
@@ -126,6 +138,22 @@ def test_build_advanced_schema():
     assert "update_interval" in schema.schema
     assert "automatically_refresh" in schema.schema
     assert "icon_color_mapping" in schema.schema
+    assert "household_calendar" in schema.schema
+    assert "household_entries" not in schema.schema
+
+    # Other entries can be merged into the household calendar
+    schema = build_advanced_schema(
+        {"household_entries": ["other", "removed"]}, entry_choices={"other": "Office"}
+    )
+    assert schema({})["household_entries"] == ["other"]
+
+
+def test_get_entry_config():
+    """Options override the data the entry was created with."""
+    entry = MagicMock()
+    entry.data = {"name": "Home", "timeout": 60}
+    entry.options = {"timeout": 120}
+    assert get_entry_config(entry) == {"name": "Home", "timeout": 120}
 
 
 def test_is_valid_json():
@@ -223,4 +251,107 @@ async def test_validate_selenium_config():
         can_proceed, error_code = await validate_selenium_config(user_input, data_dict)
         assert can_proceed is False
         assert error_code == "chromium_unavailable"
-        assert data_dict["chromium_installed"] is False
\ No newline at end of file
+        assert data_dict["chromium_installed"] is False
+
+@pytest.mark.asyncio
+async def test_council_list_is_cached(hass):
+    """The council list is fetched once, and again after a failure."""
+    hass.data = {}
+    fetch = AsyncMock(side_effect=[{}, {"CouncilTest": {}}])
+    with patch("custom_components.uk_bin_collection.utils.get_councils_json", fetch):
+        assert await async_get_council_list(hass) == {}
+        assert await async_get_council_list(hass) == {"CouncilTest": {}}
+        assert await async_get_council_list(hass) == {"CouncilTest": {}}
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_validate_address_runs_through_the_hub(hass):
+    """An address check takes a hub slot and counts towards the host's backoff."""
+    hass.data = {}
+
+    async def run_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = run_job
+    ukbcd = MagicMock()
+    ukbcd.run.side_effect = [Exception("Council site down"), "{}"]
+    hub = async_get_hub(hass)
+    with patch("custom_components.uk_bin_collection.utils.UKBinCollectionApp", return_value=ukbcd):
+        with pytest.raises(Exception, match="Council site down"):
+            await async_validate_address(hass, ["Council", "url"], 60, "council.example")
+        assert hub.host_backoff_until("council.example") is not None
+
+        # A host that is backing off is not scraped again
+        with pytest.raises(HomeAssistantError):
+            await async_validate_address(hass, ["Council", "url"], 60, "council.example")
+        assert ukbcd.run.call_count == 1
+
+        assert await async_validate_address(hass, ["Council", "url"], 60, "other.example") == "{}"
+
+
+def test_seed_is_used_once_and_expires(freezer):
+    """Flow data is handed over once and only while it is recent."""
+    hass = MagicMock()
+    hass.data = {}
+    freezer.move_to("2024-04-01 06:00:00")
+    store_seed(hass, ["Council", "url", "--uprn=1"], "{}")
+    assert pop_seed(hass, ["Council", "url", "--uprn=2"]) is None
+    assert pop_seed(hass, ["Council", "url", "--uprn=1"])[0] == "{}"
+    assert pop_seed(hass, ["Council", "url", "--uprn=1"]) is None
+
+    store_seed(hass, ["Council", "url"], "{}")
+    freezer.move_to("2024-04-01 07:00:00")
+    assert pop_seed(hass, ["Council", "url"]) is None
+
+    # Seeds nobody picked up are dropped when the next one is stored
+    store_seed(hass, ["Council", "url", "--uprn=3"], "{}")
+    freezer.move_to("2024-04-01 08:00:00")
+    store_seed(hass, ["Council", "url", "--uprn=4"], "{}")
+    assert list(hass.data[DOMAIN][SEED]) == [("Council", "url", "--uprn=4")]
+
+
+def test_diff_schedules():
+    """Moves, additions and removals are reported; the rolling window is not."""
+    today = date(2024, 5, 1)
+    old = {
+        "Refuse": [date(2024, 4, 29), date(2024, 5, 6), date(2024, 5, 20)],
+        "Recycling": [date(2024, 5, 13), date(2024, 5, 27)],
+        "Garden": [date(2024, 5, 8)],
+    }
+    new = {
+        # Bank holiday move; the window slides past 20 May
+        "Refuse": [date(2024, 5, 7), date(2024, 5, 20), date(2024, 6, 3)],
+        # An extra collection and a cancelled one far apart
+        "Recycling": [date(2024, 5, 2), date(2024, 5, 27)],
+        "Food": [date(2024, 5, 3)],
+    }
+
+    assert diff_schedules(old, new, today) == {
+        "Food": {"added": ["2024-05-03"], "removed": [], "moved": []},
+        "Garden": {"added": [], "removed": ["2024-05-08"], "moved": []},
+        "Recycling": {"added": ["2024-05-02"], "removed": ["2024-05-13"], "moved": []},
+        "Refuse": {
+            "added": [],
+            "removed": [],
+            "moved": [{"from": "2024-05-06", "to": "2024-05-07"}],
+        },
+    }
+    assert diff_schedules(old, old, today) == {}
+
+
+@patch("custom_components.uk_bin_collection.utils.async_dispatcher_connect")
+@patch("custom_components.uk_bin_collection.utils.async_track_time_change")
+def test_day_change_tick_is_shared(track_time_change, dispatcher_connect, hass):
+    """One time listener serves every subscriber and goes with the last one."""
+    hass.data = {}
+    first = async_track_day_change(hass, MagicMock())
+    second = async_track_day_change(hass, MagicMock())
+    assert track_time_change.call_count == 1
+    assert track_time_change.call_args.kwargs == {"hour": 0, "minute": 0, "second": 0}
+
+    first()
+    track_time_change.return_value.assert_not_called()
+    second()
+    track_time_change.return_value.assert_called_once()
+    assert DAY_TICK not in hass.data[DOMAIN]
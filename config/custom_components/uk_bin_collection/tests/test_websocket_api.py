@@ -0,0 +1,94 @@
+"""Tests for the websocket API."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from custom_components.uk_bin_collection.const import (
+    SIGNAL_COORDINATOR_REGISTERED,
+    SIGNAL_COORDINATOR_UNREGISTERED,
+)
+from custom_components.uk_bin_collection.hub import async_get_hub
+from custom_components.uk_bin_collection.websocket_api import (
+    websocket_schedules,
+    websocket_subscribe_schedules,
+)
+
+
+def make_coordinator(name):
+    """Return a stand-in coordinator with one bin."""
+    coordinator = MagicMock()
+    coordinator.data = {"Refuse": date(2024, 5, 2)}
+    coordinator.schedule_generation = 1
+    coordinator.schedule_payload = lambda: {
+        "name": name,
+        "generation": coordinator.schedule_generation,
+    }
+    return coordinator
+
+
+def register(hass, entry_id, coordinator):
+    """Register ``coordinator`` with the hub without scheduling refreshes."""
+    async_get_hub(hass).async_register(entry_id, coordinator, "host", None)
+
+
+def test_schedules_command(hass):
+    """One message carries every entry's schedule, or just the requested ones."""
+    hass.data = {}
+    register(hass, "a", make_coordinator("A"))
+    register(hass, "b", make_coordinator("B"))
+    connection = MagicMock()
+
+    websocket_schedules(hass, connection, {"id": 1, "type": "uk_bin_collection/schedules"})
+    assert connection.send_result.call_args.args == (
+        1,
+        {"entries": {"a": {"name": "A", "generation": 1}, "b": {"name": "B", "generation": 1}}},
+    )
+
+    websocket_schedules(hass, connection, {"id": 2, "entry_id": ["b", "missing"]})
+    assert connection.send_result.call_args.args[1] == {
+        "entries": {"b": {"name": "B", "generation": 1}}
+    }
+
+
+def test_subscribe_schedules_sends_deltas(hass):
+    """After the snapshot only changed, added and removed entries are sent."""
+    hass.data = {}
+    dispatched = {}
+    coordinator = make_coordinator("A")
+    register(hass, "a", coordinator)
+    connection = MagicMock()
+    connection.subscriptions = {}
+
+    def connect(hass_, signal, target):
+        dispatched[signal] = target
+        return MagicMock()
+
+    with patch(
+        "custom_components.uk_bin_collection.websocket_api.async_dispatcher_connect",
+        side_effect=connect,
+    ):
+        websocket_subscribe_schedules(hass, connection, {"id": 5})
+
+    def events():
+        return [c.args[0]["event"] for c in connection.send_message.call_args_list]
+
+    assert events() == [{"entries": {"a": {"name": "A", "generation": 1}}}]
+    listener = coordinator.async_add_listener.call_args.args[0]
+
+    # A refresh that leaves the schedule alone sends nothing
+    listener()
+    assert len(events()) == 1
+
+    coordinator.schedule_generation = 2
+    listener()
+    assert events()[-1] == {"changed": {"a": {"name": "A", "generation": 2}}}
+
+    register(hass, "b", make_coordinator("B"))
+    dispatched[SIGNAL_COORDINATOR_REGISTERED]("b")
+    assert events()[-1] == {"changed": {"b": {"name": "B", "generation": 1}}}
+
+    dispatched[SIGNAL_COORDINATOR_UNREGISTERED]("a")
+    assert events()[-1] == {"removed": ["a"]}
+
+    connection.subscriptions[5]()
+    coordinator.async_add_listener.return_value.assert_called_once()
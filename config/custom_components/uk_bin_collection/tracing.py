@@ -0,0 +1,150 @@
+"""Per-refresh trace spans for UK Bin Collection Data.
+
+Every refresh of a ``HouseholdBinCoordinator`` opens a ``RefreshTrace`` and
+times its phases (queueing, parser import, the scrape itself, JSON parsing,
+processing and entity writes) as spans. The last ``TRACE_BUFFER_SIZE``
+traces of each entry are kept in a ``TraceBuffer`` and can be exported in
+Chrome trace format, which chrome://tracing and Perfetto load directly.
+
+Recording a span costs two ``perf_counter`` calls and a list append; spans
+may be recorded from the executor thread running the scrape.
+"""
+
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from homeassistant.util import dt as dt_util
+
+from .const import TRACE_BUFFER_SIZE
+
+
+class Span(NamedTuple):
+    """One timed phase of a refresh."""
+
+    name: str
+    start: float
+    end: float
+    thread: int
+    args: dict
+
+
+class _SpanTimer:
+    """Context manager recording a span when it exits."""
+
+    __slots__ = ("_trace", "_name", "_start", "args")
+
+    def __init__(self, trace: "RefreshTrace", name: str, args: dict) -> None:
+        self._trace = trace
+        self._name = name
+        self.args = args
+
+    def __enter__(self) -> dict:
+        self._start = time.perf_counter()
+        return self.args
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._trace.add(self._name, self._start, time.perf_counter(), **self.args)
+
+
+class RefreshTrace:
+    """The spans recorded during one refresh."""
+
+    __slots__ = ("started_at", "origin", "spans")
+
+    def __init__(self) -> None:
+        """Start a trace anchored to the current wall clock time."""
+        self.started_at: datetime = dt_util.utcnow()
+        self.origin = time.perf_counter()
+        self.spans: List[Span] = []
+
+    def span(self, name: str, **args) -> _SpanTimer:
+        """Time the enclosed block as span ``name``; yields its args dict."""
+        return _SpanTimer(self, name, args)
+
+    def add(self, name: str, start: float, end: float, **args) -> None:
+        """Record a span between two ``perf_counter`` readings."""
+        self.spans.append(Span(name, start, end, threading.get_ident(), args))
+
+    @property
+    def duration(self) -> float:
+        """Return the seconds between the start of the trace and its last span."""
+        return max((span.end for span in self.spans), default=self.origin) - self.origin
+
+
+class TraceBuffer:
+    """Ring buffer of an entry's most recent refresh traces."""
+
+    def __init__(self, maxlen: int = TRACE_BUFFER_SIZE) -> None:
+        """Initialise an empty buffer keeping ``maxlen`` traces."""
+        self._traces: Deque[RefreshTrace] = deque(maxlen=maxlen)
+
+    def start(self) -> RefreshTrace:
+        """Open a new trace, dropping the oldest when the buffer is full."""
+        trace = RefreshTrace()
+        self._traces.append(trace)
+        return trace
+
+    @property
+    def traces(self) -> List[RefreshTrace]:
+        """Return the buffered traces, oldest first."""
+        return list(self._traces)
+
+    def __len__(self) -> int:
+        return len(self._traces)
+
+
+def chrome_trace(
+    sources: Iterable[Tuple[str, str, TraceBuffer]],
+    event_loop_thread: Optional[int] = None,
+) -> dict:
+    """Export ``(entry_id, name, buffer)`` sources as a Chrome trace.
+
+    Each entry becomes a process and each thread that recorded spans a
+    thread within it, so the event loop and executor work line up.
+    """
+    events: List[dict] = []
+    for pid, (entry_id, name, buffer) in enumerate(sources, start=1):
+        events.append(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": f"{name} ({entry_id})"},
+            }
+        )
+        threads: Dict[int, str] = {}
+        for index, trace in enumerate(buffer.traces):
+            epoch = trace.started_at.timestamp() - trace.origin
+            for span in list(trace.spans):
+                if span.thread not in threads:
+                    threads[span.thread] = (
+                        "event loop" if span.thread == event_loop_thread else "worker"
+                    )
+                events.append(
+                    {
+                        "name": span.name,
+                        "cat": "refresh",
+                        "ph": "X",
+                        "ts": round((epoch + span.start) * 1_000_000, 1),
+                        "dur": round((span.end - span.start) * 1_000_000, 1),
+                        "pid": pid,
+                        "tid": span.thread,
+                        "args": {"refresh": index, **span.args},
+                    }
+                )
+        for tid, label in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": label},
+                }
+            )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
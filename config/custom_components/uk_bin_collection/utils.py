@@ -1,3 +1,4 @@
+import hashlib
 import json
 import aiohttp
 import logging
@@ -6,9 +7,30 @@ import voluptuous as vol
 import shutil
 import re
 
-from typing import Dict, Any, Optional
-from .const import BROWSER_BINARIES
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Tuple
+from .const import (
+    BROWSER_BINARIES,
+    COUNCIL_LIST_MAX_AGE,
+    COUNCILS,
+    DAY_TICK,
+    DOMAIN,
+    SCHEDULE_MOVE_WINDOW,
+    SEED,
+    SEED_MAX_AGE,
+    SIGNAL_DAY_CHANGED,
+)
+from .hub import async_get_hub
 from homeassistant import config_entries
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util, slugify
+from uk_bin_collection.uk_bin_collection.collect_data import UKBinCollectionApp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -92,6 +114,23 @@ async def get_councils_json(url: str = None) -> Dict[str, Any]:
         _LOGGER.error("Unexpected error fetching council data: %s", e)
         return {}
 
+
+async def async_get_council_list(hass: HomeAssistant) -> Dict[str, Any]:
+    """Return the council list, fetching it at most once per COUNCIL_LIST_MAX_AGE.
+
+    A failed fetch is not cached, so the next caller tries again.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cached = domain_data.get(COUNCILS)
+    now = dt_util.utcnow()
+    if cached is not None and now - cached[0] < COUNCIL_LIST_MAX_AGE:
+        return cached[1]
+    councils = await get_councils_json()
+    if councils:
+        domain_data[COUNCILS] = (now, councils)
+    return councils
+
+
 async def check_selenium_server(url: str) -> bool:
     """Check if a Selenium server is accessible."""
     async with aiohttp.ClientSession() as session:
@@ -176,14 +215,25 @@ def build_selenium_schema(default_url=""):
         vol.Optional("local_browser", default=False): bool,
     })
 
-def build_advanced_schema(defaults=None) -> vol.Schema:
-    """Schema for advanced settings configuration."""
+def build_advanced_schema(defaults=None, entry_choices=None) -> vol.Schema:
+    """Schema for advanced settings configuration.
+
+    entry_choices maps the entry ids of other configured addresses to their
+    titles; when given, they can be merged into the household calendar.
+    """
+    import homeassistant.helpers.config_validation as cv
+
     if defaults is None:
         defaults = {
             "automatically_refresh": True,
             "update_interval": 12,
             "timeout": 60,
-            "icon_color_mapping": ""
+            "icon_color_mapping": "",
+            "household_calendar": False,
+            "compact_entities": False,
+            "diagnostic_sensors": False,
+            "reminders": "",
+            "refresh_on_read": 0,
         }
         
     # Get default values with fallbacks
@@ -191,10 +241,15 @@ def build_advanced_schema(defaults=None) -> vol.Schema:
     default_update_interval = defaults.get("update_interval", 12)  # Default 12 hours
     default_automatically_refresh = defaults.get("automatically_refresh", True)
     default_icon_mapping = defaults.get("icon_color_mapping", "")
+    default_household_calendar = defaults.get("household_calendar", False)
+    default_compact_entities = defaults.get("compact_entities", False)
+    default_diagnostic_sensors = defaults.get("diagnostic_sensors", False)
+    default_reminders = defaults.get("reminders", "")
+    default_refresh_on_read = defaults.get("refresh_on_read", 0)  # Off
         
     # _LOGGER.debug("Building advanced schema with defaults: %s", defaults)
     
-    schema = vol.Schema({
+    schema_dict = {
         vol.Optional("timeout", default=default_timeout): vol.All(
             vol.Coerce(int),  # Convert to integer
             vol.Range(min=10, msg="Timeout must be at least 10 seconds"), 
@@ -205,9 +260,24 @@ def build_advanced_schema(defaults=None) -> vol.Schema:
         ),
         vol.Optional("automatically_refresh", default=default_automatically_refresh): bool,
         vol.Optional("icon_color_mapping", default=default_icon_mapping): str,
-    })
-    
-    return schema
+        vol.Optional("household_calendar", default=default_household_calendar): bool,
+        vol.Optional("compact_entities", default=default_compact_entities): bool,
+        vol.Optional("diagnostic_sensors", default=default_diagnostic_sensors): bool,
+        vol.Optional("reminders", default=default_reminders): str,
+        vol.Optional("refresh_on_read", default=default_refresh_on_read): vol.All(
+            vol.Coerce(int),  # Convert to integer
+            vol.Range(min=0, msg="Refresh on read age cannot be negative"),
+        ),
+    }
+
+    if entry_choices:
+        default_entries = [
+            entry_id for entry_id in defaults.get("household_entries", [])
+            if entry_id in entry_choices
+        ]
+        schema_dict[vol.Optional("household_entries", default=default_entries)] = cv.multi_select(entry_choices)
+
+    return vol.Schema(schema_dict)
 
 # -----------------------------------------------------
 # 🔄 Utility Functions
@@ -233,6 +303,124 @@ def is_valid_json_validator(value):
     except ValueError as e:
         raise vol.Invalid(f"Invalid JSON: {e}")
 
+def data_hash(data: Optional[Dict[str, Any]]) -> str:
+    """Return a short hash identifying a set of next collection dates."""
+    payload = json.dumps(
+        {bin_type: str(day) for bin_type, day in (data or {}).items()},
+        sort_keys=True,
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()[:12]
+
+def diff_schedules(old: dict, new: dict, today) -> Dict[str, Dict[str, list]]:
+    """Return the per-bin changes between two ``{bin_type: [dates]}`` schedules.
+
+    Dates before ``today`` are ignored, and so are dates beyond the end of
+    the shorter of a bin's two date ranges: councils publish a rolling window,
+    and sliding it is not a change. Each bin that changed maps to ``added``,
+    ``removed`` and ``moved`` lists; a removed date paired with an added one
+    within SCHEDULE_MOVE_WINDOW is reported as moved instead.
+    """
+    changes = {}
+    for bin_type in sorted(old.keys() | new.keys()):
+        old_dates = {day for day in old.get(bin_type, []) if day >= today}
+        new_dates = {day for day in new.get(bin_type, []) if day >= today}
+        if old_dates and new_dates:
+            horizon = min(max(old_dates), max(new_dates))
+            old_dates = {day for day in old_dates if day <= horizon}
+            new_dates = {day for day in new_dates if day <= horizon}
+        added = sorted(new_dates - old_dates)
+        removed = sorted(old_dates - new_dates)
+        if not added and not removed:
+            continue
+
+        moved = []
+        for day in list(removed):
+            candidates = [
+                other for other in added if abs(other - day) <= SCHEDULE_MOVE_WINDOW
+            ]
+            if candidates:
+                target = min(candidates, key=lambda other: abs(other - day))
+                moved.append({"from": day.isoformat(), "to": target.isoformat()})
+                added.remove(target)
+                removed.remove(day)
+        changes[bin_type] = {
+            "added": [day.isoformat() for day in added],
+            "removed": [day.isoformat() for day in removed],
+            "moved": moved,
+        }
+    return changes
+
+
+@callback
+def async_track_day_change(hass: HomeAssistant, action) -> CALLBACK_TYPE:
+    """Call ``action`` at local midnight through the integration's shared tick.
+
+    The time listener is created for the first subscriber and removed with
+    the last one.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    tick = domain_data.get(DAY_TICK)
+    if tick is None:
+        unsub_time = async_track_time_change(
+            hass,
+            lambda now: async_dispatcher_send(hass, SIGNAL_DAY_CHANGED),
+            hour=0,
+            minute=0,
+            second=0,
+        )
+        tick = domain_data[DAY_TICK] = [unsub_time, 0]
+    tick[1] += 1
+    unsub_signal = async_dispatcher_connect(hass, SIGNAL_DAY_CHANGED, action)
+
+    @callback
+    def unsubscribe() -> None:
+        unsub_signal()
+        tick[1] -= 1
+        if tick[1] == 0 and domain_data.get(DAY_TICK) is tick:
+            tick[0]()
+            del domain_data[DAY_TICK]
+
+    return unsubscribe
+
+
+def get_entry_config(config_entry: config_entries.ConfigEntry) -> Dict[str, Any]:
+    """Return the entry's data with any options-flow changes applied on top."""
+    return {**config_entry.data, **config_entry.options}
+
+
+def address_configs(entry_id: str, config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Return the config of each address of an entry, keyed by coordinator id.
+
+    A single-address entry is its own address. A multi-address entry has an
+    ``addresses`` list whose items override the entry's shared settings;
+    each address is keyed by the entry id and the slug of its name.
+    """
+    addresses = config.get("addresses")
+    if not addresses:
+        return {entry_id: config}
+    shared = {key: value for key, value in config.items() if key != "addresses"}
+    return {
+        f"{entry_id}_{slugify(address['name'])}": {**shared, **address}
+        for address in addresses
+    }
+
+
+def entry_device_info(coordinator, entry_id: str) -> Dict[str, Any]:
+    """Return the device shared by the entry-wide entities."""
+    return {
+        "identifiers": {(DOMAIN, entry_id)},
+        "name": coordinator.name,
+        "manufacturer": "UK Bin Collection",
+        "model": "Bin Collection Schedule",
+        "sw_version": "1.0",
+    }
+
+
+def entry_coordinators(hass: HomeAssistant, entry_id: str) -> Dict[str, Any]:
+    """Return the coordinator of each address of a loaded entry, keyed by id."""
+    entry_data = hass.data[DOMAIN][entry_id]
+    return entry_data.get("coordinators") or {entry_id: entry_data["coordinator"]}
+
 async def async_entry_exists(
     flow, user_input: Dict[str, Any]
 ) -> Optional[config_entries.ConfigEntry]:
@@ -283,7 +471,13 @@ def prepare_config_data(data: dict, is_options_flow=False) -> dict:
         "manual_refresh_only", 
         "update_interval", 
         "timeout", 
-        "icon_color_mapping"
+        "icon_color_mapping",
+        "household_calendar",
+        "household_entries",
+        "compact_entities",
+        "diagnostic_sensors",
+        "reminders",
+        "refresh_on_read",
     ]
     
     # Start with council to ensure it's always present
@@ -344,6 +538,59 @@ def prepare_config_data(data: dict, is_options_flow=False) -> dict:
         
     return filtered_data
 
+async def async_validate_address(
+    hass: HomeAssistant, args: list, timeout: int, host: str
+) -> str:
+    """Scrape once with ``args`` and return the raw JSON.
+
+    The scrape runs through the refresh hub like any refresh: it cannot
+    overlap another scrape of the ``host`` council website, and a failure
+    extends that website's backoff. A website that is backing off is not
+    scraped at all.
+    """
+
+    def run() -> str:
+        ukbcd = UKBinCollectionApp()
+        ukbcd.set_args(args)
+        return ukbcd.run()
+
+    hub = async_get_hub(hass)
+    until = hub.host_backoff_until(host)
+    if until is not None and until > dt_util.utcnow():
+        raise HomeAssistantError(f"{host} is not scraped until {until} after failures")
+    return await hub.async_run_job(host, run, timeout)
+
+
+def store_seed(
+    hass: HomeAssistant, args: list, raw: str, fetched_at: Optional[datetime] = None
+) -> None:
+    """Keep scraped data for the first refresh of the next setup using ``args``.
+
+    The config flow stores its validation scrape here, and unloading an
+    entry stores its last good scrape so that a reload can reuse it. Seeds
+    are handed over straight away, so any stored more than
+    ``SEED_MAX_AGE`` ago, e.g. by an abandoned flow, are dropped.
+    """
+    seeds = hass.data.setdefault(DOMAIN, {}).setdefault(SEED, {})
+    now = dt_util.now()
+    for key in [key for key, seed in seeds.items() if now - seed[2] > SEED_MAX_AGE]:
+        del seeds[key]
+    seeds[tuple(args)] = (raw, fetched_at or now, now)
+
+
+def pop_seed(
+    hass: HomeAssistant, args: list, max_age: timedelta = SEED_MAX_AGE
+) -> Optional[Tuple[str, datetime]]:
+    """Return and forget stored data scraped with ``args`` within ``max_age``."""
+    seeds = hass.data.get(DOMAIN, {}).get(SEED)
+    if not seeds:
+        return None
+    raw, fetched_at, _ = seeds.pop(tuple(args), (None, None, None))
+    if raw is None or dt_util.now() - fetched_at > max_age:
+        return None
+    return raw, fetched_at
+
+
 async def validate_selenium_config(user_input, data_dict):
     """Validate Selenium configuration and determine if we can proceed.
     
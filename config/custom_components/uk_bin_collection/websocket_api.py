@@ -0,0 +1,172 @@
+"""WebSocket API for UK Bin Collection Data.
+
+``uk_bin_collection/schedules`` returns the schedule of every loaded entry
+(or of the requested ones) in one message. ``uk_bin_collection/subscribe_schedules``
+sends the same snapshot and then, for as long as the subscription lives,
+only the entries whose schedule changed or that were removed, so frontends
+do not have to read and watch each entity in the state machine.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_COORDINATOR_REGISTERED, SIGNAL_COORDINATOR_UNREGISTERED
+from .hub import async_get_hub
+
+
+@callback
+def async_register_commands(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, websocket_schedules)
+    websocket_api.async_register_command(hass, websocket_subscribe_schedules)
+
+
+def _selected(hass: HomeAssistant, entry_ids: Optional[List[str]]) -> Dict[str, object]:
+    """Return the loaded coordinators of ``entry_ids``, or of every entry.
+
+    Each of them counts as read, so stale data is refreshed on demand.
+    """
+    hub = async_get_hub(hass)
+    coordinators = {}
+    for entry_id in hub.entry_ids if entry_ids is None else entry_ids:
+        coordinator = hub.coordinator(entry_id)
+        if coordinator is not None:
+            coordinator.async_note_read()
+            coordinators[entry_id] = coordinator
+    return coordinators
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/schedules",
+        vol.Optional("entry_id"): [str],
+    }
+)
+@callback
+def websocket_schedules(hass: HomeAssistant, connection, msg: dict) -> None:
+    """Return the schedules of every entry, or of the requested entries."""
+    connection.send_result(
+        msg["id"],
+        {
+            "entries": {
+                entry_id: coordinator.schedule_payload()
+                for entry_id, coordinator in _selected(hass, msg.get("entry_id")).items()
+            }
+        },
+    )
+
+
+class _ScheduleSubscription:
+    """Follow the coordinators of one subscription and send what changed."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[[dict], None],
+        entry_ids: Optional[List[str]],
+    ) -> None:
+        self.hass = hass
+        self._send = send
+        self._entry_ids = entry_ids
+        self._listeners: Dict[str, Callable[[], None]] = {}
+        # Coordinator, schedule generation and next dates last sent per entry
+        self._sent: Dict[str, Tuple[object, int, dict]] = {}
+
+    def _wanted(self, entry_id: str) -> bool:
+        return self._entry_ids is None or entry_id in self._entry_ids
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Send the initial snapshot; return the unsubscribe callback."""
+        payloads = {}
+        for entry_id in _selected(self.hass, self._entry_ids):
+            payloads[entry_id] = self._attach(entry_id)
+        self._send({"entries": payloads})
+
+        unsub_registered = async_dispatcher_connect(
+            self.hass, SIGNAL_COORDINATOR_REGISTERED, self._async_registered
+        )
+        unsub_unregistered = async_dispatcher_connect(
+            self.hass, SIGNAL_COORDINATOR_UNREGISTERED, self._async_unregistered
+        )
+
+        @callback
+        def unsubscribe() -> None:
+            unsub_registered()
+            unsub_unregistered()
+            for entry_id in list(self._listeners):
+                self._detach(entry_id)
+
+        return unsubscribe
+
+    def _attach(self, entry_id: str) -> dict:
+        """Follow one entry's coordinator; return its current payload."""
+        self._detach(entry_id)
+        coordinator = async_get_hub(self.hass).coordinator(entry_id)
+        self._listeners[entry_id] = coordinator.async_add_listener(
+            lambda: self._async_updated(entry_id)
+        )
+        return self._payload(entry_id, coordinator)
+
+    def _detach(self, entry_id: str) -> None:
+        unsubscribe = self._listeners.pop(entry_id, None)
+        if unsubscribe is not None:
+            unsubscribe()
+        self._sent.pop(entry_id, None)
+
+    def _payload(self, entry_id: str, coordinator) -> dict:
+        """Return an entry's payload and remember what it reflects."""
+        self._sent[entry_id] = (
+            coordinator,
+            coordinator.schedule_generation,
+            dict(coordinator.data or {}),
+        )
+        return coordinator.schedule_payload()
+
+    @callback
+    def _async_updated(self, entry_id: str) -> None:
+        """Send an entry again if its refresh changed the schedule."""
+        coordinator, generation, data = self._sent[entry_id]
+        if (
+            coordinator.schedule_generation == generation
+            and (coordinator.data or {}) == data
+        ):
+            return
+        self._send({"changed": {entry_id: self._payload(entry_id, coordinator)}})
+
+    @callback
+    def _async_registered(self, entry_id: str) -> None:
+        """Send an entry that was loaded or reloaded."""
+        if self._wanted(entry_id):
+            self._send({"changed": {entry_id: self._attach(entry_id)}})
+
+    @callback
+    def _async_unregistered(self, entry_id: str) -> None:
+        """Tell the subscriber an entry went away."""
+        if entry_id in self._listeners:
+            self._detach(entry_id)
+            self._send({"removed": [entry_id]})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_schedules",
+        vol.Optional("entry_id"): [str],
+    }
+)
+@callback
+def websocket_subscribe_schedules(hass: HomeAssistant, connection, msg: dict) -> None:
+    """Send every schedule, then the schedules that change."""
+    msg_id = msg["id"]
+
+    @callback
+    def send(event: dict) -> None:
+        connection.send_message(websocket_api.event_message(msg_id, event))
+
+    subscription = _ScheduleSubscription(hass, send, msg.get("entry_id"))
+    connection.send_result(msg_id)
+    connection.subscriptions[msg_id] = subscription.async_start()